@@ -10,6 +10,8 @@ class Collection:
     def __init__(self, items=None):
         self._items = items or []
         self.__appends__ = []
+        self._indexed_by = None
+        self._index = None
 
     def take(self, number: int):
         """Takes a specific number of results from the items.
@@ -251,6 +253,7 @@ class Collection:
         items = self.__get_items(items)
 
         self._items += items
+        self._index = None
         return self
 
     def pluck(self, value, key=None, keep_nulls=True):
@@ -263,33 +266,40 @@ class Collection:
             return Collection([self._items.get(value)])
 
         for item in self:
-            if isinstance(item, dict):
-                iterable = item.items()
-            elif hasattr(item, "serialize"):
-                iterable = item.serialize().items()
-            else:
-                iterable = self.all().items()
+            try:
+                v = self._get_serialized_value(item, value)
+            except KeyError:
+                continue
 
-            for k, v in iterable:
-                if keep_nulls is False and v is None:
-                    continue
+            if keep_nulls is False and v is None:
+                continue
 
-                if k == value:
-                    if key:
-                        attributes[self._data_get(item, key)] = self._data_get(
-                            item, value
-                        )
-                    else:
-                        attributes.append(v)
+            if key:
+                attributes[self._data_get(item, key)] = self._data_get(item, value)
+            else:
+                attributes.append(v)
 
         return Collection(attributes)
 
+    def _get_serialized_value(self, item, key):
+        # Models serialize the single attribute instead of their whole dictionary
+        if isinstance(item, dict):
+            return item[key]
+        elif hasattr(item, "get_serialized_attribute"):
+            return item.get_serialized_attribute(key)
+        elif hasattr(item, "serialize"):
+            return item.serialize()[key]
+
+        return self.all()[key]
+
     def pop(self):
         last = self._items.pop()
+        self._index = None
         return last
 
     def prepend(self, value):
         self._items.insert(0, value)
+        self._index = None
         return self
 
     def pull(self, key):
@@ -299,9 +309,11 @@ class Collection:
 
     def push(self, value):
         self._items.append(value)
+        self._index = None
 
     def put(self, key, value):
         self._items[key] = value
+        self._index = None
         return self
 
     def random(self, count=None):
@@ -330,17 +342,17 @@ class Collection:
         self._items = self[::-1]
 
     def serialize(self, *args, **kwargs):
-        def _serialize(item):
-            if self.__appends__:
-                item.set_appends(self.__appends__)
+        return [self._serialize_item(item, *args, **kwargs) for item in self]
 
-            if hasattr(item, "serialize"):
-                return item.serialize(*args, **kwargs)
-            elif hasattr(item, "to_dict"):
-                return item.to_dict()
-            return item
+    def _serialize_item(self, item, *args, **kwargs):
+        if self.__appends__:
+            item.set_appends(self.__appends__)
 
-        return list(map(_serialize, self))
+        if hasattr(item, "serialize"):
+            return item.serialize(*args, **kwargs)
+        elif hasattr(item, "to_dict"):
+            return item.to_dict()
+        return item
 
     def add_relation(self, result=None):
         for model in self._items:
@@ -354,6 +366,7 @@ class Collection:
     def sort(self, key=None):
         if key:
             self._items.sort(key=lambda x: x[key], reverse=False)
+            self._index = None
             return self
 
         self._items = sorted(self)
@@ -369,7 +382,29 @@ class Collection:
         return result
 
     def to_json(self, **kwargs):
-        return json.dumps(self.serialize(), **kwargs)
+        return "".join(self.stream_json(**kwargs))
+
+    def stream_json(self, **kwargs):
+        """Encodes the collection to a JSON array one item at a time, so a large collection
+        can be written to a response without building the list of all serialized items.
+
+        Keyword Arguments:
+            kwargs -- Any keyword argument accepted by json.dumps.
+
+        Returns:
+            generator -- The chunks of the JSON array.
+        """
+        if not isinstance(self._items, list) or kwargs.get("indent") is not None:
+            yield json.dumps(self.serialize(), **kwargs)
+            return
+
+        separator = (kwargs.get("separators") or (", ", ": "))[0]
+        yield "["
+        for index, item in enumerate(self._items):
+            if index:
+                yield separator
+            yield json.dumps(self._serialize_item(item), **kwargs)
+        yield "]"
 
     def group_by(self, key):
         from itertools import groupby
@@ -424,25 +459,36 @@ class Collection:
             if isinstance(item, dict):
                 comparison = item.get(key)
             else:
-                comparison = getattr(item, key) if hasattr(item, key) else False
+                comparison = getattr(item, key, False)
             if self._make_comparison(comparison, value, op):
                 attributes.append(item)
         return self.__class__(attributes)
 
     def where_in(self, key, args: list) -> "Collection":
         attributes = []
+        missing = object()
+
+        try:
+            lookup = set(args)
+        except TypeError:
+            # Unhashable values, like lists, are compared one by one
+            lookup = args
 
         for item in self._items:
             if isinstance(item, dict):
-                if key not in item:
-                    continue
-                comparison = item.get(key)
+                comparison = item.get(key, missing)
             else:
-                if not hasattr(item, key):
-                    continue
-                comparison = getattr(item, key)
+                comparison = getattr(item, key, missing)
 
-            if comparison in args:
+            if comparison is missing:
+                continue
+
+            try:
+                found = comparison in lookup
+            except TypeError:
+                found = comparison in args
+
+            if found:
                 attributes.append(item)
 
         # Compatibility patch - allow numeric strings to match integers
@@ -454,6 +500,84 @@ class Collection:
 
         return self.__class__(attributes)
 
+    def key_by(self, key):
+        """Indexes the items by one of their keys so find() does not scan the collection.
+        The first item wins when several items have the same key.
+
+        Models are indexed by their raw attribute, before accessors and casts.
+
+        Arguments:
+            key {string} -- The dictionary key or model attribute to index by.
+
+        Returns:
+            self
+        """
+        index = {}
+        for item in self._items:
+            value = self._get_index_value(item, key)
+            try:
+                index.setdefault(value, item)
+            except TypeError:
+                continue
+
+        self._indexed_by = key
+        self._index = (index, self._items, len(self._items))
+        return self
+
+    def find(self, value, key=None):
+        """Finds the first item whose key has the given value.
+
+        Uses the index built by key_by() when it was built for the same key. Otherwise
+        the items are scanned, comparing the primary key of models or the "id" key.
+
+        Arguments:
+            value {mixed} -- The value to look for.
+
+        Keyword Arguments:
+            key {string|None} -- The key to compare. (default: {the indexed key, or the primary key})
+
+        Returns:
+            mixed|None
+        """
+        index = self._get_index(key)
+        if index is not None:
+            try:
+                return index.get(value)
+            except TypeError:
+                return None
+
+        for item in self._items:
+            item_key = key or getattr(item, "__primary_key__", "id")
+            if self._get_index_value(item, item_key) == value:
+                return item
+
+        return None
+
+    def _get_index(self, key):
+        if self._indexed_by is None or key not in (None, self._indexed_by):
+            return None
+
+        # Methods changing the items in place drop the index, and replacing or resizing
+        # the items list directly makes it stale too, so it is rebuilt
+        if (
+            self._index is None
+            or self._index[1] is not self._items
+            or self._index[2] != len(self._items)
+        ):
+            self.key_by(self._indexed_by)
+
+        return self._index[0]
+
+    def _get_index_value(self, item, key):
+        if isinstance(item, dict):
+            return item.get(key)
+
+        attributes = getattr(item, "__attributes__", None)
+        if isinstance(attributes, dict):
+            return attributes.get(key)
+
+        return getattr(item, key, None)
+
     def zip(self, items):
         items = self.__get_items(items)
         if not isinstance(items, list):
@@ -480,8 +604,16 @@ class Collection:
         items = []
         for item in self:
             if isinstance(key, str):
-                if hasattr(item, key) or (key in item):
-                    items.append(getattr(item, key, item[key]))
+                if isinstance(item, dict):
+                    if key in item:
+                        items.append(item[key])
+                    continue
+
+                try:
+                    items.append(getattr(item, key))
+                except AttributeError:
+                    if key in item:
+                        items.append(item[key])
             elif callable(key):
                 result = key(item)
                 if result:
@@ -543,9 +675,11 @@ class Collection:
 
     def __setitem__(self, key, value):
         self._items[key] = value
+        self._index = None
 
     def __delitem__(self, key):
         del self._items[key]
+        self._index = None
 
     def __ne__(self, other):
         other = self.__get_items(other)
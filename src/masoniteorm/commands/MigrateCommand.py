@@ -15,6 +15,7 @@ class MigrateCommand(Command):
         {--s|show : Shows the output of SQL for migrations that would be running}
         {--schema=? : Sets the schema to be migrated}
         {--d|directory=databases/migrations : The location of the migration directory}
+        {--transaction=migration : Runs each migration or the whole batch in a transaction, or none}
     """
 
     def handle(self):
@@ -34,6 +35,7 @@ class MigrateCommand(Command):
             migration_directory=self.option("directory"),
             config_path=self.option("config"),
             schema=self.option("schema"),
+            transaction=self.option("transaction"),
         )
         migration.create_table_if_not_exists()
         if not migration.get_unran_migrations():
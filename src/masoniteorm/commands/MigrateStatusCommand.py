@@ -24,8 +24,9 @@ class MigrateStatusCommand(Command):
         table = self.table()
         table.set_header_row(["Ran?", "Migration", "Batch"])
         migrations = []
+        ran, unran = migration.get_migration_status()
 
-        for migration_data in migration.get_ran_migrations():
+        for migration_data in ran:
             migration_file = migration_data["migration_file"]
             batch = migration_data["batch"]
 
@@ -37,7 +38,7 @@ class MigrateStatusCommand(Command):
                 ]
             )
 
-        for migration_file in migration.get_unran_migrations():
+        for migration_file in unran:
             migrations.append(
                 [
                     "<error>N</error>",
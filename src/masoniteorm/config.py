@@ -1,3 +1,4 @@
+import importlib
 import os
 import pydoc
 import urllib.parse as urlparse
@@ -5,31 +6,71 @@ import urllib.parse as urlparse
 from .exceptions import ConfigurationNotFound
 from .exceptions import InvalidUrlConfiguration
 
+_CONFIG_CACHE = {}
+
 
 def load_config(config_path=None):
     """Load ORM configuration from given configuration path (dotted or not).
     If no path is provided:
         1. try to load from DB_CONFIG_PATH environment variable
         2. else try to load from default config_path: config/database
+
+    The located module is cached per path for the lifetime of the process.
+    Use reload_config() or invalidate_config() to locate it again.
     """
     selected_config_path = (
         os.getenv("DB_CONFIG_PATH", None) or config_path or "config/database"
     )
 
+    config_module = _CONFIG_CACHE.get(selected_config_path)
+    if config_module is not None:
+        return config_module
+
     os.environ["DB_CONFIG_PATH"] = selected_config_path
 
     # format path as python module if needed
-    selected_config_path = (
+    module_path = (
         selected_config_path.replace("/", ".").replace("\\", ".").rstrip(".py")
     )
-    config_module = pydoc.locate(selected_config_path)
+    config_module = pydoc.locate(module_path)
     if config_module is None:
         raise ConfigurationNotFound(
-            f"ORM configuration file has not been found in {selected_config_path}."
+            f"ORM configuration file has not been found in {module_path}."
         )
+
+    _CONFIG_CACHE[selected_config_path] = config_module
     return config_module
 
 
+def invalidate_config(config_path=None):
+    """Remove cached configuration modules so they are located again on the next load_config() call.
+
+    Arguments:
+        config_path {string} -- Only invalidate this path. (default: {None} invalidates every path)
+    """
+    if config_path is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(config_path, None)
+
+
+def reload_config(config_path=None):
+    """Re-import the ORM configuration module and replace the cached one.
+
+    Returns:
+        module -- The reloaded configuration module.
+    """
+    selected_config_path = (
+        os.getenv("DB_CONFIG_PATH", None) or config_path or "config/database"
+    )
+    config_module = _CONFIG_CACHE.pop(selected_config_path, None)
+    if config_module is None:
+        return load_config(config_path)
+
+    _CONFIG_CACHE[selected_config_path] = importlib.reload(config_module)
+    return _CONFIG_CACHE[selected_config_path]
+
+
 def db_url(database_url=None, prefix="", options={}, log_queries=False):
     """Parse connection configuration from database url format. If no url is provided,
     DATABASE_URL environment variable will be used instead.
@@ -0,0 +1,292 @@
+from timeit import default_timer as timer
+
+from ..exceptions import QueryException
+from .AsyncConnectionPool import AsyncConnectionPool
+from .BaseConnection import BaseConnection
+
+
+class AsyncBaseConnection(BaseConnection):
+    """Base class for connections that talk to the database through an asyncio driver.
+
+    Async connections mirror the synchronous connection classes but every method that
+    reaches the database is a coroutine. They reuse the grammars, platforms and post
+    processors of their synchronous counterparts.
+    """
+
+    def __init__(
+        self,
+        host=None,
+        database=None,
+        user=None,
+        port=None,
+        password=None,
+        prefix=None,
+        full_details=None,
+        options=None,
+        name=None,
+    ):
+        self.host = host
+        if port:
+            self.port = int(port)
+        else:
+            self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.prefix = prefix
+        self.full_details = full_details or {}
+        self.options = options or {}
+        self._cursor = None
+        self.transaction_level = 0
+        self.open = 0
+        self.schema = None
+        if name:
+            self.name = name
+
+    def has_global_connection(self):
+        # Global connections are opened by the synchronous transaction helpers
+        return False
+
+    def get_database_name(self):
+        return self.database
+
+    def get_cursor(self):
+        return self._cursor
+
+    def get_transaction_level(self):
+        return self.transaction_level
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        await self.acquire_connection()
+        self.open = 1
+        return self
+
+    async def statement(self, query, bindings=()):
+        """Wrapper around executing the query on the driver. Helpful for logging output.
+
+        Args:
+            query (string): The query to execute
+            bindings (tuple, optional): Tuple of query bindings. Defaults to ().
+        """
+        event = self.make_query_event(query, bindings)
+        # Started after the before listeners so only the query itself is timed
+        start = timer()
+        await self.execute(query, bindings)
+        elapsed = timer() - start
+        end = "{:.2f}".format(elapsed)
+
+        if self.full_details and self.full_details.get("log_queries", False):
+            self.log(query, bindings, query_time=end)
+
+        if event is not None:
+            self.dispatch_query_event(event, elapsed)
+
+    async def execute(self, query, bindings=()):
+        """Executes a query on the current cursor."""
+        await self._cursor.execute(query, bindings)
+
+    def get_pool(self):
+        """Gets the async connection pool for this connection configuration.
+
+        Returns:
+            AsyncConnectionPool|None -- None when pooling is not enabled in the "pool" configuration key.
+        """
+        pool_config = self.full_details.get("pool")
+        if not pool_config:
+            return None
+
+        if not isinstance(pool_config, dict):
+            pool_config = {}
+
+        return AsyncConnectionPool.get_pool(
+            self.get_pool_key(),
+            lambda: AsyncConnectionPool.from_config(
+                self.create_connection,
+                closer=self.close_raw_connection,
+                pinger=self.ping,
+                config=pool_config,
+            ),
+        )
+
+    async def create_connection(self):
+        """Creates a new raw async driver connection."""
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' does not implement create_connection"
+        )
+
+    async def ping(self, connection):
+        """Checks that a raw async driver connection is still usable."""
+        return True
+
+    async def close_raw_connection(self, connection):
+        """Closes a raw async driver connection."""
+        connection.close()
+
+    async def acquire_connection(self):
+        """Sets a raw async driver connection on the connection class, either borrowed
+        from the pool or newly created."""
+        pool = self.get_pool()
+        if pool:
+            self._connection = await pool.acquire()
+        else:
+            self._connection = await self.create_connection()
+
+        return self._connection
+
+    async def close_connection(self, discard=False):
+        """Closes the raw async driver connection or hands it back to the pool when pooling is enabled.
+
+        Keyword Arguments:
+            discard {bool} -- Close a pooled connection instead of handing it back, for example
+                after a driver error left it in an unknown state. (default: {False})
+        """
+        self.open = 0
+        if self._connection is None:
+            return
+
+        connection = self._connection
+        self._connection = None
+
+        pool = self.get_pool()
+        if pool and discard:
+            await pool.discard(connection)
+        elif pool:
+            await pool.release(connection)
+        else:
+            await self.close_raw_connection(connection)
+
+    async def fetch(self, results="*"):
+        """Fetches the results of the last executed query from the cursor.
+
+        Keyword Arguments:
+            results {str|1} -- If the results is equal to an asterisks all the rows are fetched
+                    else a single row is returned. (default: {"*"})
+        """
+        if results == 1:
+            return self.format_cursor_results(await self._cursor.fetchone())
+
+        return self.format_cursor_results(await self._cursor.fetchall())
+
+    async def set_cursor(self):
+        self._cursor = await self._connection.cursor()
+        return self._cursor
+
+    async def close_cursor(self):
+        if self._cursor is not None:
+            await self._cursor.close()
+
+    async def query(self, query, bindings=(), results="*"):
+        """Make the actual query that will reach the database and come back with a result.
+
+        Arguments:
+            query {string} -- A string query. This could be a qmarked string or a regular query.
+            bindings {tuple} -- A tuple of bindings
+
+        Keyword Arguments:
+            results {str|1} -- If the results is equal to an asterisks it will call 'fetchAll'
+                    else it will return 'fetchOne' and return a single record. (default: {"*"})
+
+        Returns:
+            dict|None -- Returns a dictionary of results or None
+        """
+        if self._dry:
+            return {}
+
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        failed = False
+        try:
+            await self.set_cursor()
+
+            if isinstance(query, list):
+                for q in query:
+                    await self.statement(self.compile_placeholders(q), ())
+                return
+
+            await self.statement(self.compile_placeholders(query), bindings)
+            return await self.fetch(results)
+        except Exception as e:
+            failed = True
+            raise QueryException(str(e)) from e
+        finally:
+            await self.close_cursor()
+            if self.get_transaction_level() <= 0:
+                await self.close_connection(discard=failed)
+
+    async def select_many(self, query, bindings, amount):
+        """Runs a select query and yields the results in lists of at most `amount` rows.
+        Rows are read through a streaming cursor so the full result set is never held in memory.
+
+        Arguments:
+            query {string} -- A qmarked query.
+            bindings {tuple} -- The query bindings.
+            amount {int} -- The maximum number of rows per list.
+        """
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        self._cursor = await self.get_streaming_cursor(amount)
+
+        failed = False
+        try:
+            await self.statement(self.compile_placeholders(query), bindings)
+
+            result = self.format_cursor_results(await self._cursor.fetchmany(amount))
+            while result:
+                yield result
+
+                result = self.format_cursor_results(
+                    await self._cursor.fetchmany(amount)
+                )
+        except Exception:
+            failed = True
+            raise
+        finally:
+            await self.close_cursor()
+            if self.get_transaction_level() <= 0:
+                await self.close_connection(discard=failed)
+
+    async def get_streaming_cursor(self, amount):
+        return await self._connection.cursor()
+
+    async def begin(self):
+        """Starts a transaction"""
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        if self.get_transaction_level() == 0:
+            await self._connection.begin()
+
+        self.transaction_level += 1
+        return self
+
+    async def commit(self):
+        """Commits a transaction"""
+        if self.get_transaction_level() == 1:
+            await self._connection.commit()
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+            self.run_transaction_callbacks()
+
+        return self
+
+    async def rollback(self):
+        """Rolls back a transaction"""
+        if self.get_transaction_level() == 1:
+            await self._connection.rollback()
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+            self.run_transaction_callbacks()
+
+        return self
+
+    def enable_disable_foreign_keys(self):
+        pass
@@ -0,0 +1,253 @@
+import asyncio
+import inspect
+from collections import deque
+from timeit import default_timer as timer
+
+from ..exceptions import ConnectionPoolExhausted
+from .ConnectionPool import PooledConnection
+
+
+class AsyncConnectionPool:
+    """An asyncio pool of raw async driver connections for a single connection configuration.
+
+    Async pools use the same "pool" configuration key as the synchronous ConnectionPool.
+    Driver connections are bound to the event loop that created them so a pool is
+    registered per configuration and event loop.
+    """
+
+    _pools = {}
+
+    def __init__(
+        self,
+        creator,
+        closer=None,
+        pinger=None,
+        min_size=0,
+        max_size=10,
+        max_idle_time=None,
+        max_lifetime=None,
+        pre_ping=False,
+        timeout=30,
+    ):
+        if max_size < 1:
+            raise ValueError("The pool max_size must be at least 1.")
+
+        self.creator = creator
+        self.closer = closer
+        self.pinger = pinger
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.pre_ping = pre_ping
+        self.timeout = timeout
+
+        self.loop = None
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0
+        self._filled = False
+        self._condition = asyncio.Condition()
+
+    @classmethod
+    def from_config(cls, creator, closer=None, pinger=None, config=None):
+        config = config or {}
+        return cls(
+            creator,
+            closer=closer,
+            pinger=pinger,
+            min_size=int(config.get("min_size", 0)),
+            max_size=int(config.get("max_size", 10)),
+            max_idle_time=config.get("max_idle_time"),
+            max_lifetime=config.get("max_lifetime"),
+            pre_ping=config.get("pre_ping", False),
+            timeout=config.get("timeout", 30),
+        )
+
+    @classmethod
+    def get_pool(cls, key, factory):
+        """Gets the pool registered for a key on the running event loop or creates it using the factory callable.
+
+        Arguments:
+            key {hashable} -- Uniquely identifies the connection configuration.
+            factory {callable} -- Called without arguments to create the pool when it does not exist yet.
+
+        Returns:
+            AsyncConnectionPool
+        """
+        loop = asyncio.get_running_loop()
+        pool = cls._pools.get(key)
+        if pool is not None and pool.loop is loop:
+            return pool
+
+        # Connections of a pool created on another (possibly closed) loop cannot be reused here
+        pool = factory()
+        pool.loop = loop
+        cls._pools[key] = pool
+
+        return pool
+
+    @classmethod
+    def get_pools(cls):
+        return cls._pools
+
+    @classmethod
+    async def close_all(cls):
+        """Closes every idle connection of the pools created on the running event loop and removes the pools."""
+        loop = asyncio.get_running_loop()
+        for key, pool in list(cls._pools.items()):
+            if pool.loop is not loop:
+                continue
+
+            cls._pools.pop(key, None)
+            await pool.close()
+
+    async def acquire(self):
+        """Borrows a connection from the pool, creating one if the pool is not full yet.
+
+        Raises:
+            ConnectionPoolExhausted: When no connection becomes available before the timeout.
+
+        Returns:
+            object -- A raw async driver connection.
+        """
+        if not self._filled:
+            await self.fill()
+
+        deadline = None if self.timeout is None else timer() + self.timeout
+
+        while True:
+            async with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = None if deadline is None else deadline - timer()
+                    if remaining is not None and remaining <= 0:
+                        raise ConnectionPoolExhausted(
+                            f"Could not get a connection from the pool within {self.timeout} seconds."
+                        )
+
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # Reserve a slot now and create the connection outside of the lock
+                    self._size += 1
+                    pooled = None
+
+            if pooled is None:
+                try:
+                    pooled = PooledConnection(await self.creator())
+                except BaseException:
+                    async with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+            elif not await self._is_usable(pooled):
+                await self._discard(pooled)
+                continue
+
+            pooled.last_used_at = timer()
+            self._in_use[id(pooled.connection)] = pooled
+
+            return pooled.connection
+
+    async def release(self, connection):
+        """Hands a borrowed connection back to the pool.
+
+        Arguments:
+            connection {object} -- A raw async driver connection returned by acquire.
+        """
+        pooled = self._in_use.pop(id(connection), None)
+        if pooled is None:
+            return
+
+        if self._is_expired(pooled):
+            await self._discard(pooled)
+            return
+
+        pooled.last_used_at = timer()
+        async with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    async def discard(self, connection):
+        """Removes a borrowed connection from the pool and closes it. Used for broken connections."""
+        pooled = self._in_use.pop(id(connection), None)
+        if pooled is not None:
+            await self._discard(pooled)
+
+    async def fill(self):
+        """Opens connections until the pool holds at least min_size connections."""
+        self._filled = True
+        while self._size < self.min_size:
+            self._size += 1
+            try:
+                pooled = PooledConnection(await self.creator())
+            except BaseException:
+                self._size -= 1
+                raise
+
+            async with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    async def close(self):
+        """Closes all idle connections. Connections currently borrowed are closed when released."""
+        idle = list(self._idle)
+        self._idle.clear()
+
+        for pooled in idle:
+            await self._discard(pooled)
+
+    def size(self):
+        return self._size
+
+    def idle_count(self):
+        return len(self._idle)
+
+    def in_use_count(self):
+        return len(self._in_use)
+
+    def _is_expired(self, pooled):
+        now = timer()
+        if (
+            self.max_lifetime is not None
+            and now - pooled.created_at > self.max_lifetime
+        ):
+            return True
+
+        if (
+            self.max_idle_time is not None
+            and now - pooled.last_used_at > self.max_idle_time
+        ):
+            return True
+
+        return False
+
+    async def _is_usable(self, pooled):
+        if self._is_expired(pooled):
+            return False
+
+        if self.pre_ping and self.pinger:
+            try:
+                return bool(await self.pinger(pooled.connection))
+            except Exception:
+                return False
+
+        return True
+
+    async def _discard(self, pooled):
+        async with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+        if self.closer:
+            try:
+                result = self.closer(pooled.connection)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                pass
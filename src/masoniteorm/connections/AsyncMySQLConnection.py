@@ -0,0 +1,63 @@
+from ..exceptions import DriverNotFound
+from ..query.grammars import MySQLGrammar
+from ..query.processors import MySQLPostProcessor
+from ..schema.platforms import MySQLPlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+
+
+class AsyncMySQLConnection(AsyncBaseConnection):
+    """Async MySQL Connection class using the aiomysql driver."""
+
+    name = "mysql"
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        try:
+            import aiomysql
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'aiomysql' package installed to make an async connection to MySQL. Please install it using 'pip install aiomysql'"
+            )
+
+        return await super().make_connection()
+
+    async def create_connection(self):
+        import aiomysql
+
+        return await aiomysql.connect(
+            cursorclass=aiomysql.DictCursor,
+            autocommit=True,
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port or 3306,
+            db=self.database,
+            **self.options
+        )
+
+    async def ping(self, connection):
+        await connection.ping(reconnect=False)
+        return True
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return MySQLGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return MySQLPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return MySQLPostProcessor
+
+    async def get_streaming_cursor(self, amount):
+        from aiomysql import SSDictCursor
+
+        return await self._connection.cursor(SSDictCursor)
+
+    def compile_placeholders(self, query):
+        return query.replace("'?'", "%s")
+
+    def format_cursor_results(self, cursor_result):
+        return cursor_result
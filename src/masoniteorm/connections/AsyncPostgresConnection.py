@@ -0,0 +1,155 @@
+from ..exceptions import DriverNotFound
+from ..query.grammars import PostgresGrammar
+from ..query.processors import PostgresPostProcessor
+from ..schema.platforms import PostgresPlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+
+
+class AsyncPostgresConnection(AsyncBaseConnection):
+    """Async Postgres Connection class using the asyncpg driver.
+
+    asyncpg has no cursor objects for regular queries so the rows of the last
+    statement are kept on the connection class and returned by fetch.
+    """
+
+    name = "postgres"
+
+    _result = None
+    _transaction = None
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        try:
+            import asyncpg
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'asyncpg' package installed to make an async connection to Postgres. Please install it using 'pip install asyncpg'"
+            )
+
+        return await super().make_connection()
+
+    async def create_connection(self):
+        import asyncpg
+
+        schema = self.schema or self.full_details.get("schema")
+
+        return await asyncpg.connect(
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            server_settings={"search_path": schema} if schema else None,
+        )
+
+    async def ping(self, connection):
+        if connection.is_closed():
+            return False
+
+        await connection.fetchval("SELECT 1")
+        return True
+
+    async def close_raw_connection(self, connection):
+        await connection.close()
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return PostgresGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return PostgresPlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return PostgresPostProcessor
+
+    def compile_placeholders(self, query):
+        """Replaces the qmark placeholders with asyncpg's numbered $1, $2, ... placeholders."""
+        parts = query.split("'?'")
+        compiled = parts[0]
+        for index, part in enumerate(parts[1:], start=1):
+            compiled += f"${index}{part}"
+
+        return compiled
+
+    async def set_cursor(self):
+        self._result = None
+
+    async def close_cursor(self):
+        pass
+
+    async def execute(self, query, bindings=()):
+        self._result = await self._connection.fetch(query, *bindings)
+
+    async def fetch(self, results="*"):
+        rows = self._result or []
+        if results == 1:
+            return dict(rows[0]) if rows else {}
+
+        return [dict(row) for row in rows]
+
+    async def select_many(self, query, bindings, amount):
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        query = self.compile_placeholders(query)
+
+        # asyncpg cursors can only be opened inside of a transaction
+        transaction = None
+        if self.get_transaction_level() <= 0:
+            transaction = self._connection.transaction()
+            await transaction.start()
+
+        try:
+            cursor = await self._connection.cursor(query, *bindings)
+
+            result = [dict(row) for row in await cursor.fetch(amount)]
+            while result:
+                yield result
+
+                result = [dict(row) for row in await cursor.fetch(amount)]
+        finally:
+            if transaction is not None:
+                await transaction.rollback()
+
+            if self.get_transaction_level() <= 0:
+                await self.close_connection()
+
+    async def begin(self):
+        """Postgres Transaction"""
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        if self.get_transaction_level() == 0:
+            self._transaction = self._connection.transaction()
+            await self._transaction.start()
+
+        self.transaction_level += 1
+        return self
+
+    async def commit(self):
+        """Transaction"""
+        if self.get_transaction_level() == 1:
+            await self._transaction.commit()
+            self._transaction = None
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def rollback(self):
+        """Transaction"""
+        if self.get_transaction_level() == 1:
+            await self._transaction.rollback()
+            self._transaction = None
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
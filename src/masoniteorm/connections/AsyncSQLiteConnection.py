@@ -0,0 +1,178 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from ..exceptions import DriverNotFound
+from ..query.grammars import SQLiteGrammar
+from ..query.processors import SQLitePostProcessor
+from ..schema.platforms import SQLitePlatform
+from .AsyncBaseConnection import AsyncBaseConnection
+from .SQLiteConnection import regexp
+
+
+class AsyncSQLiteConnection(AsyncBaseConnection):
+    """Async SQLite Connection class.
+
+    The standard library sqlite3 module has no asyncio interface so every call
+    to the driver runs on a worker thread and is awaited from the event loop.
+    """
+
+    name = "sqlite"
+
+    _executor = None
+
+    @classmethod
+    def get_executor(cls):
+        if AsyncSQLiteConnection._executor is None:
+            AsyncSQLiteConnection._executor = ThreadPoolExecutor(
+                thread_name_prefix="masoniteorm-sqlite"
+            )
+
+        return AsyncSQLiteConnection._executor
+
+    async def run(self, method, *args):
+        """Runs a blocking driver call on the worker threads.
+
+        Arguments:
+            method {callable} -- The driver method to call.
+
+        Returns:
+            mixed -- The return value of the driver call.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_executor(), partial(method, *args)
+        )
+
+    async def make_connection(self):
+        """This sets the connection on the connection class"""
+        try:
+            import sqlite3
+        except ModuleNotFoundError:
+            raise DriverNotFound(
+                "You must have the 'sqlite3' package installed to make a connection to SQLite."
+            )
+
+        return await super().make_connection()
+
+    async def create_connection(self):
+        return await self.run(self._connect)
+
+    def _connect(self):
+        import sqlite3
+
+        # A connection is only ever used by one coroutine at a time but not always from the same worker thread
+        connection = sqlite3.connect(
+            self.database, isolation_level=None, check_same_thread=False
+        )
+        connection.create_function("REGEXP", 2, regexp)
+        connection.row_factory = sqlite3.Row
+
+        foreign_keys = self.full_details.get("foreign_keys")
+        platform = self.get_default_platform()()
+        if foreign_keys:
+            connection.execute(platform.enable_foreign_key_constraints())
+        elif foreign_keys is not None:
+            connection.execute(platform.disable_foreign_key_constraints())
+
+        return connection
+
+    async def close_raw_connection(self, connection):
+        await self.run(connection.close)
+
+    @classmethod
+    def get_default_query_grammar(cls):
+        return SQLiteGrammar
+
+    @classmethod
+    def get_default_platform(cls):
+        return SQLitePlatform
+
+    @classmethod
+    def get_default_post_processor(cls):
+        return SQLitePostProcessor
+
+    async def execute(self, query, bindings=()):
+        await self.run(self._cursor.execute, query, bindings)
+
+    async def set_cursor(self):
+        self._cursor = await self.run(self._connection.cursor)
+        return self._cursor
+
+    async def get_streaming_cursor(self, amount):
+        cursor = await self.run(self._connection.cursor)
+        cursor.arraysize = amount
+        return cursor
+
+    async def close_cursor(self):
+        if self._cursor is not None:
+            await self.run(self._cursor.close)
+
+    async def fetch(self, results="*"):
+        if results == 1:
+            result = await self.run(self._cursor.fetchall)
+            if result:
+                return dict(result[0])
+            return None
+
+        return self.format_cursor_results(await self.run(self._cursor.fetchall))
+
+    async def select_many(self, query, bindings, amount):
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        self._cursor = await self.get_streaming_cursor(amount)
+
+        try:
+            await self.statement(self.compile_placeholders(query), bindings)
+
+            result = self.format_cursor_results(
+                await self.run(self._cursor.fetchmany, amount)
+            )
+            while result:
+                yield result
+
+                result = self.format_cursor_results(
+                    await self.run(self._cursor.fetchmany, amount)
+                )
+        finally:
+            await self.close_cursor()
+            if self.get_transaction_level() <= 0:
+                await self.close_connection()
+
+    async def begin(self):
+        """Sqlite Transaction"""
+        if not self.open or self._connection is None:
+            await self.make_connection()
+
+        self._connection.isolation_level = "DEFERRED"
+        self.transaction_level += 1
+        return self
+
+    async def commit(self):
+        """Transaction"""
+        if self.get_transaction_level() == 1:
+            await self.run(self._connection.commit)
+            self._connection.isolation_level = None
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    async def rollback(self):
+        """Transaction"""
+        if self.get_transaction_level() == 1:
+            await self.run(self._connection.rollback)
+            self._connection.isolation_level = None
+
+        self.transaction_level -= 1
+
+        if self.get_transaction_level() <= 0:
+            await self.close_connection()
+
+        return self
+
+    def format_cursor_results(self, cursor_result):
+        return [dict(row) for row in cursor_result]
@@ -1,6 +1,9 @@
 import logging
 from timeit import default_timer as timer
 from .ConnectionResolver import ConnectionResolver
+from .ConnectionPool import ConnectionPool
+from .PreparedStatementCache import PreparedStatementCache
+from .QueryListeners import QueryEvent, QueryListeners
 
 
 class BaseConnection:
@@ -8,6 +11,18 @@ class BaseConnection:
     _cursor = None
     _dry = False
 
+    # Whether the driver can reuse server side prepared statements
+    supports_prepared_statements = False
+
+    _prepare_statements = None
+    _statements = None
+
+    # The model class of the query builder running queries on this connection
+    _model = None
+
+    # Callbacks waiting for the outermost transaction to end
+    _transaction_callbacks = ()
+
     def dry(self):
         self._dry = True
         return self
@@ -27,24 +42,95 @@ class BaseConnection:
             extra={"query": query, "bindings": bindings, "query_time": query_time},
         )
 
-    def statement(self, query, bindings=()):
+    def statement(self, query, bindings=(), sql=None):
         """Wrapper around calling the cursor query. Helpful for logging output.
 
         Args:
             query (string): The query to execute on the cursor
             bindings (tuple, optional): Tuple of query bindings. Defaults to ().
+            sql (string, optional): The SQL logged and passed to the query listeners when it
+                differs from the executed query, like the SQL of a prepared statement. Defaults to the query.
         """
-        start = timer()
         if not self._cursor:
             raise AttributeError(
                 f"Must set the _cursor attribute on the {self.__class__.__name__} class before calling the 'statement' method."
             )
 
+        sql = sql or query
+        event = self.make_query_event(sql, bindings)
+        # Started after the before listeners so only the query itself is timed
+        start = timer()
         self._cursor.execute(query, bindings)
-        end = "{:.2f}".format(timer() - start)
+        elapsed = timer() - start
+        end = "{:.2f}".format(elapsed)
 
         if self.full_details and self.full_details.get("log_queries", False):
-            self.log(query, bindings, query_time=end)
+            self.log(sql, bindings, query_time=end)
+
+        if event is not None:
+            self.dispatch_query_event(event, elapsed)
+
+    def set_model(self, model):
+        """Sets the model whose queries run on this connection, for the query listeners.
+
+        Arguments:
+            model {Model|type|None} -- A model instance or class.
+
+        Returns:
+            self
+        """
+        self._model = model if model is None or isinstance(model, type) else type(model)
+        return self
+
+    def make_query_event(self, query, bindings):
+        """Builds the event passed to the query listeners and calls the listeners that run
+        before queries.
+
+        Returns:
+            QueryEvent|None -- None when nothing listens to queries.
+        """
+        if not QueryListeners.is_listening():
+            return None
+
+        event = QueryEvent(
+            query,
+            bindings,
+            connection=self.name,
+            driver=self.__class__.name,
+            model=self._model,
+        )
+        QueryListeners.before(event)
+        return event
+
+    def dispatch_query_event(self, event, elapsed):
+        event.time = elapsed * 1000
+        rowcount = getattr(self._cursor, "rowcount", None)
+        if isinstance(rowcount, int) and rowcount >= 0:
+            event.rowcount = rowcount
+
+        QueryListeners.after(event)
+
+    def after_transaction(self, callback):
+        """Runs a callback once the outermost transaction of the connection is committed
+        or rolled back. Runs it right away when no transaction is open.
+
+        Arguments:
+            callback {callable} -- A callable without arguments.
+
+        Returns:
+            self
+        """
+        if self.get_transaction_level() <= 0:
+            callback()
+        else:
+            self._transaction_callbacks += (callback,)
+
+        return self
+
+    def run_transaction_callbacks(self):
+        callbacks, self._transaction_callbacks = self._transaction_callbacks, ()
+        for callback in callbacks:
+            callback()
 
     def has_global_connection(self):
         return self.name in ConnectionResolver().get_global_connections()
@@ -58,6 +144,145 @@ class BaseConnection:
     def disable_query_log(self):
         self.full_details["log_queries"] = False
 
+    def prepare_statements(self, enabled=True):
+        """Overrides the "prepared_statements" configuration of the connection.
+
+        Keyword Arguments:
+            enabled {bool} -- Whether queries should run through prepared statements. (default: {True})
+
+        Returns:
+            self
+        """
+        self._prepare_statements = enabled
+        return self
+
+    def prepares_statements(self):
+        if not self.supports_prepared_statements:
+            return False
+
+        if self._prepare_statements is not None:
+            return self._prepare_statements
+
+        return bool(self.full_details.get("prepared_statements"))
+
+    def get_prepared_statements(self, query):
+        """Gets the prepared statement cache of the open raw connection when the query should
+        run as a prepared statement. Only queries with bindings are prepared; DDL and other
+        one off statements run as plain text.
+
+        Statements are only prepared on connections that outlive the query: pooled connections
+        and connections in a transaction. Any other connection is closed after the query, so
+        preparing would cost an extra round trip without ever being reused.
+
+        Arguments:
+            query {string} -- A qmarked query.
+
+        Returns:
+            PreparedStatementCache|None
+        """
+        if self._dry or not self.prepares_statements() or "'?'" not in query:
+            return None
+
+        if query.lstrip()[:6].upper() not in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+            return None
+
+        def factory(connection):
+            return PreparedStatementCache.from_config(
+                connection, self.full_details.get("prepared_statements")
+            )
+
+        pool = self.get_pool()
+        if pool:
+            return pool.get_statements(self._connection, factory)
+
+        # Without a pool the statements die with the raw connection
+        if self.get_transaction_level() <= 0:
+            return None
+
+        if (
+            self._statements is None
+            or self._statements.connection is not self._connection
+        ):
+            self._statements = factory(self._connection)
+
+        return self._statements
+
+    def get_pool(self):
+        """Gets the connection pool for this connection configuration.
+
+        Returns:
+            ConnectionPool|None -- None when pooling is not enabled in the "pool" configuration key.
+        """
+        pool_config = self.full_details.get("pool")
+        if not pool_config:
+            return None
+
+        if not isinstance(pool_config, dict):
+            pool_config = {}
+
+        return ConnectionPool.get_pool(
+            self.get_pool_key(),
+            lambda: ConnectionPool.from_config(
+                self.create_connection,
+                closer=lambda connection: connection.close(),
+                pinger=self.ping,
+                config=pool_config,
+            ),
+        )
+
+    def get_pool_key(self):
+        return (
+            self.__class__.__name__,
+            self.name,
+            self.host,
+            self.port,
+            self.database,
+            self.user,
+            getattr(self, "schema", None) or self.full_details.get("schema"),
+        )
+
+    def create_connection(self):
+        """Creates a new raw driver connection."""
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' does not support connection pooling"
+        )
+
+    def ping(self, connection):
+        """Checks that a raw driver connection is still usable."""
+        return True
+
+    def acquire_connection(self):
+        """Sets a raw driver connection on the connection class, either borrowed
+        from the pool or newly created."""
+        pool = self.get_pool()
+        if pool:
+            self._connection = pool.acquire()
+        else:
+            self._connection = self.create_connection()
+
+        return self._connection
+
+    def close_connection(self, discard=False):
+        """Closes the raw driver connection or hands it back to the pool when pooling is enabled.
+
+        Keyword Arguments:
+            discard {bool} -- Close a pooled connection instead of handing it back, for example
+                after a driver error left it in an unknown state. (default: {False})
+        """
+        self.open = 0
+        if self._connection is None:
+            return
+
+        pool = self.get_pool()
+        if pool:
+            if discard:
+                pool.discard(self._connection)
+            else:
+                pool.release(self._connection)
+            self._connection = None
+        else:
+            self._connection.close()
+
     def format_cursor_results(self, cursor_result):
         return cursor_result
 
@@ -65,17 +290,49 @@ class BaseConnection:
         self._cursor = self._connection.cursor()
         return self
 
+    def get_streaming_cursor(self, amount):
+        """Gets a cursor that fetches rows from the database as they are consumed
+        instead of buffering the whole result set on the client.
+
+        Arguments:
+            amount {int} -- The number of rows that will be fetched at a time.
+        """
+        return self._connection.cursor()
+
+    def compile_placeholders(self, query):
+        """Replaces the qmark placeholders of a compiled query with the driver's paramstyle."""
+        return query.replace("'?'", "?")
+
     def select_many(self, query, bindings, amount):
-        self.set_cursor()
-        self.statement(query)
-        if not self.open:
+        """Runs a select query and yields the results in lists of at most `amount` rows.
+        Rows are read through a streaming cursor so the full result set is never held in memory.
+
+        Arguments:
+            query {string} -- A qmarked query.
+            bindings {tuple} -- The query bindings.
+            amount {int} -- The maximum number of rows per list.
+        """
+        if not self.open or self._connection is None:
             self.make_connection()
 
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
+        self._cursor = self.get_streaming_cursor(amount)
+
+        failed = False
+        try:
+            self.statement(self.compile_placeholders(query), bindings)
 
             result = self.format_cursor_results(self._cursor.fetchmany(amount))
+            while result:
+                yield result
+
+                result = self.format_cursor_results(self._cursor.fetchmany(amount))
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._cursor.close()
+            if self.get_transaction_level() <= 0:
+                self.close_connection(discard=failed)
 
     def enable_disable_foreign_keys(self):
         foreign_keys = self.full_details.get("foreign_keys")
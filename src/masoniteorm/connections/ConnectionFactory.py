@@ -1,10 +1,13 @@
 from ..config import load_config
+from ..exceptions import DriverNotFound
 
 
 class ConnectionFactory:
     """Class for controlling the registration and creation of connection types."""
 
     _connections = {}
+    _async_connections = {}
+    _resolved = {}
 
     def __init__(self, config_path=None):
         self.config_path = config_path
@@ -21,6 +24,27 @@ class ConnectionFactory:
             cls
         """
         cls._connections.update({key: connection})
+        ConnectionFactory.flush_resolved()
+        return cls
+
+    @classmethod
+    def register_async(cls, key, connection):
+        """Registers new async connections
+
+        Arguments:
+            key {key} -- The driver name the async connection is used for
+            connection {masoniteorm.connections.AsyncBaseConnection} -- An AsyncBaseConnection class.
+
+        Returns:
+            cls
+        """
+        cls._async_connections.update({key: connection})
+        return cls
+
+    @classmethod
+    def flush_resolved(cls):
+        """Clears the cache of connection classes resolved by make."""
+        ConnectionFactory._resolved = {}
         return cls
 
     def make(self, key):
@@ -36,20 +60,44 @@ class ConnectionFactory:
             masoniteorm.connection.BaseConnection -- Returns an instance of a BaseConnection class.
         """
 
-        DB = load_config(config_path=self.config_path).DB
-
-        connections = DB.get_connection_details()
+        # Subclasses can carry their own registry so the class is part of the cache key, and
+        # the default connection depends on the configuration it is read from
+        cache_key = (self.__class__, self.config_path, key)
+        connection = self._resolved.get(cache_key)
+        if connection:
+            return connection
 
         if key == "default":
+            DB = load_config(config_path=self.config_path).DB
+
+            connections = DB.get_connection_details()
             connection_details = connections.get(connections.get("default"))
             connection = self._connections.get(connection_details.get("driver"))
         else:
-            connection_details = connections.get(key)
             connection = self._connections.get(key)
 
         if connection:
+            self._resolved[cache_key] = connection
             return connection
 
         raise Exception(
             "The '{connection}' connection does not exist".format(connection=key)
         )
+
+    def make_async(self, key):
+        """Makes already registered async connections
+
+        Arguments:
+            key {string} -- The driver name of the connection
+
+        Raises:
+            DriverNotFound: Raised when the driver has no registered async connection
+
+        Returns:
+            masoniteorm.connection.AsyncBaseConnection -- Returns an AsyncBaseConnection class.
+        """
+        connection = self._async_connections.get(key)
+        if connection:
+            return connection
+
+        raise DriverNotFound(f"The '{key}' driver does not have an async connection")
@@ -0,0 +1,300 @@
+import threading
+from collections import deque
+from timeit import default_timer as timer
+
+from ..exceptions import ConnectionPoolExhausted
+
+
+class PooledConnection:
+    """Bookkeeping wrapper around a raw driver connection held by a pool."""
+
+    __slots__ = ("connection", "created_at", "last_used_at", "statements")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = timer()
+        self.last_used_at = self.created_at
+        # The statements prepared in this connection's session
+        self.statements = None
+
+
+class ConnectionPool:
+    """A thread safe pool of raw driver connections for a single connection configuration.
+
+    Pools are configured through the "pool" key of a connection in the database configuration:
+
+        "mysql": {
+            "driver": "mysql",
+            ...
+            "pool": {
+                "min_size": 0,
+                "max_size": 10,
+                "max_idle_time": 300,
+                "max_lifetime": 3600,
+                "pre_ping": True,
+                "timeout": 30,
+            },
+        }
+    """
+
+    _pools = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        creator,
+        closer=None,
+        pinger=None,
+        min_size=0,
+        max_size=10,
+        max_idle_time=None,
+        max_lifetime=None,
+        pre_ping=False,
+        timeout=30,
+    ):
+        if max_size < 1:
+            raise ValueError("The pool max_size must be at least 1.")
+
+        self.creator = creator
+        self.closer = closer
+        self.pinger = pinger
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.pre_ping = pre_ping
+        self.timeout = timeout
+
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0
+        self._filled = False
+        self._condition = threading.Condition(threading.Lock())
+
+    @classmethod
+    def from_config(cls, creator, closer=None, pinger=None, config=None):
+        config = config or {}
+        return cls(
+            creator,
+            closer=closer,
+            pinger=pinger,
+            min_size=int(config.get("min_size", 0)),
+            max_size=int(config.get("max_size", 10)),
+            max_idle_time=config.get("max_idle_time"),
+            max_lifetime=config.get("max_lifetime"),
+            pre_ping=config.get("pre_ping", False),
+            timeout=config.get("timeout", 30),
+        )
+
+    @classmethod
+    def get_pool(cls, key, factory):
+        """Gets the pool registered for a key or creates it using the factory callable.
+
+        Arguments:
+            key {hashable} -- Uniquely identifies the connection configuration.
+            factory {callable} -- Called without arguments to create the pool when it does not exist yet.
+
+        Returns:
+            ConnectionPool
+        """
+        pool = cls._pools.get(key)
+        if pool is not None:
+            return pool
+
+        with cls._registry_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = factory()
+                cls._pools[key] = pool
+
+        return pool
+
+    @classmethod
+    def get_pools(cls):
+        return cls._pools
+
+    @classmethod
+    def close_all(cls):
+        """Closes every idle connection of every registered pool and removes the pools."""
+        with cls._registry_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+
+        for pool in pools:
+            pool.close()
+
+    def acquire(self):
+        """Borrows a connection from the pool, creating one if the pool is not full yet.
+
+        Raises:
+            ConnectionPoolExhausted: When no connection becomes available before the timeout.
+
+        Returns:
+            object -- A raw driver connection.
+        """
+        if not self._filled:
+            self.fill()
+
+        deadline = None if self.timeout is None else timer() + self.timeout
+
+        while True:
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = None if deadline is None else deadline - timer()
+                    if remaining is not None and remaining <= 0:
+                        raise ConnectionPoolExhausted(
+                            f"Could not get a connection from the pool within {self.timeout} seconds."
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # Reserve a slot now and create the connection outside of the lock
+                    self._size += 1
+                    pooled = None
+
+            if pooled is None:
+                try:
+                    pooled = PooledConnection(self.creator())
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._is_usable(pooled):
+                self._discard(pooled)
+                continue
+
+            pooled.last_used_at = timer()
+            with self._condition:
+                self._in_use[id(pooled.connection)] = pooled
+
+            return pooled.connection
+
+    def release(self, connection):
+        """Hands a borrowed connection back to the pool.
+
+        Arguments:
+            connection {object} -- A raw driver connection returned by acquire.
+        """
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+
+        if pooled is None:
+            return
+
+        if self._is_expired(pooled):
+            self._discard(pooled)
+            return
+
+        pooled.last_used_at = timer()
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def get_statements(self, connection, factory):
+        """Gets the prepared statement cache of a borrowed connection, creating it on first use.
+
+        Arguments:
+            connection {object} -- A raw driver connection returned by acquire.
+            factory {callable} -- Called with the raw connection to create the cache.
+
+        Returns:
+            PreparedStatementCache|None -- None when the connection is not borrowed from this pool.
+        """
+        with self._condition:
+            pooled = self._in_use.get(id(connection))
+
+        if pooled is None:
+            return None
+
+        if pooled.statements is None:
+            pooled.statements = factory(connection)
+
+        return pooled.statements
+
+    def discard(self, connection):
+        """Removes a borrowed connection from the pool and closes it. Used for broken connections."""
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+
+        if pooled is not None:
+            self._discard(pooled)
+
+    def fill(self):
+        """Opens connections until the pool holds at least min_size connections."""
+        self._filled = True
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+
+            try:
+                pooled = PooledConnection(self.creator())
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                raise
+
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    def close(self):
+        """Closes all idle connections. Connections currently borrowed are closed when released."""
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+
+        for pooled in idle:
+            self._discard(pooled)
+
+    def size(self):
+        return self._size
+
+    def idle_count(self):
+        return len(self._idle)
+
+    def in_use_count(self):
+        return len(self._in_use)
+
+    def _is_expired(self, pooled):
+        now = timer()
+        if (
+            self.max_lifetime is not None
+            and now - pooled.created_at > self.max_lifetime
+        ):
+            return True
+
+        if (
+            self.max_idle_time is not None
+            and now - pooled.last_used_at > self.max_idle_time
+        ):
+            return True
+
+        return False
+
+    def _is_usable(self, pooled):
+        if self._is_expired(pooled):
+            return False
+
+        if self.pre_ping and self.pinger:
+            try:
+                return bool(self.pinger(pooled.connection))
+            except Exception:
+                return False
+
+        return True
+
+    def _discard(self, pooled):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+        if self.closer:
+            try:
+                self.closer(pooled.connection)
+            except Exception:
+                pass
@@ -1,10 +1,14 @@
 from contextlib import contextmanager
 
+from .ConnectionRouter import ConnectionRouter
+
 
 class ConnectionResolver:
     _connection_details = {}
+    _connection_information = {}
     _connections = {}
     _morph_map = {}
+    _morph_keys = {}
 
     def __init__(self, config_path=None):
         from ..connections import (
@@ -12,6 +16,9 @@ class ConnectionResolver:
             PostgresConnection,
             MySQLConnection,
             MSSQLConnection,
+            AsyncSQLiteConnection,
+            AsyncPostgresConnection,
+            AsyncMySQLConnection,
         )
 
         self.config_path = config_path
@@ -22,13 +29,47 @@ class ConnectionResolver:
         self.register(PostgresConnection)
         self.register(MySQLConnection)
         self.register(MSSQLConnection)
+        self.register_async(AsyncSQLiteConnection)
+        self.register_async(AsyncPostgresConnection)
+        self.register_async(AsyncMySQLConnection)
 
     def morph_map(self, map):
-        self._morph_map = map
+        """Registers the keys stored in the type column of polymorphic relationships.
+
+        The map is kept on ConnectionResolver itself along with its reverse index, so
+        relationships resolve a key or a model class with a dictionary lookup.
+
+        Arguments:
+            map {dict} -- The model classes by their key, like {"user": User}.
+
+        Returns:
+            self
+        """
+        morph_keys = {}
+        for key, model in map.items():
+            morph_keys.setdefault(model, key)
+
+        ConnectionResolver._morph_map = dict(map)
+        ConnectionResolver._morph_keys = morph_keys
         return self
 
+    @classmethod
+    def get_morph_map(cls):
+        return ConnectionResolver._morph_map
+
+    @classmethod
+    def get_morph_model(cls, key):
+        """Gets the model class registered for a polymorphic key, or None."""
+        return ConnectionResolver._morph_map.get(key)
+
+    @classmethod
+    def get_morph_key(cls, model):
+        """Gets the polymorphic key registered for a model class, or None."""
+        return ConnectionResolver._morph_keys.get(model)
+
     def set_connection_details(self, connection_details):
         self.__class__._connection_details = connection_details
+        self.flush_connection_cache()
         return self
 
     def get_connection_details(self):
@@ -36,6 +77,15 @@ class ConnectionResolver:
 
     def set_connection_option(self, connection: str, options: dict):
         self._connection_details.get(connection).update(options)
+        self.flush_connection_cache()
+        return self
+
+    def flush_connection_cache(self):
+        """Clears the cached connection information and resolved connection classes.
+        Needs to be called when the connection details dictionary is changed in place.
+        """
+        self.__class__._connection_information = {}
+        self.connection_factory.flush_resolved()
         return self
 
     def get_global_connections(self):
@@ -44,9 +94,26 @@ class ConnectionResolver:
     def remove_global_connection(self, name=None):
         self._connections.pop(name)
 
+    def close_pools(self):
+        """Closes the idle connections of every connection pool."""
+        from .ConnectionPool import ConnectionPool
+
+        ConnectionPool.close_all()
+        return self
+
+    async def close_async_pools(self):
+        """Closes the idle connections of every async connection pool created on the running event loop."""
+        from .AsyncConnectionPool import AsyncConnectionPool
+
+        await AsyncConnectionPool.close_all()
+        return self
+
     def register(self, connection):
         self.connection_factory.register(connection.name, connection)
 
+    def register_async(self, connection):
+        self.connection_factory.register_async(connection.name, connection)
+
     def begin_transaction(self, name=None):
         if name is None:
             name = self.get_connection_details()["default"]
@@ -79,6 +146,11 @@ class ConnectionResolver:
         self.remove_global_connection(name)
         connection.rollback()
 
+        # Schema changes made in the transaction are undone too
+        from ..schema import SchemaCache
+
+        SchemaCache.forget_connection(name)
+
     @contextmanager
     def transaction(self, name=None):
         self.begin_transaction(name)
@@ -94,18 +166,118 @@ class ConnectionResolver:
             self.rollback(name)
             raise
 
+    def forget_writes(self):
+        """Lets reads of "sticky" read / write connections go back to the read hosts.
+        Call it when a request ends.
+
+        Returns:
+            self
+        """
+        ConnectionRouter.forget_writes()
+        return self
+
+    def set_query_cache(self, cache):
+        """Sets the cache used by QueryBuilder.remember(), for example one backed by a shared store.
+
+        Arguments:
+            cache {masoniteorm.query.QueryCache} -- The query cache.
+
+        Returns:
+            self
+        """
+        from ..query import QueryBuilder
+
+        QueryBuilder.query_cache = cache
+        return self
+
+    def get_query_cache(self):
+        from ..query import QueryBuilder
+
+        return QueryBuilder.query_cache
+
+    def listen(self, callback, before=False):
+        """Registers a listener called with a QueryEvent for every query, carrying the SQL,
+        bindings, time in milliseconds, rowcount, connection name and model of the query.
+
+        Arguments:
+            callback {callable} -- The listener, for example a SlowQueryLogger.
+
+        Keyword Arguments:
+            before {bool} -- Whether to call the listener before the query runs instead of after. (default: {False})
+
+        Returns:
+            self
+        """
+        from .QueryListeners import QueryListeners
+
+        QueryListeners.listen(callback, before=before)
+        return self
+
+    def forget_listeners(self, callback=None):
+        """Removes a query listener, or every query listener when no callback is given.
+
+        Returns:
+            self
+        """
+        from .QueryListeners import QueryListeners
+
+        QueryListeners.forget(callback)
+        return self
+
+    def collect_queries(self):
+        """Collects the queries run in the current thread or task, for example during a
+        request, to count them, time them and find duplicated queries. Use it as a context
+        manager:
+
+            with DB.collect_queries() as queries:
+                ...
+
+        Returns:
+            masoniteorm.connections.QueryCollector
+        """
+        from .QueryListeners import QueryCollector
+
+        return QueryCollector()
+
+    def identity_map(self):
+        """Starts a unit of work in which every row is hydrated into a single model instance
+        per model class and primary key. Use it as a context manager:
+
+            with DB.identity_map():
+                ...
+
+        Returns:
+            masoniteorm.query.IdentityMap
+        """
+        from ..query import IdentityMap
+
+        return IdentityMap()
+
     def get_connection_information(self, name):
-        details = self.get_connection_details()
-        return {
-            "host": details.get(name, {}).get("host"),
-            "database": details.get(name, {}).get("database"),
-            "user": details.get(name, {}).get("user"),
-            "port": details.get(name, {}).get("port"),
-            "password": details.get(name, {}).get("password"),
-            "prefix": details.get(name, {}).get("prefix"),
-            "options": details.get(name, {}).get("options", {}),
-            "full_details": details.get(name, {}),
+        information = self._connection_information.get(name)
+        if information is not None:
+            return information
+
+        details = self.get_connection_details().get(name, {})
+        routed = ConnectionRouter.is_routed(details)
+        if routed:
+            # Transactions always run on the primary
+            details = ConnectionRouter.route(name, details, write=True)
+
+        information = {
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
+        if not routed:
+            self._connection_information[name] = information
+
+        return information
 
     def get_schema_builder(self, connection="default", schema=None):
         from ..schema import Schema
@@ -123,5 +295,12 @@ class ConnectionResolver:
             connection=connection, connection_details=self.get_connection_details()
         )
 
+    def get_async_query_builder(self, connection="default"):
+        from ..query import AsyncQueryBuilder
+
+        return AsyncQueryBuilder(
+            connection=connection, connection_details=self.get_connection_details()
+        )
+
     def statement(self, query, bindings=(), connection="default"):
         return self.get_query_builder().on(connection).statement(query, bindings)
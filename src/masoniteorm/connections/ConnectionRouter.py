@@ -0,0 +1,119 @@
+import itertools
+import threading
+from contextvars import ContextVar
+
+_written_connections = ContextVar(
+    "masoniteorm_written_connections", default=frozenset()
+)
+
+
+class ConnectionRouter:
+    """Routes the queries of a connection between its primary and its read replicas.
+
+    Connections define the hosts to read from and to write to with the "read" and "write"
+    keys. Each key accepts a dictionary whose "host" is a single host or a list of hosts,
+    or a list of hosts or dictionaries. Other keys of a host override the connection's keys:
+
+        "mysql": {
+            "driver": "mysql",
+            "user": "root",
+            ...
+            "read": {"host": ["replica-1", "replica-2"]},
+            "write": {"host": "primary"},
+            "read_strategy": "round_robin",
+            "sticky": True,
+        }
+
+    Selects are spread over the read hosts, either in turn ("round_robin") or by picking
+    the host with the fewest connections in use in its pool ("least_loaded"). Writes,
+    locking selects and transactions use the write hosts. With "sticky" enabled, reads go
+    to the write hosts after the current thread or task wrote through the connection,
+    until forget_writes is called.
+    """
+
+    _counters = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_routed(cls, details):
+        return "read" in details or "write" in details
+
+    @classmethod
+    def route(cls, name, details, write=False, load=None):
+        """Gets the connection details of the host a query should run on.
+
+        Arguments:
+            name {string} -- The name of the connection.
+            details {dict} -- The connection details from the database configuration.
+
+        Keyword Arguments:
+            write {bool} -- Whether the query writes or has to run on the primary. (default: {False})
+            load {callable|None} -- Called with the details of a read host to get its number
+                of connections in use. Used by the "least_loaded" strategy. (default: {None})
+
+        Returns:
+            dict -- The connection details merged with the details of the chosen host.
+        """
+        if not cls.is_routed(details):
+            return details
+
+        if not write and details.get("sticky") and cls.has_written(name):
+            write = True
+
+        role = "write" if write else "read"
+        hosts = cls.get_hosts(details.get(role))
+        base = {
+            key: value for key, value in details.items() if key not in ("read", "write")
+        }
+
+        start = next(cls._get_counter(name, role)) % len(hosts)
+        hosts = hosts[start:] + hosts[:start]
+        if not write and load and details.get("read_strategy") == "least_loaded":
+            # min keeps the round robin order between hosts with the same load
+            hosts = [min(hosts, key=lambda host: load({**base, **host}))]
+
+        return {**base, **hosts[0]}
+
+    @classmethod
+    def get_hosts(cls, config):
+        if not config:
+            return [{}]
+
+        if isinstance(config, dict):
+            hosts = config.get("host")
+            if isinstance(hosts, (list, tuple)):
+                shared = {key: value for key, value in config.items() if key != "host"}
+                return [{**shared, "host": host} for host in hosts]
+
+            return [config]
+
+        if isinstance(config, (list, tuple)):
+            return [
+                host if isinstance(host, dict) else {"host": host} for host in config
+            ]
+
+        return [{"host": config}]
+
+    @classmethod
+    def _get_counter(cls, name, role):
+        counter = cls._counters.get((name, role))
+        if counter is None:
+            with cls._lock:
+                counter = cls._counters.setdefault((name, role), itertools.count())
+
+        return counter
+
+    @classmethod
+    def record_write(cls, name):
+        written = _written_connections.get()
+        if name not in written:
+            _written_connections.set(written | {name})
+
+    @classmethod
+    def has_written(cls, name):
+        return name in _written_connections.get()
+
+    @classmethod
+    def forget_writes(cls):
+        """Forgets the writes recorded for sticky connections, for example at the end of a request."""
+        _written_connections.set(frozenset())
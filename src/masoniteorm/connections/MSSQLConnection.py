@@ -6,14 +6,13 @@ from ..query.processors import MSSQLPostProcessor
 from ..exceptions import QueryException
 
 
-CONNECTION_POOL = []
-
-
 class MSSQLConnection(BaseConnection):
     """MSSQL Connection class."""
 
     name = "mssql"
 
+    supports_prepared_statements = True
+
     def __init__(
         self,
         host=None,
@@ -55,6 +54,16 @@ class MSSQLConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
+        self.acquire_connection()
+
+        self.enable_disable_foreign_keys()
+
+        self.open = 1
+        return self
+
+    def create_connection(self):
+        import pyodbc
+
         driver = self.options.get("driver", "ODBC Driver 17 for SQL Server")
         integrated_security = self.options.get("integrated_security")
         connection_timeout = str(self.options.get("connection_timeout", "30"))
@@ -65,15 +74,19 @@ class MSSQLConnection(BaseConnection):
         if instance:
             instance = "\\" + instance
 
-        self._connection = pyodbc.connect(
+        return pyodbc.connect(
             f"DRIVER={driver};SERVER={self.host}{instance if instance else ''},{self.port};Connection Timeout={connection_timeout};DATABASE={self.database}{f';Integrated Security={integrated_security}' if integrated_security else ''};UID={self.user};PWD={self.password}{f';Trusted_Connection={trusted_connection}' if trusted_connection else ''}{f';Authentication={authentication}' if authentication else ''}",
             autocommit=True,
         )
 
-        self.enable_disable_foreign_keys()
+    def ping(self, connection):
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
 
-        self.open = 1
-        return self
+        return True
 
     def get_database_name(self):
         return self.database
@@ -101,6 +114,11 @@ class MSSQLConnection(BaseConnection):
 
         self.transaction_level -= 1
 
+        if self.get_transaction_level() <= 0:
+            if self.get_pool():
+                self.close_connection()
+            self.run_transaction_callbacks()
+
     def begin(self):
         """MSSQL Transaction"""
         self._connection.autocommit = False
@@ -115,6 +133,11 @@ class MSSQLConnection(BaseConnection):
 
         self.transaction_level -= 1
 
+        if self.get_transaction_level() <= 0:
+            if self.get_pool():
+                self.close_connection()
+            self.run_transaction_callbacks()
+
     def get_transaction_level(self):
         """Transaction"""
         return self.transaction_level
@@ -122,6 +145,33 @@ class MSSQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def get_prepared_cursor(self, statements, query):
+        """Gets the cursor a query was last executed on. pyodbc keeps the statement it prepared
+        for a cursor and reuses it as long as the same SQL text is executed again.
+
+        Arguments:
+            statements {PreparedStatementCache} -- The cursors kept for the connection.
+            query {string} -- A qmarked query.
+
+        Returns:
+            pyodbc.Cursor
+        """
+        cursor = statements.get(query)
+        if cursor is None:
+            cursor = self._connection.cursor()
+            for evicted in statements.put(query, cursor):
+                self.close_prepared_cursor(evicted)
+
+        return cursor
+
+    def close_prepared_cursor(self, cursor):
+        """Closes a cursor removed from the prepared statement cache, releasing its statement."""
+        try:
+            cursor.close()
+        except Exception:
+            # The cursor may already be closed along with a broken connection
+            pass
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -137,17 +187,23 @@ class MSSQLConnection(BaseConnection):
             dict|None -- Returns a dictionary of results or None
         """
 
+        statements = None
+        failed = False
         try:
             if not self.open:
                 self.make_connection()
-            self._cursor = self._connection.cursor()
+            if not isinstance(query, list):
+                statements = self.get_prepared_statements(query)
+            if statements is not None:
+                self._cursor = self.get_prepared_cursor(statements, query)
+            else:
+                self._cursor = self._connection.cursor()
             with self._cursor as cursor:
                 if isinstance(query, list) and not self._dry:
                     for q in query:
                         self.statement(q, ())
                     return
-                query = query.replace("'?'", "?")
-                self.statement(query, bindings)
+                self.statement(query.replace("'?'", "?"), bindings)
                 if results == 1:
                     if not cursor.description:
                         return {}
@@ -161,10 +217,13 @@ class MSSQLConnection(BaseConnection):
 
                 return {}
         except Exception as e:
+            failed = True
+            if statements is not None and query in statements:
+                self.close_prepared_cursor(statements.forget(query))
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self._connection.close()
+                self.close_connection(discard=failed)
 
     def format_cursor_results(self, cursor_result):
         columnNames = [column[0] for column in self.get_cursor().description]
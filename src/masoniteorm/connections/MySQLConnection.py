@@ -5,8 +5,6 @@ from ..schema.platforms import MySQLPlatform
 from ..query.processors import MySQLPostProcessor
 from ..exceptions import QueryException
 
-CONNECTION_POOL = []
-
 
 class MySQLConnection(BaseConnection):
     """MYSQL Connection class."""
@@ -68,7 +66,18 @@ class MySQLConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
-        self._connection = pymysql.connect(
+        self.acquire_connection()
+
+        self.enable_disable_foreign_keys()
+
+        self.open = 1
+
+        return self
+
+    def create_connection(self):
+        import pymysql
+
+        return pymysql.connect(
             cursorclass=pymysql.cursors.DictCursor,
             autocommit=True,
             host=self.host,
@@ -79,11 +88,9 @@ class MySQLConnection(BaseConnection):
             **self.options
         )
 
-        self.enable_disable_foreign_keys()
-
-        self.open = 1
-
-        return self
+    def ping(self, connection):
+        connection.ping(reconnect=False)
+        return True
 
     def reconnect(self):
         self._connection.connect()
@@ -109,8 +116,8 @@ class MySQLConnection(BaseConnection):
         self._connection.commit()
         self.transaction_level -= 1
         if self.get_transaction_level() <= 0:
-            self.open = 0
-            self._connection.close()
+            self.close_connection()
+            self.run_transaction_callbacks()
 
     def dry(self):
         """Transaction"""
@@ -128,8 +135,8 @@ class MySQLConnection(BaseConnection):
         self._connection.rollback()
         self.transaction_level -= 1
         if self.get_transaction_level() <= 0:
-            self.open = 0
-            self._connection.close()
+            self.close_connection()
+            self.run_transaction_callbacks()
 
     def get_transaction_level(self):
         """Transaction"""
@@ -138,6 +145,15 @@ class MySQLConnection(BaseConnection):
     def get_cursor(self):
         return self._cursor
 
+    def get_streaming_cursor(self, amount):
+        """Gets an unbuffered cursor which reads rows from the server as they are fetched."""
+        from pymysql.cursors import SSDictCursor
+
+        return self._connection.cursor(SSDictCursor)
+
+    def compile_placeholders(self, query):
+        return query.replace("'?'", "%s")
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -156,11 +172,14 @@ class MySQLConnection(BaseConnection):
         if self._dry:
             return {}
 
-        if not self._connection.open:
+        if not self.open or self._connection is None:
+            self.make_connection()
+        elif not self._connection.open:
             self._connection.connect()
 
         self._cursor = self._connection.cursor()
 
+        failed = False
         try:
             with self._cursor as cursor:
                 if isinstance(query, list):
@@ -176,9 +195,9 @@ class MySQLConnection(BaseConnection):
                 else:
                     return self.format_cursor_results(cursor.fetchall())
         except Exception as e:
+            failed = True
             raise QueryException(str(e)) from e
         finally:
             self._cursor.close()
             if self.get_transaction_level() <= 0:
-                self.open = 0
-                self._connection.close()
+                self.close_connection(discard=failed)
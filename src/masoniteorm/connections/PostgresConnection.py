@@ -6,14 +6,13 @@ from ..query.processors import PostgresPostProcessor
 from ..exceptions import QueryException
 
 
-CONNECTION_POOL = []
-
-
 class PostgresConnection(BaseConnection):
     """Postgres Connection class."""
 
     name = "postgres"
 
+    supports_prepared_statements = True
+
     def __init__(
         self,
         host=None,
@@ -56,9 +55,20 @@ class PostgresConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
+        self.acquire_connection()
+
+        self.enable_disable_foreign_keys()
+
+        self.open = 1
+
+        return self
+
+    def create_connection(self):
+        import psycopg2
+
         schema = self.schema or self.full_details.get("schema")
 
-        self._connection = psycopg2.connect(
+        connection = psycopg2.connect(
             database=self.database,
             user=self.user,
             password=self.password,
@@ -67,13 +77,18 @@ class PostgresConnection(BaseConnection):
             options=f"-c search_path={schema}" if schema else "",
         )
 
-        self._connection.autocommit = True
+        connection.autocommit = True
 
-        self.enable_disable_foreign_keys()
+        return connection
 
-        self.open = 1
+    def ping(self, connection):
+        if connection.closed:
+            return False
 
-        return self
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        return True
 
     def get_database_name(self):
         return self.database
@@ -101,6 +116,11 @@ class PostgresConnection(BaseConnection):
 
         self.transaction_level -= 1
 
+        if self.get_transaction_level() <= 0:
+            if self.get_pool():
+                self.close_connection()
+            self.run_transaction_callbacks()
+
     def begin(self):
         """Postgres Transaction"""
         self._connection.autocommit = False
@@ -115,6 +135,11 @@ class PostgresConnection(BaseConnection):
 
         self.transaction_level -= 1
 
+        if self.get_transaction_level() <= 0:
+            if self.get_pool():
+                self.close_connection()
+            self.run_transaction_callbacks()
+
     def get_transaction_level(self):
         """Transaction"""
         return self.transaction_level
@@ -125,6 +150,64 @@ class PostgresConnection(BaseConnection):
         self._cursor = self._connection.cursor(cursor_factory=RealDictCursor)
         return self._cursor
 
+    def get_streaming_cursor(self, amount):
+        """Opens a named (server side) cursor. Outside of a transaction the cursor is
+        declared WITH HOLD so it survives the autocommit of the DECLARE statement."""
+        from psycopg2.extras import RealDictCursor
+
+        self._streaming_cursors = getattr(self, "_streaming_cursors", 0) + 1
+        cursor = self._connection.cursor(
+            name=f"masoniteorm_cursor_{id(self)}_{self._streaming_cursors}",
+            cursor_factory=RealDictCursor,
+            withhold=self._connection.autocommit,
+        )
+        cursor.itersize = amount
+        return cursor
+
+    def compile_placeholders(self, query):
+        return query.replace("'?'", "%s")
+
+    def execute_prepared(self, statements, query, bindings):
+        """Runs a qmarked query through a statement prepared in the session with PREPARE.
+        The statement is prepared the first time its SQL text runs on the connection and
+        every later call only sends EXECUTE with the bindings.
+
+        Arguments:
+            statements {PreparedStatementCache} -- The statements prepared on the connection.
+            query {string} -- A qmarked query.
+            bindings {tuple} -- The query bindings.
+        """
+        name = statements.get(query)
+        if name is None:
+            name = statements.next_name()
+            self._cursor.execute(
+                f"PREPARE {name} AS {self.compile_prepared_placeholders(query)}"
+            )
+            for evicted in statements.put(query, name):
+                self._cursor.execute(f"DEALLOCATE {evicted}")
+
+        # Logged and passed to the listeners as the query it runs, not as EXECUTE
+        sql = self.compile_placeholders(query)
+        try:
+            if bindings:
+                placeholders = ", ".join(["%s"] * len(bindings))
+                self.statement(f"EXECUTE {name} ({placeholders})", bindings, sql=sql)
+            else:
+                self.statement(f"EXECUTE {name}", bindings, sql=sql)
+        except Exception:
+            # Prepared again on the next run, for example after the table changed
+            statements.forget(query)
+            raise
+
+    def compile_prepared_placeholders(self, query):
+        """Replaces the qmark placeholders with the numbered $1, $2, ... parameters of PREPARE."""
+        parts = query.split("'?'")
+        compiled = [parts[0]]
+        for index, part in enumerate(parts[1:], start=1):
+            compiled.append(f"${index}{part}")
+
+        return "".join(compiled)
+
     def query(self, query, bindings=(), results="*"):
         """Make the actual query that will reach the database and come back with a result.
 
@@ -139,8 +222,9 @@ class PostgresConnection(BaseConnection):
         Returns:
             dict|None -- Returns a dictionary of results or None
         """
+        failed = False
         try:
-            if self._connection.closed:
+            if not self.open or self._connection is None or self._connection.closed:
                 self.make_connection()
 
             self.set_cursor()
@@ -151,17 +235,23 @@ class PostgresConnection(BaseConnection):
                         self.statement(q, ())
                     return
 
-                query = query.replace("'?'", "%s")
-                self.statement(query, bindings)
+                statements = self.get_prepared_statements(query)
+                if statements is not None:
+                    self.execute_prepared(statements, query, bindings)
+                else:
+                    query = query.replace("'?'", "%s")
+                    self.statement(query, bindings)
+                # Selects and statements with a RETURNING clause return rows. Others, like
+                # an upsert, have nothing to fetch and psycopg2 raises when fetching
+                if cursor.description is None:
+                    return {}
                 if results == 1:
                     return dict(cursor.fetchone() or {})
                 else:
-                    if "SELECT" in cursor.statusmessage:
-                        return cursor.fetchall()
-                    return {}
+                    return cursor.fetchall()
         except Exception as e:
+            failed = True
             raise QueryException(str(e)) from e
         finally:
             if self.get_transaction_level() <= 0:
-                self.open = 0
-                self._connection.close()
+                self.close_connection(discard=failed)
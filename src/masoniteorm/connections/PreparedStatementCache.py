@@ -0,0 +1,98 @@
+from collections import OrderedDict
+
+
+class PreparedStatementCache:
+    """A least recently used cache of the statements prepared on a single raw driver connection,
+    keyed by their SQL text.
+
+    Prepared statements live in the database session so a cache belongs to exactly one raw
+    connection. Pooled connections keep their cache while they sit idle in the pool. Without a
+    pool, statements are only prepared inside a transaction, where the connection is reused.
+    Prepared statements are enabled through the "prepared_statements" key of a connection
+    in the database configuration:
+
+        "postgres": {
+            "driver": "postgres",
+            ...
+            "prepared_statements": {"max_size": 100},
+        }
+    """
+
+    def __init__(self, connection, max_size=100):
+        self.connection = connection
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._statements = OrderedDict()
+        self._prepared_count = 0
+
+    @classmethod
+    def from_config(cls, connection, config=None):
+        if not isinstance(config, dict):
+            config = {}
+
+        return cls(connection, max_size=int(config.get("max_size", 100)))
+
+    def get(self, query):
+        """Gets the prepared statement for a SQL string.
+
+        Arguments:
+            query {string} -- The SQL text of the statement.
+
+        Returns:
+            object|None -- The driver specific handle of the prepared statement.
+        """
+        statement = self._statements.get(query)
+        if statement is None:
+            self.misses += 1
+            return None
+
+        self._statements.move_to_end(query)
+        self.hits += 1
+        return statement
+
+    def put(self, query, statement):
+        """Stores a prepared statement.
+
+        Arguments:
+            query {string} -- The SQL text of the statement.
+            statement {object} -- The driver specific handle of the prepared statement.
+
+        Returns:
+            list -- The statements evicted to stay within max_size. They should be deallocated.
+        """
+        self._statements[query] = statement
+        self._statements.move_to_end(query)
+
+        evicted = []
+        while len(self._statements) > self.max_size:
+            evicted.append(self._statements.popitem(last=False)[1])
+
+        return evicted
+
+    def forget(self, query):
+        """Removes a statement, for example after executing it failed.
+
+        Returns:
+            object|None -- The removed statement.
+        """
+        return self._statements.pop(query, None)
+
+    def next_name(self, prefix="masoniteorm_stmt"):
+        """Gets a statement name that is unique on this connection."""
+        self._prepared_count += 1
+        return f"{prefix}_{self._prepared_count}"
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._statements),
+            "max_size": self.max_size,
+        }
+
+    def __len__(self):
+        return len(self._statements)
+
+    def __contains__(self, query):
+        return query in self._statements
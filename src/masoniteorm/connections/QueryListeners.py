@@ -0,0 +1,195 @@
+import logging
+from collections import Counter
+from contextvars import ContextVar
+
+_current_collector = ContextVar("masoniteorm_query_collector", default=None)
+
+
+class QueryEvent:
+    """The details of a query, passed to the query listeners.
+
+    Listeners registered to run before a query get the event before the query runs, so
+    its time and rowcount are still None.
+    """
+
+    def __init__(self, sql, bindings, connection, driver, model=None):
+        self.sql = sql
+        self.bindings = bindings
+        self.connection = connection
+        self.driver = driver
+        self.model = model
+        # The time the query took to run, in milliseconds
+        self.time = None
+        # The rows changed or returned. None when the driver does not know it.
+        self.rowcount = None
+
+    def __repr__(self):
+        return f"QueryEvent({self.sql!r}, {self.bindings!r}, time={self.time})"
+
+
+class QueryListeners:
+    """Keeps the callbacks run before and after every query of the synchronous and async
+    connections. Listeners are registered through the connection resolver:
+
+        DB.listen(lambda event: print(event.sql, event.time))
+        DB.listen(SlowQueryLogger(threshold=500))
+
+    When no listener is registered and no QueryCollector is active, queries do not build
+    events at all.
+    """
+
+    _before = []
+    _after = []
+
+    @classmethod
+    def listen(cls, callback, before=False):
+        """Registers a callback called with a QueryEvent for every query.
+
+        Arguments:
+            callback {callable} -- The listener.
+
+        Keyword Arguments:
+            before {bool} -- Whether to call the listener before the query runs instead of after. (default: {False})
+        """
+        if before:
+            cls._before.append(callback)
+        else:
+            cls._after.append(callback)
+
+    @classmethod
+    def forget(cls, callback=None):
+        """Removes a listener, or every listener when no callback is given."""
+        if callback is None:
+            cls._before.clear()
+            cls._after.clear()
+            return
+
+        for listeners in (cls._before, cls._after):
+            while callback in listeners:
+                listeners.remove(callback)
+
+    @classmethod
+    def is_listening(cls):
+        return bool(cls._before or cls._after) or _current_collector.get() is not None
+
+    @classmethod
+    def before(cls, event):
+        for listener in cls._before:
+            listener(event)
+
+    @classmethod
+    def after(cls, event):
+        collector = _current_collector.get()
+        if collector is not None:
+            collector.add(event)
+
+        for listener in cls._after:
+            listener(event)
+
+
+class SlowQueryLogger:
+    """A query listener logging a warning for every query slower than a threshold.
+
+    Arguments:
+        threshold {int|float} -- The time in milliseconds from which a query is logged.
+
+    Keyword Arguments:
+        logger {string} -- The name of the logger. (default: {"masoniteorm.connection.slow_queries"})
+    """
+
+    def __init__(self, threshold, logger="masoniteorm.connection.slow_queries"):
+        self.threshold = threshold
+        self.logger = logging.getLogger(logger)
+
+    def __call__(self, event):
+        if event.time is None or event.time < self.threshold:
+            return
+
+        self.logger.warning(
+            f"Slow query on {event.connection} took {event.time:.2f}ms: {event.sql}, {event.bindings}",
+            extra={
+                "query": event.sql,
+                "bindings": event.bindings,
+                "query_time": event.time,
+                "connection": event.connection,
+                "model": event.model.__name__ if event.model else None,
+            },
+        )
+
+
+class QueryCollector:
+    """Collects the queries run in the current thread or asyncio task, for example for the
+    duration of a request. Collectors are activated as a context manager:
+
+        with DB.collect_queries() as queries:
+            ...
+
+        queries.count, queries.time, queries.duplicates()
+    """
+
+    def __init__(self):
+        self.queries = []
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_current_collector.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_collector.reset(self._tokens.pop())
+
+    @classmethod
+    def current(cls):
+        """Gets the collector active in the current context.
+
+        Returns:
+            QueryCollector|None
+        """
+        return _current_collector.get()
+
+    def add(self, event):
+        self.queries.append(event)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def time(self):
+        """The total time of the collected queries, in milliseconds."""
+        return sum(event.time or 0 for event in self.queries)
+
+    def duplicates(self, bindings=True):
+        """Gets the queries that ran more than once.
+
+        Keyword Arguments:
+            bindings {bool} -- Whether queries only count as duplicates when their bindings are
+                the same too. Without bindings, the same SQL run for many rows points to an
+                N+1 query. (default: {True})
+
+        Returns:
+            dict -- The number of runs by SQL, or by SQL and bindings.
+        """
+        if bindings:
+            counts = Counter(
+                (event.sql, self._get_key(event.bindings)) for event in self.queries
+            )
+        else:
+            counts = Counter(event.sql for event in self.queries)
+
+        return {query: count for query, count in counts.items() if count > 1}
+
+    def _get_key(self, bindings):
+        key = tuple(bindings)
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            # Bindings holding lists, for example arrays bound by where_in
+            return repr(bindings)
+
+    def clear(self):
+        self.queries = []
+
+    def __len__(self):
+        return len(self.queries)
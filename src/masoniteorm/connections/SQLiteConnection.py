@@ -59,7 +59,15 @@ class SQLiteConnection(BaseConnection):
         if self.has_global_connection():
             return self.get_global_connection()
 
-        self._connection = sqlite3.connect(self.database, isolation_level=None)
+        # sqlite3 prepares every statement itself and keeps a per connection cache of them
+        options = {}
+        prepared = self.full_details.get("prepared_statements")
+        if isinstance(prepared, dict) and prepared.get("max_size"):
+            options["cached_statements"] = int(prepared["max_size"])
+
+        self._connection = sqlite3.connect(
+            self.database, isolation_level=None, **options
+        )
         self._connection.create_function("REGEXP", 2, regexp)
 
         self._connection.row_factory = sqlite3.Row
@@ -99,11 +107,17 @@ class SQLiteConnection(BaseConnection):
             self.open = 0
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.run_transaction_callbacks()
         return self
 
     def begin(self):
         """Sqlite Transaction"""
         self._connection.isolation_level = "DEFERRED"
+        # sqlite3 only opens the transaction before DML statements, so schema changes
+        # would be committed right away without an explicit BEGIN
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
         self.transaction_level += 1
         return self
 
@@ -116,6 +130,8 @@ class SQLiteConnection(BaseConnection):
             self.open = 0
 
         self.transaction_level -= 1
+        if self.get_transaction_level() <= 0:
+            self.run_transaction_callbacks()
         return self
 
     def get_cursor(self):
@@ -165,15 +181,3 @@ class SQLiteConnection(BaseConnection):
 
     def format_cursor_results(self, cursor_result):
         return [dict(row) for row in cursor_result]
-
-    def select_many(self, query, bindings, amount):
-        self._cursor = self._connection.cursor()
-        self.statement(query)
-        if not self.open:
-            self.make_connection()
-
-        result = self.format_cursor_results(self._cursor.fetchmany(amount))
-        while result:
-            yield result
-
-            result = self.format_cursor_results(self._cursor.fetchmany(amount))
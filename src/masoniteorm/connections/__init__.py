@@ -4,3 +4,11 @@ from .MySQLConnection import MySQLConnection
 from .PostgresConnection import PostgresConnection
 from .SQLiteConnection import SQLiteConnection
 from .MSSQLConnection import MSSQLConnection
+from .ConnectionPool import ConnectionPool
+from .ConnectionRouter import ConnectionRouter
+from .QueryListeners import QueryCollector, QueryEvent, QueryListeners, SlowQueryLogger
+from .AsyncConnectionPool import AsyncConnectionPool
+from .AsyncBaseConnection import AsyncBaseConnection
+from .AsyncSQLiteConnection import AsyncSQLiteConnection
+from .AsyncMySQLConnection import AsyncMySQLConnection
+from .AsyncPostgresConnection import AsyncPostgresConnection
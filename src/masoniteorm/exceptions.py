@@ -36,3 +36,7 @@ class MultipleRecordsFound(Exception):
 
 class InvalidArgument(Exception):
     pass
+
+
+class ConnectionPoolExhausted(Exception):
+    pass
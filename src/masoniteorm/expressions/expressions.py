@@ -58,6 +58,14 @@ class UpdateQueryExpression:
         self.update_type = update_type
 
 
+class UpsertExpression:
+    """A helper class to manage upsert expressions."""
+
+    def __init__(self, unique_by, update=None):
+        self.unique_by = list(unique_by)
+        self.update = list(update) if update is not None else None
+
+
 class BetweenExpression:
     """A helper class to manage where between expressions."""
 
@@ -1,10 +1,12 @@
 import os
+from contextlib import contextmanager
 from os import listdir
 from os.path import isfile, join
 from pydoc import locate
 
 from inflection import camelize
 
+from ..exceptions import InvalidArgument
 from ..models.MigrationModel import MigrationModel
 from ..schema import Schema
 from ..config import load_config
@@ -13,6 +15,10 @@ from timeit import default_timer as timer
 
 
 class Migration:
+    # Drivers whose schema changes can be rolled back with the rest of a transaction
+    transactional_drivers = ("sqlite", "postgres", "mssql")
+    transaction_modes = ("migration", "batch", "none")
+
     def __init__(
         self,
         connection="default",
@@ -21,15 +27,21 @@ class Migration:
         migration_directory="databases/migrations",
         config_path=None,
         schema=None,
+        transaction="migration",
     ):
         self.connection = connection
         self.migration_directory = migration_directory
         self.last_migrations_ran = []
         self.command_class = command_class
+        if transaction not in self.transaction_modes:
+            raise InvalidArgument(
+                f"Unknown migration transaction mode '{transaction}'. Use 'migration', 'batch' or 'none'."
+            )
+        self.transaction = transaction
 
         self.schema_name = schema
 
-        DB = load_config(config_path).DB
+        DB = self.resolver = load_config(config_path).DB
 
         DATABASES = DB.get_connection_details()
 
@@ -40,9 +52,14 @@ class Migration:
             schema=self.schema_name,
         )
 
-        self.migration_model = MigrationModel.on(self.connection)
+        self.migration_model = self.new_migration_model()
+
+    def new_migration_model(self):
+        migration_model = MigrationModel.on(self.connection)
         if self.schema_name:
-            self.migration_model.set_schema(self.schema_name)
+            migration_model.set_schema(self.schema_name)
+
+        return migration_model
 
     def create_table_if_not_exists(self):
         if not self.schema.has_table("migrations"):
@@ -55,7 +72,7 @@ class Migration:
 
         return False
 
-    def get_unran_migrations(self):
+    def get_migration_files(self):
         directory_path = os.path.join(os.getcwd(), self.migration_directory)
         all_migrations = [
             f.replace(".py", "")
@@ -65,12 +82,42 @@ class Migration:
             and not f.startswith(".")
         ]
         all_migrations.sort()
-        unran_migrations = []
-        database_migrations = self.migration_model.all()
-        for migration in all_migrations:
-            if migration not in database_migrations.pluck("migration"):
-                unran_migrations.append(migration)
-        return unran_migrations
+        return all_migrations
+
+    def get_migration_batches(self):
+        """Gets the batch of every migration that ran, with a single query.
+
+        Returns:
+            dict -- The batch numbers by migration name.
+        """
+        return (
+            self.migration_model.select("migration", "batch")
+            .order_by("migration_id")
+            .get()
+            .pluck("batch", "migration")
+            .all()
+        )
+
+    def get_migration_status(self):
+        """Splits the migration files into the ones that ran and the ones that did not.
+
+        Returns:
+            tuple -- The ran migrations, as dictionaries with the "migration_file" and
+                "batch" keys, and the names of the unran migrations.
+        """
+        batches = self.get_migration_batches()
+        ran = []
+        unran = []
+        for migration in self.get_migration_files():
+            if migration in batches:
+                ran.append({"migration_file": migration, "batch": batches[migration]})
+            else:
+                unran.append(migration)
+
+        return ran, unran
+
+    def get_unran_migrations(self):
+        return self.get_migration_status()[1]
 
     def get_rollback_migrations(self):
         return (
@@ -105,83 +152,121 @@ class Migration:
         return locate(f"{migration_directory}.{file_name}.{migration_name}")
 
     def get_ran_migrations(self):
-        directory_path = os.path.join(os.getcwd(), self.migration_directory)
-        all_migrations = [
-            f.replace(".py", "")
-            for f in listdir(directory_path)
-            if isfile(join(directory_path, f))
-            and f != "__init__.py"
-            and not f.startswith(".")
-        ]
-        all_migrations.sort()
-        ran = []
+        return self.get_migration_status()[0]
 
-        database_migrations = self.migration_model.all()
-        for migration in all_migrations:
-            matched_migration = database_migrations.where(
-                "migration", migration
-            ).first()
-            if matched_migration:
-                ran.append(
-                    {
-                        "migration_file": matched_migration.migration,
-                        "batch": matched_migration.batch,
-                    }
-                )
-        return ran
+    def get_transaction_mode(self, output=False):
+        """Gets how the migrations run in transactions. Drivers without transactional
+        schema changes, like MySQL, never use transactions.
+
+        Returns:
+            string|None -- "migration", "batch" or None.
+        """
+        if output or self.transaction == "none":
+            return None
+
+        if self.schema.connection_class.name not in self.transactional_drivers:
+            return None
+
+        return self.transaction
+
+    @contextmanager
+    def within_transaction(self, enabled=True):
+        if not enabled:
+            yield
+            return
+
+        with self.resolver.transaction(self.schema.connection):
+            yield
+
+    def record_migrations(self, migrations, batch):
+        """Inserts the rows of the migrations that ran with a single statement."""
+        if migrations:
+            # A new builder picks up the connection of the transaction the migrations run in
+            self.new_migration_model().bulk_create(
+                [
+                    {"batch": batch, "migration": migration.replace(".py", "")}
+                    for migration in migrations
+                ]
+            )
 
     def migrate(self, migration="all", output=False):
         default_migrations = self.get_unran_migrations()
         migrations = default_migrations if migration == "all" else [migration]
 
         batch = self.get_last_batch_number() + 1
+        transaction = self.get_transaction_mode(output)
+        ran = []
 
-        for migration in migrations:
-            try:
-                migration_class = self.locate(migration)
+        with self.within_transaction(transaction == "batch"):
+            for migration in migrations:
+                if self.run_migration(migration, batch, transaction, output):
+                    ran.append(migration)
 
-            except TypeError:
-                self.command_class.line(f"<error>Not Found: {migration}</error>")
-                continue
+            if transaction == "batch":
+                self.record_migrations(ran, batch)
 
-            self.last_migrations_ran.append(migration)
-            if self.command_class:
-                self.command_class.line(
-                    f"<comment>Migrating:</comment> <question>{migration}</question>"
-                )
+    def run_migration(self, migration, batch, transaction=None, output=False):
+        """Runs the up method of a migration.
 
-            migration_class = migration_class(
-                connection=self.connection, schema=self.schema_name
+        Arguments:
+            migration {string} -- The name of the migration file.
+            batch {int} -- The batch number the migration is recorded with.
+
+        Keyword Arguments:
+            transaction {string|None} -- The transaction mode of get_transaction_mode(). (default: {None})
+            output {bool} -- Whether to show the SQL instead of running it. (default: {False})
+
+        Returns:
+            bool -- Whether the migration ran and still has to be recorded with its batch.
+        """
+        try:
+            migration_class = self.locate(migration)
+
+        except TypeError:
+            self.command_class.line(f"<error>Not Found: {migration}</error>")
+            return False
+
+        self.last_migrations_ran.append(migration)
+        if self.command_class:
+            self.command_class.line(
+                f"<comment>Migrating:</comment> <question>{migration}</question>"
             )
 
-            if output:
-                migration_class.schema.dry()
-            start = timer()
-            migration_class.up()
-            duration = "{:.2f}".format(timer() - start)
+        migration_class = migration_class(
+            connection=self.connection, schema=self.schema_name
+        )
 
-            if output:
-                if self.command_class:
-                    table = self.command_class.table()
-                    table.set_header_row(["SQL"])
-                    sql = migration_class.schema._blueprint.to_sql()
-                    if isinstance(sql, list):
-                        sql = ",".join(sql)
-                    table.set_rows([[sql]])
-                    table.render(self.command_class.io)
-                    continue
-                else:
-                    print(migration_class.schema._blueprint.to_sql())
+        if output:
+            migration_class.schema.dry()
+        start = timer()
+        with self.within_transaction(transaction == "migration"):
+            migration_class.up()
+            if transaction != "batch" and not output:
+                # The row is inserted in the same transaction as the schema changes. Without
+                # a transaction it is inserted right away, as the changes are already applied
+                self.record_migrations([migration], batch)
+        duration = "{:.2f}".format(timer() - start)
 
+        if output:
             if self.command_class:
-                self.command_class.line(
-                    f"<info>Migrated:</info> <question>{migration}</question> ({duration}s)"
-                )
+                table = self.command_class.table()
+                table.set_header_row(["SQL"])
+                sql = migration_class.schema._blueprint.to_sql()
+                if isinstance(sql, list):
+                    sql = ",".join(sql)
+                table.set_rows([[sql]])
+                table.render(self.command_class.io)
+                return False
+            else:
+                print(migration_class.schema._blueprint.to_sql())
 
-            self.migration_model.create(
-                {"batch": batch, "migration": migration.replace(".py", "")}
+        if self.command_class:
+            self.command_class.line(
+                f"<info>Migrated:</info> <question>{migration}</question> ({duration}s)"
             )
 
+        return transaction == "batch"
+
     def rollback(self, migration="all", output=False):
         default_migrations = self.get_rollback_migrations()
         migrations = default_migrations if migration == "all" else [migration]
@@ -14,9 +14,25 @@ from ..collection import Collection
 from ..config import load_config
 from ..exceptions import ModelNotFound
 from ..observers import ObservesEvents
-from ..query import QueryBuilder
+from ..query import AsyncQueryBuilder, IdentityMap, QueryBuilder
 from ..scopes import TimeStampsMixin
 
+logger = logging.getLogger("masoniteorm.models.hydrate")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Cast values of these types cannot be changed in place, so they are safe to reuse
+IMMUTABLE_CAST_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    datetimedate,
+    datetimetime,
+    type(None),
+)
+
 """This is a magic class that will help using models like User.first() instead of having to instatiate a class like
 User().first()
 """
@@ -46,6 +62,10 @@ class ModelMeta(type):
         return getattr(instantiated, attribute)
 
 
+# Values of these types are serialized as they are
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None), dict, list))
+
+
 class BoolCast:
     """Casts a value to a boolean"""
 
@@ -177,6 +197,8 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "bulk_create",
             "chunk",
             "count",
+            "cursor",
+            "cursor_paginate",
             "decrement",
             "delete",
             "distinct",
@@ -206,6 +228,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "join",
             "joins",
             "last",
+            "lazy",
             "left_join",
             "limit",
             "lock_for_update",
@@ -222,6 +245,8 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "order_by_raw",
             "order_by",
             "paginate",
+            "prepared",
+            "remember",
             "right_join",
             "select_raw",
             "select",
@@ -238,6 +263,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             "to_sql",
             "truncate",
             "update",
+            "upsert",
             "when",
             "where_between",
             "where_column",
@@ -282,15 +308,82 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     }
 
     def __init__(self):
-        self.__attributes__ = {}
-        self.__original_attributes__ = {}
-        self.__dirty_attributes__ = {}
-        if not hasattr(self, "__appends__"):
-            self.__appends__ = []
-        self._relationships = {}
-        self._global_scopes = {}
+        # Write straight to the instance dictionary. This runs for every hydrated row so
+        # it avoids the __setattr__ accessor and cast lookups. The query builder is
+        # created (and the model booted) lazily the first time it is needed.
+        self._get_class_metadata()
+        attributes = self.__dict__
+        attributes["__attributes__"] = {}
+        attributes["__original_attributes__"] = {}
+        attributes["__dirty_attributes__"] = {}
+        if not any("__appends__" in base.__dict__ for base in self.__class__.__mro__):
+            attributes["__appends__"] = []
+        attributes["_relationships"] = {}
+        attributes["_global_scopes"] = {}
+        attributes["_cast_values"] = {}
 
-        self.boot()
+    @classmethod
+    def _get_class_metadata(cls):
+        """Gets the metadata that only depends on the model class. This is computed once per
+        model class and shared by all of its instances.
+
+        Returns:
+            dict
+        """
+        metadata = cls.__dict__.get("__class_metadata__")
+        if metadata is not None:
+            return metadata
+
+        boot_methods = []
+        for base_class in inspect.getmro(cls):
+            class_name = base_class.__name__
+
+            if class_name.endswith("Mixin"):
+                boot_methods.append("boot_" + class_name)
+            elif (
+                base_class != Model
+                and issubclass(base_class, Model)
+                and "__fillable__" in base_class.__dict__
+                and "__guarded__" in base_class.__dict__
+            ):
+                raise AttributeError(
+                    f"{cls.__name__} must specify either __fillable__ or __guarded__ properties, but not both."
+                )
+
+        cast_map = dict(cls.__internal_cast_map__)
+        cast_map.update(cls.__cast_map__)
+
+        # Accessors are only looked up on the model class itself while mutators may be
+        # inherited, which matches how they were resolved on every attribute access.
+        accessors = {
+            name[4:-10]: function
+            for name, function in cls.__dict__.items()
+            if name.startswith("get_")
+            and name.endswith("_attribute")
+            and len(name) > 14
+        }
+        mutators = {
+            name[4:-10]: name
+            for name in dir(cls)
+            if name.startswith("set_")
+            and name.endswith("_attribute")
+            and len(name) > 14
+        }
+
+        dates = cls.__dates__ + [cls.date_created_at, cls.date_updated_at]
+        metadata = {
+            "boot_methods": boot_methods,
+            "cast_map": cast_map,
+            "casters": {},
+            "dates": dates,
+            "date_set": frozenset(dates),
+            "accessors": accessors,
+            "mutators": mutators,
+            "serializers": {},
+        }
+        cls.__class_metadata__ = metadata
+
+        return metadata
 
     @classmethod
     def get_primary_key(self):
@@ -341,11 +434,37 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
     def query(self):
         return self.get_builder()
 
+    @classmethod
+    def async_query(cls):
+        """Gets a query builder for this model whose queries run on an asyncio connection:
+
+            users = await User.async_query().where("active", 1).get()
+
+        Returns:
+            AsyncQueryBuilder
+        """
+        model = cls()
+        model.boot()
+
+        builder = AsyncQueryBuilder(
+            connection=model.__connection__,
+            table=model.get_table_name(),
+            connection_details=model.get_connection_details(),
+            model=model,
+            scopes=model._scopes.get(cls),
+            dry=model.__dry__,
+        )
+        for boot_method in model._get_class_metadata()["boot_methods"]:
+            getattr(model, boot_method)(builder)
+
+        return builder.select(*model.__selects__)
+
     def get_builder(self):
-        if hasattr(self, "builder"):
-            return self.builder
+        builder = self.__dict__.get("builder")
+        if builder is not None:
+            return builder
 
-        self.builder = QueryBuilder(
+        builder = QueryBuilder(
             connection=self.__connection__,
             table=self.get_table_name(),
             connection_details=self.get_connection_details(),
@@ -353,12 +472,24 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             scopes=self._scopes.get(self.__class__),
             dry=self.__dry__,
         )
+        self.__dict__["builder"] = builder
+        self.boot()
 
-        return self.builder.select(*self.__selects__)
+        return builder.select(*self.__selects__)
 
     @classmethod
     def get_columns(cls):
-        return list(cls.first().__attributes__.keys())
+        """Gets the column names of the model's table from the database schema, without
+        fetching a row.
+
+        The columns are cached in SchemaCache for the life of the process. Set the "schema_cache"
+        option of the connection to {"ttl": seconds} to expire them, or to False to read them from
+        the database every time. Call SchemaCache.flush() after changing the table outside of Schema.
+
+        Returns:
+            list
+        """
+        return list(cls.builder.get_table_columns().keys())
 
     def get_connection_details(self):
         DB = load_config().DB
@@ -366,26 +497,15 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
     def boot(self):
         if not self._booted:
+            self._booted = True
             self.observe_events(self, "booting")
-            for base_class in inspect.getmro(self.__class__):
-                class_name = base_class.__name__
-
-                if class_name.endswith("Mixin"):
-                    getattr(self, "boot_" + class_name)(self.get_builder())
-                elif (
-                    base_class != Model
-                    and issubclass(base_class, Model)
-                    and "__fillable__" in base_class.__dict__
-                    and "__guarded__" in base_class.__dict__
-                ):
-                    raise AttributeError(
-                        f"{type(self).__name__} must specify either __fillable__ or __guarded__ properties, but not both."
-                    )
+            builder = self.get_builder()
+            for boot_method in self._get_class_metadata()["boot_methods"]:
+                getattr(self, boot_method)(builder)
 
-            self._booted = True
             self.observe_events(self, "booted")
 
-            self.append_passthrough(list(self.get_builder()._macros.keys()))
+            self.append_passthrough(list(builder._macros.keys()))
 
     def append_passthrough(self, passthrough):
         self.__passthrough__.update(passthrough)
@@ -478,32 +598,19 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             return None
 
         if isinstance(result, (list, tuple)):
-            response = []
-            for element in result:
-                response.append(cls.hydrate(element))
-            return cls.new_collection(response)
+            return cls.new_collection(cls.hydrate_many(result))
 
         elif isinstance(result, dict):
-            model = cls()
-            dic = {}
-            for key, value in result.items():
-                if key in model.get_dates() and value:
-                    value = model.get_new_date(value)
-                dic.update({key: value})
-
-            logger = logging.getLogger("masoniteorm.models.hydrate")
-            logger.setLevel(logging.INFO)
-            logger.propagate = False
             logger.info(
                 f"Hydrating Model {cls.__name__}",
                 extra={"class_name": cls.__name__, "class_module": cls.__module__},
             )
 
-            model.observe_events(model, "hydrating")
-            model.__attributes__.update(dic or {})
-            model.__original_attributes__.update(dic or {})
-            model.add_relation(relations)
-            model.observe_events(model, "hydrated")
+            identity_map = IdentityMap.current()
+            model = cls._get_identity(identity_map, result) or cls()
+            model._hydrate_row(result, model.get_dates(), relations)
+            if identity_map is not None:
+                identity_map.add(model)
             return model
 
         elif hasattr(result, "serialize"):
@@ -519,6 +626,79 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             model.observe_events(model, "hydrated")
             return model
 
+    @classmethod
+    def hydrate_many(cls, results):
+        """Hydrates a list of results into a list of models.
+
+        Unlike calling hydrate for each row, the per class work (date columns, logging)
+        is done once for the whole list and no query builder is created per model.
+
+        Args:
+            results (list): A list of dictionaries or serializable objects.
+
+        Returns:
+            list
+        """
+        if not results:
+            return []
+
+        logger.info(
+            f"Hydrating {len(results)} {cls.__name__} models",
+            extra={"class_name": cls.__name__, "class_module": cls.__module__},
+        )
+
+        models = []
+        dates = None
+        identity_map = IdentityMap.current()
+        for element in results:
+            if not isinstance(element, dict):
+                models.append(cls.hydrate(element))
+                continue
+
+            model = cls._get_identity(identity_map, element) or cls()
+            if dates is None:
+                # Rows of a result share their columns so the date columns are found once
+                dates = [
+                    column
+                    for column in cls._get_class_metadata()["dates"]
+                    if column in element
+                ]
+
+            models.append(model._hydrate_row(element, dates))
+            if identity_map is not None:
+                identity_map.add(model)
+
+        return models
+
+    @classmethod
+    def _get_identity(cls, identity_map, row):
+        """Gets the instance already loaded for a row when an identity map is active.
+        The row is hydrated into that instance so it reflects the database again."""
+        if identity_map is None:
+            return None
+
+        return identity_map.get(cls, row.get(cls.get_primary_key()))
+
+    def _hydrate_row(self, row, dates, relations=None):
+        attributes = dict(row)
+        for key in dates:
+            value = attributes.get(key)
+            if value:
+                attributes[key] = self.get_new_date(value)
+
+        self.observe_events(self, "hydrating")
+        instance = self.__dict__
+        if not instance["__attributes__"] and not instance["__original_attributes__"]:
+            instance["__attributes__"] = attributes
+            instance["__original_attributes__"] = dict(attributes)
+        else:
+            instance["__attributes__"].update(attributes)
+            instance["__original_attributes__"].update(attributes)
+        if relations:
+            self.add_relation(relations)
+        self.observe_events(self, "hydrated")
+        return self
+
     def fill(self, attributes):
         self.__attributes__.update(attributes)
         return self
@@ -573,13 +753,12 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         If no registered caster exists, returns the unmodified value.
         """
         cast_method = cls.__casts__.get(attribute)
-        cast_map = cls.get_cast_map(cls)
 
         if value is None:
             return None
 
         if isinstance(cast_method, str):
-            return cast_map[cast_method]().set(value)
+            return cls._get_caster(cast_method).set(value)
 
         if cast_method:
             return cast_method(value)
@@ -607,8 +786,6 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         Returns:
             dict
         """
-        serialized_dictionary = self.__attributes__.copy()
-
         # prevent using both exclude and include at the same time
         if exclude is not None and include is not None:
             raise AttributeError("Can not define both includes and exclude values.")
@@ -625,56 +802,136 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
                 f"class model '{self.__class__.__name__}' defines both __visible__ and __hidden__."
             )
 
-        if self.__visible__:
-            new_serialized_dictionary = {
-                k: serialized_dictionary[k]
-                for k in self.__visible__
-                if k in serialized_dictionary
-            }
-            serialized_dictionary = new_serialized_dictionary
-        else:
-            for key in self.__hidden__:
-                if key in serialized_dictionary:
-                    serialized_dictionary.pop(key)
-
-        for date_column in self.get_dates():
-            if (
-                date_column in serialized_dictionary
-                and serialized_dictionary[date_column]
-            ):
-                serialized_dictionary[date_column] = self.get_new_serialized_date(
-                    serialized_dictionary[date_column]
-                )
+        return self._get_serializer(tuple(self.__hidden__), tuple(self.__visible__))(
+            self
+        )
 
-        serialized_dictionary.update(self.__dirty_attributes__)
+    def get_serialized_attribute(self, key):
+        """Gets a single attribute the way it is serialized, without serializing the whole model.
 
-        # The builder is inside the attributes but should not be serialized
-        if "builder" in serialized_dictionary:
-            serialized_dictionary.pop("builder")
+        Arguments:
+            key {string} -- The attribute, relationship or appended attribute.
 
-        # Serialize relationships as well
-        serialized_dictionary.update(self.relations_to_dict())
+        Raises:
+            KeyError: When the attribute is not part of the serialized model.
 
-        for append in self.__appends__:
-            serialized_dictionary.update({append: getattr(self, append)})
+        Returns:
+            mixed
+        """
+        return self._get_attribute_serializer(
+            tuple(self.__hidden__), tuple(self.__visible__)
+        )(self, key)
 
-        remove_keys = []
-        for key, value in serialized_dictionary.items():
-            if key in self.__hidden__:
-                remove_keys.append(key)
-            if hasattr(value, "serialize"):
-                value = value.serialize(self.__relationship_hidden__.get(key, []))
-            if isinstance(value, datetime):
-                value = self.get_new_serialized_date(value)
-            if key in self.__casts__:
-                value = self._cast_attribute(key, value)
+    @classmethod
+    def _get_serializer(cls, hidden, visible):
+        """Gets the function serializing the models of this class for the given hidden or
+        visible attributes. The function is compiled once per class and attribute lists.
+
+        Arguments:
+            hidden {tuple} -- The attributes left out of the dictionary.
+            visible {tuple} -- The only attributes put in the dictionary, if any.
+
+        Returns:
+            callable -- Called with a model and returns its dictionary.
+        """
+        return cls._compile_serializers(hidden, visible)[0]
+
+    @classmethod
+    def _get_attribute_serializer(cls, hidden, visible):
+        """Gets the function serializing a single attribute of the models of this class, the
+        same way serialize() would without building the whole dictionary.
 
-            serialized_dictionary.update({key: value})
+        Arguments:
+            hidden {tuple} -- The attributes left out of the dictionary.
+            visible {tuple} -- The only attributes put in the dictionary, if any.
+
+        Returns:
+            callable -- Called with a model and a key. Raises KeyError when serialize() would
+                leave the key out of the dictionary.
+        """
+        return cls._compile_serializers(hidden, visible)[1]
+
+    @classmethod
+    def _compile_serializers(cls, hidden, visible):
+        serializers = cls._get_class_metadata()["serializers"]
+        compiled = serializers.get((hidden, visible))
+        if compiled is not None:
+            return compiled
+
+        key = (hidden, visible)
+        hidden = frozenset(hidden) | {"builder"}
+        dates = cls._get_class_metadata()["date_set"]
+        casts = cls.__casts__
+        relationship_hidden = cls.__relationship_hidden__
+
+        def serialize_value(model, key, value):
+            if type(value) not in _SCALAR_TYPES:
+                if hasattr(value, "serialize"):
+                    value = value.serialize(relationship_hidden.get(key, []))
+                if isinstance(value, datetime):
+                    value = model.get_new_serialized_date(value)
+            if key in casts:
+                value = model._cast_attribute(key, value)
+
+            return value
+
+        def serialize(model):
+            attributes = model.__attributes__
+            if visible:
+                columns = [key for key in visible if key in attributes]
+            else:
+                columns = [key for key in attributes if key not in hidden]
+
+            serialized = {}
+            for key in columns:
+                value = attributes[key]
+                if value and key in dates:
+                    value = model.get_new_serialized_date(value)
+                serialized[key] = serialize_value(model, key, value)
+
+            for key, value in model.__dirty_attributes__.items():
+                if key not in hidden:
+                    serialized[key] = serialize_value(model, key, value)
+
+            for key, value in model.relations_to_dict().items():
+                if key not in hidden:
+                    serialized[key] = serialize_value(model, key, value)
+
+            for append in model.__appends__:
+                if append not in hidden:
+                    serialized[append] = serialize_value(
+                        model, append, getattr(model, append)
+                    )
 
-        for key in remove_keys:
-            serialized_dictionary.pop(key)
+            return serialized
 
-        return serialized_dictionary
+        def serialize_attribute(model, key):
+            # The later sections of serialize() win, so they are looked up first
+            if key in hidden:
+                raise KeyError(key)
+
+            if key in model.__appends__:
+                return serialize_value(model, key, getattr(model, key))
+
+            if key in model._relationships:
+                return serialize_value(
+                    model, key, model._serialize_relation(model._relationships[key])
+                )
+
+            if key in model.__dirty_attributes__:
+                return serialize_value(model, key, model.__dirty_attributes__[key])
+
+            attributes = model.__attributes__
+            if key not in attributes or (visible and key not in visible):
+                raise KeyError(key)
+
+            value = attributes[key]
+            if value and key in dates:
+                value = model.get_new_serialized_date(value)
+            return serialize_value(model, key, value)
+
+        serializers[key] = (serialize, serialize_attribute)
+        return serializers[key]
 
     def to_json(self):
         """Converts a model to JSON
@@ -720,24 +977,21 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         Returns:
             [type]: [description]
         """
-        new_dic = {}
-        for key, value in self._relationships.items():
-            if value == {}:
-                new_dic.update({key: {}})
-            else:
-                if value is None:
-                    new_dic.update({key: {}})
-                    continue
-                elif isinstance(value, list):
-                    value = Collection(value).serialize()
-                elif isinstance(value, dict):
-                    pass
-                else:
-                    value = value.serialize()
-
-                new_dic.update({key: value})
+        return {
+            key: self._serialize_relation(value)
+            for key, value in self._relationships.items()
+        }
+
+    @staticmethod
+    def _serialize_relation(value):
+        if value is None or value == {}:
+            return {}
+        elif isinstance(value, list):
+            return Collection(value).serialize()
+        elif isinstance(value, dict):
+            return value
 
-        return new_dic
+        return value.serialize()
 
     def touch(self, date=None, query=True):
         """Updates the current timestamps on the model"""
@@ -770,28 +1024,24 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
             mixed: Could be anything that a method can return.
         """
 
-        new_name_accessor = "get_" + attribute + "_attribute"
-
-        if (new_name_accessor) in self.__class__.__dict__:
-            return self.__class__.__dict__.get(new_name_accessor)(self)
+        metadata = self._get_class_metadata()
+        accessor = metadata["accessors"].get(attribute)
+        if accessor is not None:
+            return accessor(self)
 
-        if (
-            "__dirty_attributes__" in self.__dict__
-            and attribute in self.__dict__["__dirty_attributes__"]
-        ):
+        instance = self.__dict__
+        dirty_attributes = instance.get("__dirty_attributes__")
+        if dirty_attributes and attribute in dirty_attributes:
             return self.get_dirty_value(attribute)
 
-        if (
-            "__attributes__" in self.__dict__
-            and attribute in self.__dict__["__attributes__"]
-        ):
-            if attribute in self.get_dates():
-                return (
-                    self.get_new_date(self.get_value(attribute))
-                    if self.get_value(attribute)
-                    else None
-                )
-            return self.get_value(attribute)
+        attributes = instance.get("__attributes__")
+        if attributes is not None and attribute in attributes:
+            if attribute in self.__casts__ or attribute in metadata["date_set"]:
+                return self._get_cast_value(attribute)
+            return attributes[attribute]
+
+        if attribute == "builder":
+            return self.get_builder()
 
         if attribute in self.__passthrough__:
 
@@ -828,14 +1078,15 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return results
 
     def __setattr__(self, attribute, value):
-        if hasattr(self, "set_" + attribute + "_attribute"):
-            method = getattr(self, "set_" + attribute + "_attribute")
-            value = method(value)
+        metadata = self._get_class_metadata()
+        mutator = metadata["mutators"].get(attribute)
+        if mutator is not None:
+            value = getattr(self, mutator)(value)
 
         if attribute in self.__casts__:
             value = self._set_cast_attribute(attribute, value)
 
-        if attribute in self.get_dates():
+        if attribute in metadata["date_set"]:
             value = self.get_new_datetime_string(value)
 
         try:
@@ -917,6 +1168,31 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
         return value
 
+    def _get_cast_value(self, attribute):
+        """Gets the cast value of an attribute. Immutable values, like dates, are cast once
+        and reused until the raw attribute changes. Mutable values, like the dict of a json
+        cast, are cast on every read so changing them never changes later reads.
+
+        Arguments:
+            attribute {string} -- The name of an attribute with a cast or a date attribute.
+
+        Returns:
+            mixed
+        """
+        raw_value = self.__attributes__[attribute]
+        cast_values = self.__dict__.setdefault("_cast_values", {})
+        cached = cast_values.get(attribute)
+        if cached is not None and cached[0] is raw_value:
+            return cached[1]
+
+        value = self.get_value(attribute)
+        if attribute in self._get_class_metadata()["date_set"]:
+            value = self.get_new_date(value) if value else None
+
+        if isinstance(value, IMMUTABLE_CAST_TYPES):
+            cast_values[attribute] = (raw_value, value)
+        return value
+
     def all_attributes(self):
         attributes = self.__attributes__
         attributes.update(self.get_dirty_attributes())
@@ -939,31 +1215,35 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
         return self.__dirty_attributes__ or {}
 
     def get_cast_map(self):
-        cast_map = self.__internal_cast_map__
-        cast_map.update(self.__cast_map__)
-        return cast_map
+        return self._get_class_metadata()["cast_map"]
 
     def _cast_attribute(self, attribute, value):
-        cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
-
         if value is None:
             return None
 
+        cast_method = self.__casts__[attribute]
         if isinstance(cast_method, str):
-            return cast_map[cast_method]().get(value)
+            return self._get_caster(cast_method).get(value)
 
         return cast_method(value)
 
     def _set_cast_attribute(self, attribute, value):
         cast_method = self.__casts__[attribute]
-        cast_map = self.get_cast_map()
-
         if isinstance(cast_method, str):
-            return cast_map[cast_method]().set(value)
+            return self._get_caster(cast_method).set(value)
 
         return cast_method(value)
 
+    @classmethod
+    def _get_caster(cls, name):
+        """Gets the instance of a cast class from the cast map, created once per model class."""
+        casters = cls._get_class_metadata()["casters"]
+        caster = casters.get(name)
+        if caster is None:
+            caster = casters[name] = cls.get_cast_map(cls)[name]()
+
+        return caster
+
     @classmethod
     def load(cls, *loads):
         cls.boot()
@@ -979,9 +1259,7 @@ class Model(TimeStampsMixin, ObservesEvents, metaclass=ModelMeta):
 
         :rtype: list
         """
-        defaults = [self.date_created_at, self.date_updated_at]
-
-        return self.__dates__ + defaults
+        return self._get_class_metadata()["dates"]
 
     def get_new_date(self, _datetime=None):
         """
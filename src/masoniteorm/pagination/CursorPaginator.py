@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import date, datetime
+
+from ..exceptions import InvalidArgument
+from .BasePaginator import BasePaginator
+
+
+class CursorPaginator(BasePaginator):
+    def __init__(
+        self, result, per_page, cursor=None, next_cursor=None, previous_cursor=None
+    ):
+        self.result = result
+        self.per_page = per_page
+        self.count = len(self.result)
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def serialize(self, *args, **kwargs):
+        return {
+            "data": self.result.serialize(*args, **kwargs),
+            "meta": {
+                "per_page": self.per_page,
+                "count": self.count,
+                "cursor": self.cursor,
+                "next_cursor": self.next_cursor,
+                "previous_cursor": self.previous_cursor,
+            },
+        }
+
+    def has_more_pages(self):
+        return self.next_cursor is not None
+
+    @staticmethod
+    def encode_cursor(values, previous=False):
+        """Encodes the values of the ordered columns of a record into an opaque cursor string.
+
+        Arguments:
+            values {dict} -- The ordered column names and their values.
+
+        Keyword Arguments:
+            previous {bool} -- Whether the cursor points to the records before this record. (default: {False})
+
+        Returns:
+            str
+        """
+        payload = {
+            "values": {
+                column: CursorPaginator._format_value(value)
+                for column, value in values.items()
+            },
+            "previous": previous,
+        }
+        return base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        ).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Decodes a cursor created by encode_cursor.
+
+        Raises:
+            InvalidArgument: When the cursor is not valid.
+
+        Returns:
+            dict -- A dictionary with the "values" and "previous" keys.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError, AttributeError):
+            raise InvalidArgument(f"The pagination cursor '{cursor}' is not valid.")
+
+        if not isinstance(payload, dict) or not isinstance(payload.get("values"), dict):
+            raise InvalidArgument(f"The pagination cursor '{cursor}' is not valid.")
+
+        return payload
+
+    @staticmethod
+    def _format_value(value):
+        # Dates are stored the way databases compare them as strings
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None).isoformat(" ")
+        if isinstance(value, date):
+            return value.isoformat()
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+
+        return str(value)
@@ -0,0 +1,747 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from ..config import load_config
+from ..connections.ConnectionRouter import ConnectionRouter
+from ..exceptions import HTTP404, ModelNotFound, MultipleRecordsFound
+from ..pagination import LengthAwarePaginator, SimplePaginator
+from .QueryBuilder import QueryBuilder
+
+
+class AsyncQueryBuilder(QueryBuilder):
+    """A query builder that runs its queries through an asyncio connection.
+
+    Building queries works exactly like the QueryBuilder and uses the same grammars.
+    The methods that reach the database are coroutines and streaming methods are
+    async generators:
+
+        users = await builder.table("users").where("active", 1).get()
+
+        async for user in builder.table("users").cursor():
+            ...
+
+    Eager loaded relationships are resolved by the relationships' synchronous
+    query builders on a worker thread so they do not block the event loop.
+    """
+
+    def on(self, connection):
+        super().on(connection)
+
+        DB = load_config(self.config_path).DB
+        self.connection_class = DB.connection_factory.make_async(
+            self._connection_driver
+        )
+
+        return self
+
+    def new_connection(self, write=None):
+        """Gets the async connection of this builder. The connection is opened lazily by its first query.
+
+        Keyword Arguments:
+            write {bool|None} -- Whether the connection is used to write. Defaults to
+                whether the query being built writes. (default: {None})
+
+        Returns:
+            masoniteorm.connections.AsyncBaseConnection
+        """
+        if write is None:
+            write = self._is_write()
+
+        if write:
+            ConnectionRouter.record_write(self.connection)
+
+        if self._connection and (
+            self._writes or not write or self._connection.get_transaction_level() > 0
+        ):
+            return self._connection.set_model(self._model)
+
+        self._writes = write or not ConnectionRouter.is_routed(
+            self._connection_details.get(self.connection, {})
+        )
+        self._connection = self.connection_class(
+            **self.get_connection_information(write=write), name=self.connection
+        ).set_schema(self._schema)
+        return self._connection.set_model(self._model)
+
+    async def begin(self):
+        """Begins a transaction on the builder's connection. Every query of this builder
+        runs on the same connection until the transaction is committed or rolled back.
+        """
+        return await self.new_connection(write=True).begin()
+
+    async def commit(self):
+        connection = self.new_connection()
+        await connection.commit()
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+        return connection
+
+    async def rollback(self):
+        connection = self.new_connection()
+        await connection.rollback()
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+        return connection
+
+    async def _query(self, query, bindings, results="*"):
+        connection = self.new_connection()
+        result = await connection.query(query, bindings, results=results)
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+
+        return result, connection
+
+    async def prepare_result_async(self, result, collection=False):
+        """Hydrates a result. Eager loads run on a worker thread because the related queries are synchronous."""
+        if self._model and result and self._has_eagers():
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.prepare_result, result, collection
+            )
+
+        return self.prepare_result(result, collection=collection)
+
+    async def statement(self, query, bindings=None):
+        if bindings is None:
+            bindings = []
+        result, _ = await self._query(query, bindings)
+        return self.prepare_result(result)
+
+    async def get(self, selects=[]):
+        """Runs the select query built from the query builder.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+        result = await self._run_select()
+
+        return await self.prepare_result_async(result, collection=True)
+
+    async def all(self, selects=[], query=False):
+        """Returns all records from the table.
+
+        Returns:
+            Collection
+        """
+        self.select(*selects)
+        if query:
+            return self.to_sql()
+
+        result = await self._run_select()
+
+        return await self.prepare_result_async(result or [], collection=True)
+
+    async def _run_select(self, results="*"):
+        tags = self._get_cache_tags() if self._remember else None
+        queries = self._to_qmark_chunks()
+
+        if tags is not None:
+            ttl, key = self._remember
+            key = key or self.query_cache.make_key(self.connection, queries, results)
+            result = self.query_cache.get(key, tags)
+            if result is not None:
+                return result
+
+        if len(queries) == 1:
+            result, connection = await self._query(*queries[0], results=results)
+        else:
+            result = []
+            for query, bindings in queries:
+                rows, connection = await self._query(query, bindings)
+                result += rows or []
+
+        # Rows read inside a transaction may never be committed
+        if (
+            tags is not None
+            and result is not None
+            and connection.get_transaction_level() <= 0
+        ):
+            self.query_cache.put(key, tags, result, ttl)
+
+        return result
+
+    async def first(self, fields=None, query=False):
+        """Gets the first record.
+
+        Returns:
+            Model|dict|None
+        """
+        if fields:
+            self.select(fields)
+
+        if query:
+            return self.limit(1)
+
+        identity = self._get_identity()
+        if identity is not None:
+            return identity
+
+        result = await self.limit(1)._run_select(results=1)
+
+        return await self.prepare_result_async(result)
+
+    async def first_where(self, column, *args):
+        """Gets the first record with the given key / value pair"""
+        if not args:
+            return await self.where_not_null(column).first()
+        return await self.where(column, *args).first()
+
+    async def first_or_fail(self, query=False):
+        if query:
+            return self.limit(1)
+
+        result = await self.first()
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def last(self, column=None, query=False):
+        """Gets the last record, ordered by column in descendant order or primary
+        key if no column is given.
+
+        Returns:
+            Model|dict|None
+        """
+        _column = column if column else self._model.get_primary_key()
+        if query:
+            return self.limit(1).order_by(_column, direction="DESC")
+
+        result, _ = await self._query(
+            self.limit(1).order_by(_column, direction="DESC").to_qmark(),
+            self._bindings,
+            results=1,
+        )
+
+        return await self.prepare_result_async(result)
+
+    async def find(self, record_id):
+        """Finds a row by the primary key ID. Requires a model
+
+        Arguments:
+            record_id {int} -- The ID of the primary key to fetch.
+
+        Returns:
+            Model|None
+        """
+        return await self.where(self._model.get_primary_key(), record_id).first()
+
+    async def find_or_fail(self, record_id):
+        result = await self.find(record_id)
+
+        if not result:
+            raise ModelNotFound()
+
+        return result
+
+    async def find_or_404(self, record_id):
+        try:
+            return await self.find_or_fail(record_id)
+        except ModelNotFound:
+            raise HTTP404()
+
+    async def sole(self, query=False):
+        """Gets the only record matching a given criteria."""
+        result = await self.take(2).get()
+
+        if result.is_empty():
+            raise ModelNotFound()
+
+        if result.count() > 1:
+            raise MultipleRecordsFound()
+
+        return result.first()
+
+    async def sole_value(self, column: str, query=False):
+        return (await self.sole())[column]
+
+    async def value(self, column: str):
+        return (await self.get()).first()[column]
+
+    async def first_or_create(self, wheres, creates: dict = None):
+        """Get the first record matching the attributes or create it.
+
+        Returns:
+            Model
+        """
+        if creates is None:
+            creates = {}
+
+        record = await self.where(wheres).first()
+        if record:
+            return record
+
+        total = {}
+        total.update(creates)
+        total.update(wheres)
+        total.update(self._creates_related)
+
+        return await self.create(total, id_key=self.get_primary_key())
+
+    async def paginate(self, per_page, page=1):
+        new_from_builder = self._new_total_builder()
+
+        result = (
+            await self.limit(per_page)
+            .offset(self._get_page_offset(per_page, page))
+            .get()
+        )
+        total = await new_from_builder.count()
+
+        return LengthAwarePaginator(result, per_page, page, total)
+
+    async def simple_paginate(self, per_page, page=1):
+        result = (
+            await self.limit(per_page)
+            .offset(self._get_page_offset(per_page, page))
+            .get()
+        )
+
+        return SimplePaginator(result, per_page, page)
+
+    async def cursor_paginate(self, per_page, cursor=None):
+        """Paginates the records by seeking past the record of a cursor instead of
+        counting and offsetting rows. See QueryBuilder.cursor_paginate.
+
+        Returns:
+            CursorPaginator
+        """
+        orders, payload, previous = self._seek_cursor(cursor)
+
+        return self._make_cursor_paginator(
+            await self.limit(per_page + 1).get(),
+            per_page,
+            cursor,
+            orders,
+            payload,
+            previous,
+        )
+
+    async def exists(self):
+        """Determine if rows exist for the current query without hydrating a model.
+
+        Returns:
+            Bool - True or False
+        """
+        self.run_scopes()
+        self.set_action("exists")
+        sql = self.to_qmark()
+        result, _ = await self._query(sql, self._bindings, results=1)
+
+        return self._get_exists_result(result)
+
+    async def doesnt_exist(self):
+        return not await self.exists()
+
+    def count(self, column=None):
+        """Aggregates a columns values. Without a column the count query is run and
+        an awaitable resolving to the number of rows is returned.
+
+        Arguments:
+            column {string} -- The name of the column to aggregate.
+
+        Returns:
+            self|coroutine
+        """
+        if column or self.dry:
+            return super().count(column)
+
+        return self._count()
+
+    async def _count(self):
+        alias = "m_count_reserved"
+        self.aggregate("COUNT", f"* as {alias}")
+
+        result, _ = await self._query(self.to_qmark(), self._bindings, results=1)
+
+        if isinstance(result, dict):
+            return result.get(alias, 0)
+
+        return 0
+
+    async def create(
+        self,
+        creates: Optional[Dict[str, Any]] = None,
+        query: bool = False,
+        id_key: str = "id",
+        cast: bool = False,
+        ignore_mass_assignment: bool = False,
+        **kwargs,
+    ):
+        """Specifies a dictionary that should be used to create new values.
+
+        Arguments:
+            creates {dict} -- A dictionary of columns and values.
+
+        Returns:
+            Model|dict
+        """
+        super().create(
+            creates,
+            query=True,
+            id_key=id_key,
+            cast=cast,
+            ignore_mass_assignment=ignore_mass_assignment,
+            **kwargs,
+        )
+
+        if query:
+            return self
+
+        model = None
+        if self._model:
+            model = self._model.hydrate(self._creates)
+            self.observe_events(model, "creating")
+            self._creates.update(model.get_dirty_attributes())
+
+        if self.dry:
+            processed_results = self._creates
+        else:
+            query_result, connection = await self._query(
+                self.to_qmark(), self._bindings, results=1
+            )
+
+            if model:
+                id_key = model.get_primary_key()
+
+            # The post processors read the insert id from the builder's connection
+            self._connection = connection
+            processed_results = self.get_processor().process_insert_get_id(
+                self, query_result or self._creates, id_key
+            )
+            self._invalidate_query_cache()
+            if connection.get_transaction_level() <= 0:
+                self._connection = None
+
+        if model:
+            model = model.fill(processed_results)
+            if not self.dry:
+                self._remember_identity(model)
+            self.observe_events(model, "created")
+            return model
+
+        return processed_results
+
+    async def bulk_create(
+        self,
+        creates: List[Dict[str, Any]],
+        query: bool = False,
+        cast: bool = False,
+        batch_size: Optional[int] = None,
+        returning: bool = False,
+    ):
+        """Inserts many rows using multi row INSERT statements. See QueryBuilder.bulk_create.
+
+        Returns:
+            Collection|list|self
+        """
+        super().bulk_create(creates, query=True, cast=cast)
+
+        if query:
+            return self
+
+        if not self._creates:
+            processed_results = []
+        elif not self.dry:
+            processed_results = await self._run_batched_insert(
+                "bulk_create", batch_size, returning
+            )
+        else:
+            processed_results = self._creates
+
+        if self._model:
+            return self._model.hydrate(processed_results)
+
+        return processed_results
+
+    async def upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        unique_by: List[str],
+        update: Optional[List[str]] = None,
+        query: bool = False,
+        batch_size: Optional[int] = None,
+    ):
+        """Inserts rows or updates the existing rows they conflict with. See QueryBuilder.upsert.
+
+        Returns:
+            Collection|list|self
+        """
+        super().upsert(rows, unique_by, update=update, query=True)
+
+        if query:
+            return self
+
+        if not self._creates:
+            processed_results = []
+        elif not self.dry:
+            processed_results = await self._run_batched_insert("upsert", batch_size)
+        else:
+            processed_results = self._creates
+
+        if not self.dry:
+            self._forget_identities()
+
+        if self._model:
+            return self._model.hydrate(processed_results)
+
+        return processed_results
+
+    async def _run_batched_insert(self, action, batch_size=None, returning=False):
+        creates = self._creates
+        action, returning, batches = self._get_insert_batches(
+            action, batch_size, returning
+        )
+
+        connection = self.new_connection()
+        in_transaction = len(batches) > 1
+        if in_transaction:
+            await connection.begin()
+
+        inserted = []
+        try:
+            for batch in batches:
+                result = await connection.query(
+                    *self._compile_insert_batch(action, batch),
+                    results="*" if returning else 1,
+                )
+                if returning:
+                    inserted += list(result or [])
+        except Exception:
+            if in_transaction:
+                await connection.rollback()
+            raise
+        finally:
+            # Selects of a reused builder would compile the inserted rows as columns
+            self._creates = {}
+            self.reset()
+
+        if in_transaction:
+            await connection.commit()
+
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+        self._invalidate_query_cache()
+
+        return inserted if returning else creates
+
+    async def update(
+        self,
+        updates: Dict[str, Any],
+        dry: bool = False,
+        force: bool = False,
+        cast: bool = False,
+        ignore_mass_assignment: bool = False,
+    ):
+        """Specifies columns and values to be updated and runs the update query.
+
+        Arguments:
+            updates {dictionary} -- A dictionary of columns and values to update.
+
+        Returns:
+            Model|dict|self
+        """
+        model = self._model
+        built = super().update(
+            updates,
+            dry=True,
+            force=force,
+            cast=cast,
+            ignore_mass_assignment=ignore_mass_assignment,
+        )
+
+        # Nothing to update
+        if built is not self or self._action != "update":
+            return built
+
+        if dry or self.dry:
+            return self
+
+        updates = self._updates[0].column
+        additional = {}
+        if model and model.is_loaded():
+            additional.update({model.get_primary_key(): model.get_primary_key_value()})
+        additional.update(updates)
+
+        await self._query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        if model and model.is_loaded():
+            self._remember_identity(model)
+        else:
+            self._forget_identities()
+
+        if model:
+            model.fill(updates)
+            self.observe_events(model, "updated")
+            model.fill_original(updates)
+            return model
+
+        return additional
+
+    async def delete(self, column=None, value=None, query=False):
+        """Specify the column and value to delete
+        or deletes everything based on a previously used where expression.
+
+        Keyword Arguments:
+            column {string} -- The name of the column (default: {None})
+            value {string|int} -- The value of the column (default: {None})
+        """
+        super().delete(column, value, query=True)
+
+        if query:
+            return self
+
+        model = self._model
+        if model and model.is_loaded():
+            self.where(model.get_primary_key(), model.get_primary_key_value())
+            self.observe_events(model, "deleting")
+
+        result, _ = await self._query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(model)
+
+        if model:
+            self.observe_events(model, "deleted")
+
+        return result
+
+    async def increment(self, column, value=1):
+        """Increments a column's value.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Keyword Arguments:
+            value {int} -- The value to increment by. (default: {1})
+
+        Returns:
+            mixed -- The new value of the column when a model is given.
+        """
+        id_key, id_value = self._set_increment(column, value, "increment")
+        results, _ = await self._query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(self._model)
+
+        return await self._get_column_value(column, results, id_key, id_value)
+
+    async def decrement(self, column, value=1):
+        """Decrements a column's value.
+
+        Arguments:
+            column {string} -- The name of the column.
+
+        Keyword Arguments:
+            value {int} -- The value to decrement by. (default: {1})
+
+        Returns:
+            mixed -- The new value of the column when a model is given.
+        """
+        id_key, id_value = self._set_increment(column, value, "decrement")
+        results, _ = await self._query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(self._model)
+
+        return await self._get_column_value(column, results, id_key, id_value)
+
+    async def _get_column_value(self, column, results, id_key, id_value):
+        # Mirrors the post processors, which read the value back with a synchronous query
+        if isinstance(results, dict) and column in results:
+            return results[column]
+
+        if id_key and id_value:
+            return (await self.select(column).where(id_key, id_value).first())[column]
+
+        return {}
+
+    async def truncate(self, foreign_keys=False):
+        sql = self.get_grammar().truncate_table(self.get_table_name(), foreign_keys)
+        if self.dry:
+            return sql
+
+        connection = self.new_connection(write=True)
+        result = await connection.query(sql, ())
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+        self._invalidate_query_cache()
+
+        return result
+
+    async def chunk(self, chunk_amount):
+        """Runs the select query and yields the results in chunks of chunk_amount records.
+        The rows are streamed from the database with a server side cursor.
+
+        Arguments:
+            chunk_amount {int} -- The number of records per chunk.
+
+        Returns:
+            async generator
+        """
+        connection = self.new_connection()
+        async for result in connection.select_many(
+            self.to_qmark(), self._bindings, chunk_amount
+        ):
+            yield await self.prepare_result_async(result)
+
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+
+    async def lazy(self, chunk_amount=1000):
+        """Runs the select query and yields the records one at a time. Rows are streamed
+        from the database chunk_amount at a time and models are hydrated as they are consumed.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of rows fetched from the cursor at a time. (default: {1000})
+
+        Returns:
+            async generator
+        """
+        has_eagers = self._has_eagers()
+
+        connection = self.new_connection()
+        async for results in connection.select_many(
+            self.to_qmark(), self._bindings, chunk_amount
+        ):
+            if has_eagers:
+                # Eager load the relationships for the whole chunk at once
+                for result in await self.prepare_result_async(results):
+                    yield result
+                continue
+
+            for result in results:
+                yield self.prepare_result(result)
+
+        if connection.get_transaction_level() <= 0:
+            self._connection = None
+
+    def cursor(self, chunk_amount=1000):
+        """Alias of lazy. Yields the records of the select query one at a time.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of rows fetched from the cursor at a time. (default: {1000})
+
+        Returns:
+            async generator
+        """
+        return self.lazy(chunk_amount)
+
+    def new(self):
+        """Creates a new AsyncQueryBuilder class.
+
+        Returns:
+            AsyncQueryBuilder
+        """
+        builder = AsyncQueryBuilder(
+            grammar=self.grammar,
+            connection_class=self.connection_class,
+            connection=self.connection,
+            connection_driver=self._connection_driver,
+            connection_details=self._connection_details,
+            config_path=self.config_path,
+            model=self._model,
+        )
+
+        if self._table:
+            builder.table(self._table.name)
+
+        return builder
@@ -0,0 +1,107 @@
+from contextvars import ContextVar
+
+_current_identity_map = ContextVar("masoniteorm_identity_map", default=None)
+
+
+class IdentityMap:
+    """Keeps one model instance per (model class, primary key) for the duration of a unit of work.
+
+    While an identity map is active, hydrating a row that was already loaded returns the
+    existing model instance and finding a model by its primary key does not query the
+    database again. Maps are activated as a context manager and are local to the current
+    thread or asyncio task:
+
+        with DB.identity_map():
+            user = User.find(1)
+            assert User.find(1) is user
+
+    Writes keep the map consistent. Updating or saving a model stores that instance in the
+    map, deleting a model removes it, and update, delete or upsert queries that are not
+    scoped to a single loaded model remove every instance of the model class.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._tokens = []
+
+    @classmethod
+    def current(cls):
+        """Gets the identity map active in the current context.
+
+        Returns:
+            IdentityMap|None
+        """
+        return _current_identity_map.get()
+
+    def __enter__(self):
+        self._tokens.append(_current_identity_map.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_identity_map.reset(self._tokens.pop())
+        if not self._tokens:
+            self.clear()
+
+    def get(self, model, key):
+        """Gets the instance loaded for a primary key.
+
+        Arguments:
+            model {Model|type} -- The model class or an instance of it.
+            key {mixed} -- The primary key value.
+
+        Returns:
+            Model|None
+        """
+        if key is None:
+            return None
+
+        try:
+            return self._models.get((self._get_class(model), key))
+        except TypeError:
+            return None
+
+    def add(self, model):
+        """Stores a model instance under its primary key. Models without a primary key value are ignored.
+
+        Arguments:
+            model {Model} -- A hydrated model.
+
+        Returns:
+            Model
+        """
+        key = model.__attributes__.get(model.get_primary_key())
+        if key is not None:
+            try:
+                self._models[(model.__class__, key)] = model
+            except TypeError:
+                pass
+
+        return model
+
+    def forget(self, model, key=None):
+        """Removes the instance of a primary key or every instance of a model class.
+
+        Arguments:
+            model {Model|type} -- The model class or an instance of it.
+
+        Keyword Arguments:
+            key {mixed} -- The primary key value. None removes every instance of the class. (default: {None})
+        """
+        model_class = self._get_class(model)
+        if key is not None:
+            self._models.pop((model_class, key), None)
+            return
+
+        for identity in [
+            identity for identity in self._models if identity[0] is model_class
+        ]:
+            del self._models[identity]
+
+    def clear(self):
+        self._models.clear()
+
+    def _get_class(self, model):
+        return model if isinstance(model, type) else model.__class__
+
+    def __len__(self):
+        return len(self._models)
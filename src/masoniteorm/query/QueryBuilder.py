@@ -1,9 +1,10 @@
 import inspect
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Callable
 
 from ..collection.Collection import Collection
+from ..connections.ConnectionRouter import ConnectionRouter
 from ..config import load_config
 from ..exceptions import (
     HTTP404,
@@ -25,17 +26,23 @@ from ..expressions.expressions import (
     SubGroupExpression,
     SubSelectExpression,
     UpdateQueryExpression,
+    UpsertExpression,
 )
 from ..observers import ObservesEvents
-from ..pagination import LengthAwarePaginator, SimplePaginator
+from ..pagination import CursorPaginator, LengthAwarePaginator, SimplePaginator
 from ..schema import Schema
 from ..scopes import BaseScope
 from .EagerRelation import EagerRelations
+from .IdentityMap import IdentityMap
+from .QueryCache import QueryCache
 
 
 class QueryBuilder(ObservesEvents):
     """A builder class to manage the building and creation of query expressions."""
 
+    # Results of the queries run with remember(), shared by all builders
+    query_cache = QueryCache()
+
     def __init__(
         self,
         grammar=None,
@@ -72,6 +79,9 @@ class QueryBuilder(ObservesEvents):
         self._scopes = scopes or {}
         self.lock = False
         self._schema = schema
+        self._prepare_statements = None
+        self._remember = None
+        self._writes = False
         self._eager_relation = EagerRelations()
         if model:
             self._global_scopes = model._global_scopes
@@ -89,6 +99,7 @@ class QueryBuilder(ObservesEvents):
         self._bindings = ()
 
         self._updates = ()
+        self._upsert = None
 
         self._wheres = ()
         self._order_by = ()
@@ -125,6 +136,74 @@ class QueryBuilder(ObservesEvents):
         self._schema = schema
         return self
 
+    def prepared(self, enabled=True):
+        """Runs the queries of this builder through server side prepared statements, overriding
+        the "prepared_statements" option of the connection. Drivers without prepared statement
+        support ignore it.
+
+        Keyword Arguments:
+            enabled {bool} -- Whether prepared statements should be used. (default: {True})
+
+        Returns:
+            self
+        """
+        self._prepare_statements = enabled
+        if self._connection:
+            self._connection.prepare_statements(enabled)
+        return self
+
+    def remember(self, ttl, key=None):
+        """Caches the results of the select query for ttl seconds. Results are kept in
+        QueryBuilder.query_cache and are invalidated as soon as the ORM writes to one of the
+        tables the query reads.
+
+        Arguments:
+            ttl {int|float} -- The number of seconds the results are kept.
+
+        Keyword Arguments:
+            key {string|None} -- The cache key. Defaults to a hash of the compiled query and its bindings. (default: {None})
+
+        Returns:
+            self
+        """
+        self._remember = (ttl, key)
+        return self
+
+    def _get_cache_tag(self, table):
+        details = self._connection_details.get(self.connection, {})
+        return f"{details.get('database') or self.connection}.{table}"
+
+    def _get_cache_tags(self):
+        """Gets the tags of the tables a select query reads from, including the tables
+        read by its subqueries, like where_in or where_exists with a query builder."""
+        tags = []
+        if self._table and not self._table.raw:
+            tags.append(self._get_cache_tag(self._table.name))
+
+        for join in self._joins:
+            if isinstance(join, JoinClause):
+                tags.append(self._get_cache_tag(join.table))
+
+        for expression in self._columns + self._wheres:
+            subquery = getattr(expression, "value", expression)
+            builder = getattr(subquery, "builder", None)
+            if isinstance(builder, QueryBuilder):
+                tags += builder._get_cache_tags()
+
+        return list(dict.fromkeys(tags))
+
+    def _invalidate_query_cache(self):
+        if not self._table or self._table.raw:
+            return
+
+        tag = self._get_cache_tag(self._table.name)
+        self.query_cache.invalidate(tag)
+
+        # Other connections may cache the rows as they were before the transaction until
+        # it is committed, so the table is invalidated again once the transaction ends
+        if self._connection and self._connection.get_transaction_level() > 0:
+            self._connection.after_transaction(lambda: self.query_cache.invalidate(tag))
+
     def shared_lock(self):
         return self.make_lock("share")
 
@@ -141,6 +220,7 @@ class QueryBuilder(ObservesEvents):
         self.set_action("select")
 
         self._updates = ()
+        self._upsert = None
 
         self._wheres = ()
         self._order_by = ()
@@ -150,24 +230,47 @@ class QueryBuilder(ObservesEvents):
 
         return self
 
-    def get_connection_information(self):
+    def get_connection_information(self, write=True):
+        """Gets the arguments of the connection class. Connections with "read" and "write"
+        hosts are routed to a read replica or to the primary.
+
+        Keyword Arguments:
+            write {bool} -- Whether the connection is used to write. (default: {True})
+
+        Returns:
+            dict
+        """
+        details = self._connection_details.get(self.connection, {})
+        if ConnectionRouter.is_routed(details):
+            details = ConnectionRouter.route(
+                self.connection, details, write=write, load=self._get_connection_load
+            )
+
+        return self._get_connection_arguments(details)
+
+    def _get_connection_arguments(self, details):
         return {
-            "host": self._connection_details.get(self.connection, {}).get("host"),
-            "database": self._connection_details.get(self.connection, {}).get(
-                "database"
-            ),
-            "user": self._connection_details.get(self.connection, {}).get("user"),
-            "port": self._connection_details.get(self.connection, {}).get("port"),
-            "password": self._connection_details.get(self.connection, {}).get(
-                "password"
-            ),
-            "prefix": self._connection_details.get(self.connection, {}).get("prefix"),
-            "options": self._connection_details.get(self.connection, {}).get(
-                "options", {}
-            ),
-            "full_details": self._connection_details.get(self.connection, {}),
+            "host": details.get("host"),
+            "database": details.get("database"),
+            "user": details.get("user"),
+            "port": details.get("port"),
+            "password": details.get("password"),
+            "prefix": details.get("prefix"),
+            "options": details.get("options", {}),
+            "full_details": details,
         }
 
+    def _get_connection_load(self, details):
+        pool = self.connection_class(
+            **self._get_connection_arguments(details), name=self.connection
+        ).get_pool()
+
+        return pool.in_use_count() if pool else 0
+
+    def _is_write(self):
+        """Whether the query being built has to run on the primary of a read / write connection."""
+        return self._action not in ("select", "exists") or bool(self.lock)
+
     def table(self, table, raw=False):
         """Sets a table on the query builder
 
@@ -247,7 +350,7 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        return self.new_connection().begin()
+        return self.new_connection(write=True).begin()
 
     def begin_transaction(self, *args, **kwargs):
         return self.begin(*args, **kwargs)
@@ -445,7 +548,7 @@ class QueryBuilder(ObservesEvents):
     def statement(self, query, bindings=None):
         if bindings is None:
             bindings = []
-        result = self.new_connection().query(query, bindings)
+        result = self.new_connection(write=True).query(query, bindings)
         return self.prepare_result(result)
 
     def select_raw(self, query):
@@ -461,8 +564,32 @@ class QueryBuilder(ObservesEvents):
         return self.connection_class.get_default_post_processor()()
 
     def bulk_create(
-        self, creates: List[Dict[str, Any]], query: bool = False, cast: bool = False
+        self,
+        creates: List[Dict[str, Any]],
+        query: bool = False,
+        cast: bool = False,
+        batch_size: Optional[int] = None,
+        returning: bool = False,
     ):
+        """Inserts many rows using multi row INSERT statements.
+
+        The rows are split into batches small enough for the bound parameter limit of the
+        grammar. When more than one statement is needed they all run in a single transaction.
+
+        Arguments:
+            creates {list} -- A list of dictionaries of columns and values.
+
+        Keyword Arguments:
+            query {bool} -- Return the builder instead of running the query. (default: {False})
+            cast {bool} -- Run the values through the model's casters. (default: {False})
+            batch_size {int|None} -- The most rows to insert per statement. (default: {None})
+            returning {bool} -- Return the inserted rows, including generated keys, as the
+                database stored them. Only supported by grammars with RETURNING or OUTPUT
+                clauses. (default: {False})
+
+        Returns:
+            Collection|list|self
+        """
         self.set_action("bulk_create")
         model = None
 
@@ -481,18 +608,148 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self
 
+        if not self._creates:
+            processed_results = []
+        elif not self.dry:
+            processed_results = self._run_batched_insert(
+                "bulk_create", batch_size, returning
+            )
+        else:
+            processed_results = self._creates
+
         if model:
-            model = model.hydrate(self._creates)
-        if not self.dry:
-            connection = self.new_connection()
-            query_result = connection.query(self.to_qmark(), self._bindings, results=1)
+            return model.hydrate(processed_results)
+
+        return processed_results
+
+    def _run_batched_insert(self, action, batch_size=None, returning=False):
+        """Runs a multi row insert of the rows in _creates batch by batch.
+
+        Arguments:
+            action {string} -- The grammar action compiling each batch.
+
+        Returns:
+            list -- The inserted rows returned by the database or the rows that were inserted.
+        """
+        creates = self._creates
+        action, returning, batches = self._get_insert_batches(
+            action, batch_size, returning
+        )
+
+        connection = self.new_connection()
+        in_transaction = len(batches) > 1
+        if in_transaction:
+            if not connection.open:
+                connection = connection.make_connection()
+            connection.begin()
+
+        inserted = []
+        try:
+            for batch in batches:
+                result = connection.query(
+                    *self._compile_insert_batch(action, batch),
+                    results="*" if returning else 1,
+                )
+                if returning:
+                    inserted += list(result or [])
+        except Exception:
+            if in_transaction:
+                connection.rollback()
+            raise
+        finally:
+            # Selects of a reused builder would compile the inserted rows as columns
+            self._creates = {}
+            self.reset()
+
+        if in_transaction:
+            connection.commit()
+
+        self._invalidate_query_cache()
+
+        return inserted if returning else creates
+
+    def _get_insert_batches(self, action, batch_size=None, returning=False):
+        """Splits the rows in _creates into batches small enough for the grammar.
+
+        Arguments:
+            action {string} -- The grammar action compiling each batch.
+
+        Returns:
+            tuple -- The action, whether the rows are returned and the batches of rows.
+        """
+        # Global scopes run once for all of the rows instead of once per batch
+        self.set_action(action)
+        self.run_scopes()
+        creates = self._creates
+
+        returning = returning and self.grammar.supports_returning
+        if returning:
+            action += "_returning"
+        size = self.grammar.get_bulk_batch_size(len(creates[0]), batch_size)
+        batches = [creates[i : i + size] for i in range(0, len(creates), size)]
+
+        return action, returning, batches
 
-            processed_results = query_result or self._creates
+    def _compile_insert_batch(self, action, batch):
+        self._creates = batch
+        grammar = self.get_grammar(qmark=True).compile(action, qmark=True)
+        return grammar.to_sql(), grammar._bindings
+
+    def upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        unique_by: List[str],
+        update: Optional[List[str]] = None,
+        query: bool = False,
+        batch_size: Optional[int] = None,
+    ):
+        """Inserts rows or updates the existing rows they conflict with in a single statement
+        per batch. Compiled natively by each grammar: ON CONFLICT on Postgres and SQLite,
+        ON DUPLICATE KEY UPDATE on MySQL and MERGE on MSSQL.
+
+        Arguments:
+            rows {list} -- A list of dictionaries of columns and values.
+            unique_by {list} -- The columns of the unique index that identifies an existing row.
+                MySQL always uses the unique indexes of the table.
+
+        Keyword Arguments:
+            update {list|None} -- The columns to update on existing rows. Defaults to every
+                inserted column not in unique_by. An empty list leaves existing rows untouched.
+            query {bool} -- Return the builder instead of running the query. (default: {False})
+            batch_size {int|None} -- The most rows per statement. (default: {None})
+
+        Returns:
+            Collection|list|self
+        """
+        if isinstance(unique_by, str):
+            unique_by = [unique_by]
+
+        self.set_action("upsert")
+        self._upsert = UpsertExpression(unique_by, update)
+
+        model = self._model
+        self._creates = []
+        for row in rows:
+            if model:
+                row = model.filter_mass_assignment(row)
+            # sort the dicts by key so the values inserted align with the correct column
+            self._creates.append(dict(sorted(row.items())))
+
+        if query:
+            return self
+
+        if not self._creates:
+            processed_results = []
+        elif not self.dry:
+            processed_results = self._run_batched_insert("upsert", batch_size)
         else:
             processed_results = self._creates
 
+        if not self.dry:
+            self._forget_identities()
+
         if model:
-            return model
+            return model.hydrate(processed_results)
 
         return processed_results
 
@@ -549,11 +806,14 @@ class QueryBuilder(ObservesEvents):
             processed_results = self.get_processor().process_insert_get_id(
                 self, query_result or self._creates, id_key
             )
+            self._invalidate_query_cache()
         else:
             processed_results = self._creates
 
         if model:
             model = model.fill(processed_results)
+            if not self.dry:
+                self._remember_identity(model)
             self.observe_events(model, "created")
             return model
 
@@ -593,12 +853,37 @@ class QueryBuilder(ObservesEvents):
             self.observe_events(model, "deleting")
 
         result = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(model)
 
         if model:
             self.observe_events(model, "deleted")
 
         return result
 
+    def _remember_identity(self, model):
+        """Stores a model that was just written in the active identity map."""
+        identity_map = IdentityMap.current()
+        if identity_map is not None:
+            identity_map.add(model)
+
+    def _forget_identities(self, model=None):
+        """Removes the models a write query may have changed from the active identity map.
+        A query scoped to a loaded model removes that model, any other query removes every
+        instance of the builder's model class.
+
+        Keyword Arguments:
+            model {Model|None} -- The loaded model the query was scoped to. (default: {None})
+        """
+        identity_map = IdentityMap.current()
+        if identity_map is None or not self._model:
+            return
+
+        if model and model.is_loaded():
+            identity_map.forget(model, model.get_primary_key_value())
+        else:
+            identity_map.forget(self._model)
+
     def where(self, column, *args):
         """Specifies a where expression.
 
@@ -898,10 +1183,60 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def chunk(self, chunk_amount):
+        """Runs the select query and yields the results in chunks of chunk_amount records.
+        The rows are streamed from the database with a server side cursor.
+
+        Arguments:
+            chunk_amount {int} -- The number of records per chunk.
+
+        Returns:
+            generator
+        """
         chunk_connection = self.new_connection()
-        for result in chunk_connection.select_many(self.to_sql(), (), chunk_amount):
+        for result in chunk_connection.select_many(
+            self.to_qmark(), self._bindings, chunk_amount
+        ):
             yield self.prepare_result(result)
 
+    def lazy(self, chunk_amount=1000):
+        """Runs the select query and yields the records one at a time. Rows are streamed
+        from the database chunk_amount at a time and models are hydrated as they are consumed.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of rows fetched from the cursor at a time. (default: {1000})
+
+        Returns:
+            generator
+        """
+        has_eagers = (
+            self._eager_relation.eagers
+            or self._eager_relation.nested_eagers
+            or self._eager_relation.callback_eagers
+        )
+
+        connection = self.new_connection()
+        for results in connection.select_many(
+            self.to_qmark(), self._bindings, chunk_amount
+        ):
+            if has_eagers:
+                # Eager load the relationships for the whole chunk at once
+                yield from self.prepare_result(results)
+                continue
+
+            for result in results:
+                yield self.prepare_result(result)
+
+    def cursor(self, chunk_amount=1000):
+        """Alias of lazy. Yields the records of the select query one at a time.
+
+        Keyword Arguments:
+            chunk_amount {int} -- The number of rows fetched from the cursor at a time. (default: {1000})
+
+        Returns:
+            generator
+        """
+        return self.lazy(chunk_amount)
+
     def where_not_null(self, column: str):
         """Specifies a where expression where the column is not NULL.
 
@@ -1023,6 +1358,90 @@ class QueryBuilder(ObservesEvents):
             self._wheres += ((QueryExpression(column, "IN", list(wheres))),)
         return self
 
+    def _get_where_in_strategy(self):
+        """Gets how where_in lists above the connection's threshold are run. The "where_in_strategy"
+        connection option is one of "auto", "array", "chunk" or "inline". Auto binds the list
+        as a single array where the grammar supports it and splits the query into chunks otherwise.
+
+        Returns:
+            string -- Either "array", "chunk" or "inline".
+        """
+        details = self._connection_details.get(self.connection, {})
+        strategy = details.get("where_in_strategy", "auto")
+        if strategy not in ("auto", "array", "chunk", "inline"):
+            raise InvalidArgument(
+                f"Unknown where_in_strategy '{strategy}' on connection '{self.connection}'"
+            )
+
+        if strategy in ("auto", "array"):
+            return "array" if self.grammar.supports_array_binding else "chunk"
+
+        return strategy
+
+    def _get_where_in_threshold(self):
+        details = self._connection_details.get(self.connection, {})
+        return self.grammar.get_where_in_threshold(details.get("where_in_threshold"))
+
+    def _get_where_in_lists(self):
+        """Gets the where_in and where_not_in lists above the connection's threshold, along
+        with their position in the wheres.
+
+        Returns:
+            list -- A list of (position, where) tuples.
+        """
+        threshold = self._get_where_in_threshold()
+        return [
+            (position, where)
+            for position, where in enumerate(self._wheres)
+            if isinstance(where, QueryExpression)
+            and not where.raw
+            and where.value_type == "value"
+            and isinstance(where.value, list)
+            and where.equality.upper() in ("IN", "NOT IN")
+            and len(where.value) > threshold
+        ]
+
+    def _get_compiled_wheres(self, qmark=False):
+        """Gets the wheres passed to the grammar. The strategy of large where_in lists is decided
+        here instead of when they are added, so it is the one of the connection the query runs on.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether the values are compiled as bindings. (default: {False})
+
+        Raises:
+            InvalidArgument: When a where_not_in list has more values than the database accepts
+                bindings and can not be bound as an array.
+
+        Returns:
+            tuple
+        """
+        lists = self._get_where_in_lists()
+        if not lists:
+            return self._wheres
+
+        if self._get_where_in_strategy() != "array":
+            if qmark:
+                self._check_where_not_in_size(lists)
+            return self._wheres
+
+        wheres = list(self._wheres)
+        for position, where in lists:
+            where = copy(where)
+            where.value_type = "array"
+            wheres[position] = where
+
+        return tuple(wheres)
+
+    def _check_where_not_in_size(self, lists):
+        # A NOT IN list can not be split over several queries like an IN list
+        max_bindings = self.grammar.max_bindings
+        for position, where in lists:
+            if where.equality.upper() == "NOT IN" and len(where.value) > max_bindings:
+                raise InvalidArgument(
+                    f"The where_not_in list of '{where.column}' has {len(where.value)} values but "
+                    f"'{self.connection}' accepts at most {max_bindings} bindings per query. Use a subquery instead."
+                )
+
     def get_relation(self, relationship, builder=None):
         if not builder:
             builder = self
@@ -1463,6 +1882,11 @@ class QueryBuilder(ObservesEvents):
         additional.update(updates)
 
         self.new_connection().query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        if model and model.is_loaded():
+            self._remember_identity(model)
+        else:
+            self._forget_identities()
         if model:
             model.fill(updates)
             self.observe_events(model, "updated")
@@ -1500,28 +1924,10 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        model = None
-        id_key = "id"
-        id_value = None
-
-        additional = {}
-
-        if self._model:
-            model = self._model
-            id_value = self._model.get_primary_key_value()
-
-        if model and model.is_loaded():
-            self.where(model.get_primary_key(), model.get_primary_key_value())
-            additional.update({model.get_primary_key(): model.get_primary_key_value()})
-
-            self.observe_events(model, "updating")
-
-        self._updates += (
-            UpdateQueryExpression(column, value, update_type="increment"),
-        )
-
-        self.set_action("update")
+        id_key, id_value = self._set_increment(column, value, "increment")
         results = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(self._model)
         processed_results = self.get_processor().get_column_value(
             self, column, results, id_key, id_value
         )
@@ -1539,32 +1945,36 @@ class QueryBuilder(ObservesEvents):
         Returns:
             self
         """
-        model = None
-        id_key = "id"
-        id_value = None
+        id_key, id_value = self._set_increment(column, value, "decrement")
+        result = self.new_connection().query(self.to_qmark(), self._bindings)
+        self._invalidate_query_cache()
+        self._forget_identities(self._model)
+        processed_results = self.get_processor().get_column_value(
+            self, column, result, id_key, id_value
+        )
+        return processed_results
 
-        additional = {}
+    def _set_increment(self, column, value, update_type):
+        """Builds the update query of an increment or a decrement.
 
-        if self._model:
-            model = self._model
-            id_value = self._model.get_primary_key_value()
+        Returns:
+            tuple -- The primary key and the primary key value the new column value is read back with.
+        """
+        id_key = "id"
+        id_value = None
 
+        model = self._model
         if model and model.is_loaded():
-            self.where(model.get_primary_key(), model.get_primary_key_value())
-            additional.update({model.get_primary_key(): model.get_primary_key_value()})
-
+            id_value = model.get_primary_key_value()
+            self.where(model.get_primary_key(), id_value)
             self.observe_events(model, "updating")
 
         self._updates += (
-            UpdateQueryExpression(column, value, update_type="decrement"),
+            UpdateQueryExpression(column, value, update_type=update_type),
         )
 
         self.set_action("update")
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
-        processed_results = self.get_processor().get_column_value(
-            self, column, result, id_key, id_value
-        )
-        return processed_results
+        return id_key, id_value
 
     def sum(self, column):
         """Aggregates a columns values.
@@ -1716,12 +2126,63 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self.limit(1)
 
-        result = self.new_connection().query(
-            self.limit(1).to_qmark(), self._bindings, results=1
-        )
+        identity = self._get_identity()
+        if identity is not None:
+            return identity
+
+        result = self.limit(1)._run_select(results=1)
 
         return self.prepare_result(result)
 
+    def _get_identity(self):
+        """Gets the model of the active identity map when the query only looks a model up by
+        its primary key, for example through find or a lazy belongs to relationship.
+
+        Returns:
+            Model|None
+        """
+        identity_map = IdentityMap.current()
+        if identity_map is None or not self._model or len(self._wheres) != 1:
+            return None
+
+        # Global scopes, like soft deletes, may exclude the model from the query results
+        if self._global_scopes.get("select"):
+            return None
+
+        if (
+            self._columns
+            or self._joins
+            or self._aggregates
+            or self._group_by
+            or self._having
+            or self._offset
+            or self.lock
+            or self._has_eagers()
+        ):
+            return None
+
+        where = self._wheres[0]
+        if (
+            where.raw
+            or where.value_type != "value"
+            or where.equality != "="
+            or isinstance(where.value, (list, QueryBuilder))
+        ):
+            return None
+
+        primary_key = self._model.get_primary_key()
+        if where.column not in (primary_key, f"{self.get_table_name()}.{primary_key}"):
+            return None
+
+        return identity_map.get(self._model, where.value)
+
+    def _has_eagers(self):
+        return bool(
+            self._eager_relation.eagers
+            or self._eager_relation.nested_eagers
+            or self._eager_relation.callback_eagers
+        )
+
     def first_or_create(self, wheres, creates: dict = None):
         """Get the first record matching the attributes or create it.
 
@@ -1963,10 +2424,7 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def _map_related(self, related_result, related):
-        if related.__class__.__name__ == 'MorphTo':
-            return related_result
-
-        return related_result.group_by(related.foreign_key)
+        return related.map_related(related_result)
 
     def all(self, selects=[], query=False):
         """Returns all records from the table.
@@ -1978,7 +2436,7 @@ class QueryBuilder(ObservesEvents):
         if query:
             return self.to_sql()
 
-        result = self.new_connection().query(self.to_qmark(), self._bindings) or []
+        result = self._run_select() or []
 
         return self.prepare_result(result, collection=True)
 
@@ -1989,22 +2447,158 @@ class QueryBuilder(ObservesEvents):
             self
         """
         self.select(*selects)
-        result = self.new_connection().query(self.to_qmark(), self._bindings)
+        result = self._run_select()
 
         return self.prepare_result(result, collection=True)
 
-    def new_connection(self):
-        if self._connection:
-            return self._connection
+    def _run_select(self, results="*"):
+        tags = self._get_cache_tags() if self._remember else None
+        queries = self._to_qmark_chunks()
+
+        if tags is not None:
+            ttl, key = self._remember
+            key = key or self.query_cache.make_key(self.connection, queries, results)
+            result = self.query_cache.get(key, tags)
+            if result is not None:
+                return result
+
+        connection = self.new_connection()
+        if len(queries) == 1:
+            result = connection.query(*queries[0], results=results)
+        else:
+            result = []
+            for query, bindings in queries:
+                result += connection.query(query, bindings) or []
+
+        # Rows read inside a transaction may never be committed
+        if (
+            tags is not None
+            and result is not None
+            and connection.get_transaction_level() <= 0
+        ):
+            self.query_cache.put(key, tags, result, ttl)
+
+        return result
+
+    def _get_chunked_where_in(self):
+        """Gets the position of the where_in list the select query should be split on. Only
+        queries whose rows can simply be concatenated are split: a single oversized IN list,
+        no OR or raw wheres and no limit, offset, ordering, grouping, aggregates or distinct.
+
+        Returns:
+            int|None
+        """
+        if self._get_where_in_strategy() != "chunk":
+            return None
+
+        if (
+            self._limit
+            or self._offset
+            or self._order_by
+            or self._group_by
+            or self._having
+            or self._aggregates
+            or self._distinct
+        ):
+            return None
+
+        threshold = self._get_where_in_threshold()
+        index = None
+        for position, where in enumerate(self._wheres):
+            if where.raw or getattr(where, "keyword", None) == "or":
+                return None
+
+            if (
+                where.equality.upper() == "IN"
+                and isinstance(where.value, list)
+                and len(where.value) > threshold
+            ):
+                if index is not None:
+                    return None
+                index = position
+
+        return index
+
+    def _to_qmark_chunks(self):
+        """Compiles the select query into one or more Qmark SQL statements. When the query has a
+        where_in list above the connection's threshold and the "chunk" strategy applies the list
+        is split so every statement stays within the database's parameter limit.
+
+        Returns:
+            list -- A list of (sql, bindings) tuples.
+        """
+        index = self._get_chunked_where_in()
+        if index is None:
+            sql = self.to_qmark()
+            return [(sql, self._bindings)]
+
+        # Global scopes run once for all of the chunks instead of once per chunk
+        self.run_scopes()
+        wheres = self._wheres
+        where = wheres[index]
+        values = list(dict.fromkeys(where.value))
+        size = self._get_where_in_threshold()
+
+        queries = []
+        try:
+            for start in range(0, len(values), size):
+                self._wheres = (
+                    wheres[:index]
+                    + (
+                        QueryExpression(
+                            where.column,
+                            "IN",
+                            values[start : start + size],
+                            keyword=where.keyword,
+                        ),
+                    )
+                    + wheres[index + 1 :]
+                )
+                grammar = self.get_grammar(qmark=True).compile(self._action, qmark=True)
+                queries.append((grammar.to_sql(), grammar._bindings))
+        finally:
+            self.reset()
+
+        self._bindings = queries[-1][1]
+
+        return queries
+
+    def new_connection(self, write=None):
+        """Gets the connection of this builder, opening it if needed.
+
+        Keyword Arguments:
+            write {bool|None} -- Whether the connection is used to write. Defaults to
+                whether the query being built writes. (default: {None})
 
+        Returns:
+            masoniteorm.connections.BaseConnection
+        """
+        if write is None:
+            write = self._is_write()
+
+        if write:
+            ConnectionRouter.record_write(self.connection)
+
+        # A connection to the primary also serves reads
+        if self._connection and (
+            self._writes or not write or self._connection.get_transaction_level() > 0
+        ):
+            return self._connection.set_model(self._model)
+
+        self._writes = write or not ConnectionRouter.is_routed(
+            self._connection_details.get(self.connection, {})
+        )
         self._connection = (
             self.connection_class(
-                **self.get_connection_information(), name=self.connection
+                **self.get_connection_information(write=write), name=self.connection
             )
             .set_schema(self._schema)
             .make_connection()
         )
-        return self._connection
+        if self._prepare_statements is not None:
+            self._connection.prepare_statements(self._prepare_statements)
+
+        return self._connection.set_model(self._model)
 
     def get_connection(self):
         return self._connection
@@ -2018,32 +2612,171 @@ class QueryBuilder(ObservesEvents):
         return self
 
     def paginate(self, per_page, page=1):
-        if page == 1:
-            offset = 0
-        else:
-            offset = (int(page) * per_page) - per_page
+        new_from_builder = self._new_total_builder()
 
-        new_from_builder = self.new_from_builder()
-        new_from_builder._order_by = ()
-        new_from_builder._columns = ()
-
-        result = self.limit(per_page).offset(offset).get()
+        result = (
+            self.limit(per_page).offset(self._get_page_offset(per_page, page)).get()
+        )
         total = new_from_builder.count()
 
         paginator = LengthAwarePaginator(result, per_page, page, total)
         return paginator
 
-    def simple_paginate(self, per_page, page=1):
+    def _get_page_offset(self, per_page, page):
         if page == 1:
-            offset = 0
-        else:
-            offset = (int(page) * per_page) - per_page
+            return 0
+
+        return (int(page) * per_page) - per_page
 
-        result = self.limit(per_page).offset(offset).get()
+    def _new_total_builder(self):
+        """Copies the builder to count the rows of every page."""
+        new_from_builder = self.new_from_builder()
+        new_from_builder._order_by = ()
+        new_from_builder._columns = ()
+        return new_from_builder
+
+    def simple_paginate(self, per_page, page=1):
+        result = (
+            self.limit(per_page).offset(self._get_page_offset(per_page, page)).get()
+        )
 
         paginator = SimplePaginator(result, per_page, page)
         return paginator
 
+    def cursor_paginate(self, per_page, cursor=None):
+        """Paginates the query by seeking past the ordered columns of the last record
+        instead of using an offset, so every page costs about the same to fetch.
+
+        The query is ordered by its order_by columns followed by the primary key.
+        The ordered columns should not contain NULL values.
+
+        Arguments:
+            per_page {int} -- The number of records per page.
+
+        Keyword Arguments:
+            cursor {str} -- A next_cursor or previous_cursor of a previous page. (default: {None})
+
+        Returns:
+            CursorPaginator
+        """
+        orders, payload, previous = self._seek_cursor(cursor)
+
+        return self._make_cursor_paginator(
+            self.limit(per_page + 1).get(), per_page, cursor, orders, payload, previous
+        )
+
+    def _seek_cursor(self, cursor=None):
+        """Orders the query and filters it past the record of a cursor.
+
+        Returns:
+            tuple -- The ordered columns and directions, the decoded cursor and whether
+                the cursor points to a previous page.
+        """
+        orders = self._get_cursor_orders()
+        payload = CursorPaginator.decode_cursor(cursor) if cursor else None
+        previous = bool(payload and payload.get("previous"))
+
+        if previous:
+            # Walk backwards from the cursor and flip the results afterwards
+            orders = [
+                (column, "ASC" if direction == "DESC" else "DESC")
+                for column, direction in orders
+            ]
+
+        self._order_by = tuple(
+            OrderByExpression(column, direction=direction)
+            for column, direction in orders
+        )
+
+        if payload:
+            self._where_past_cursor(orders, payload["values"])
+
+        return orders, payload, previous
+
+    def _make_cursor_paginator(
+        self, result, per_page, cursor, orders, payload, previous
+    ):
+        # The query fetched one record more than a page to know if a next page exists
+        items = result.all()
+        has_more = len(items) > per_page
+        items = items[:per_page]
+
+        if previous:
+            items.reverse()
+
+        result = result.__class__(items)
+
+        next_cursor = previous_cursor = None
+        if items:
+            if has_more or previous:
+                next_cursor = CursorPaginator.encode_cursor(
+                    self._get_cursor_values(items[-1], orders)
+                )
+            if payload and (has_more or not previous):
+                previous_cursor = CursorPaginator.encode_cursor(
+                    self._get_cursor_values(items[0], orders), previous=True
+                )
+
+        return CursorPaginator(
+            result,
+            per_page,
+            cursor=cursor,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
+
+    def _get_cursor_orders(self):
+        orders = []
+        for order in self._order_by:
+            if order.raw:
+                raise InvalidArgument(
+                    "Cursor pagination does not support raw order by expressions."
+                )
+            orders.append((order.column, order.direction.upper()))
+
+        primary_key = self._model.get_primary_key() if self._model else "id"
+        if primary_key not in [column.split(".")[-1] for column, _ in orders]:
+            orders.append((primary_key, orders[-1][1] if orders else "ASC"))
+
+        return orders
+
+    def _get_cursor_values(self, record, orders):
+        values = {}
+        for column, _ in orders:
+            key = column.split(".")[-1]
+            if isinstance(record, dict):
+                values[key] = record.get(key)
+            else:
+                values[key] = record.get_raw_attribute(key)
+
+        return values
+
+    def _where_past_cursor(self, orders, values):
+        """Adds the keyset condition (a > ?) OR (a = ? AND b > ?) ... for the ordered columns."""
+        keyset = self.new()
+        for index, (column, direction) in enumerate(orders):
+            key = column.split(".")[-1]
+            if key not in values:
+                raise InvalidArgument(
+                    "The pagination cursor does not match the query order."
+                )
+
+            seek = self.new()
+            for previous_column, _ in orders[:index]:
+                seek.where(previous_column, "=", values[previous_column.split(".")[-1]])
+            seek.where(column, ">" if direction == "ASC" else "<", values[key])
+
+            keyset._wheres += (
+                QueryExpression(
+                    None,
+                    "=",
+                    SubGroupExpression(seek),
+                    keyword="or" if index else None,
+                ),
+            )
+
+        return self.where_from_builder(keyset)
+
     def set_action(self, action):
         """Sets the action that the query builder should take when the query is built.
 
@@ -2056,9 +2789,12 @@ class QueryBuilder(ObservesEvents):
         self._action = action
         return self
 
-    def get_grammar(self):
+    def get_grammar(self, qmark=False):
         """Initializes and returns the grammar class.
 
+        Keyword Arguments:
+            qmark {bool} -- Whether the query is compiled with bindings. (default: {False})
+
         Returns:
             masoniteorm.grammar.Grammar -- An ORM grammar class.
         """
@@ -2069,7 +2805,7 @@ class QueryBuilder(ObservesEvents):
         return self.grammar(
             columns=columns,
             table=self._table,
-            wheres=self._wheres,
+            wheres=self._get_compiled_wheres(qmark),
             limit=self._limit,
             offset=self._offset,
             updates=self._updates,
@@ -2080,6 +2816,7 @@ class QueryBuilder(ObservesEvents):
             lock=self.lock,
             joins=self._joins,
             having=self._having,
+            upsert=self._upsert,
         )
 
     def to_sql(self):
@@ -2120,7 +2857,7 @@ class QueryBuilder(ObservesEvents):
         for name, scope in self._global_scopes.get(self._action, {}).items():
             scope(self)
 
-        grammar = self.get_grammar()
+        grammar = self.get_grammar(qmark=True)
 
         sql = grammar.compile(self._action, qmark=True).to_sql()
 
@@ -2141,6 +2878,8 @@ class QueryBuilder(ObservesEvents):
             connection_class=self.connection_class,
             connection=self.connection,
             connection_driver=self._connection_driver,
+            connection_details=self._connection_details,
+            config_path=self.config_path,
             model=self._model,
         )
 
@@ -2228,18 +2967,37 @@ class QueryBuilder(ObservesEvents):
         if self.dry:
             return sql
 
-        return self.new_connection().query(sql, ())
+        result = self.new_connection(write=True).query(sql, ())
+        self._invalidate_query_cache()
+
+        return result
+
+    def exists(self, query=False):
+        """Determine if rows exist for the current query. The query selects a constant
+        from at most one row and no model is hydrated.
 
-    def exists(self):
-        """Determine if rows exist for the current query.
+        Keyword Arguments:
+            query {bool} -- Whether to return the query builder instead of running the query. (default: {False})
 
         Returns:
             Bool - True or False
         """
-        if self.first():
-            return True
-        else:
-            return False
+        # The scopes of a select still apply, for example to leave soft deleted rows out
+        self.run_scopes()
+        self.set_action("exists")
+        if query or self.dry:
+            return self
+
+        sql = self.to_qmark()
+        result = self.new_connection().query(sql, self._bindings, results=1)
+
+        return self._get_exists_result(result)
+
+    def _get_exists_result(self, result):
+        if isinstance(result, dict):
+            return bool(result.get("m_exists_reserved"))
+
+        return bool(result)
 
     def doesnt_exist(self):
         """Determine if no rows exist for the current query.
@@ -2265,11 +3023,13 @@ class QueryBuilder(ObservesEvents):
         if from_builder is None:
             from_builder = self
 
-        builder = QueryBuilder(
+        builder = self.__class__(
             grammar=self.grammar,
             connection_class=self.connection_class,
             connection=self.connection,
             connection_driver=self._connection_driver,
+            connection_details=self._connection_details,
+            config_path=self.config_path,
         )
 
         if self._table:
@@ -0,0 +1,189 @@
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+from timeit import default_timer as timer
+
+
+class CacheStore:
+    """The interface of the stores used by the QueryCache.
+
+    A store only needs to get, put and forget values by a string key. Values put in a store
+    are lists of row dictionaries or small dictionaries, so stores backed by an external
+    service like Redis can serialize them with pickle or json.
+    """
+
+    def get(self, key):
+        """Gets a value from the store.
+
+        Arguments:
+            key {string} -- The cache key.
+
+        Returns:
+            mixed|None -- None when the key is missing or expired.
+        """
+        raise NotImplementedError
+
+    def put(self, key, value, ttl=None):
+        """Puts a value in the store.
+
+        Arguments:
+            key {string} -- The cache key.
+            value {mixed} -- The value to store.
+
+        Keyword Arguments:
+            ttl {int|float|None} -- The number of seconds the value is kept. None keeps it until it is evicted. (default: {None})
+        """
+        raise NotImplementedError
+
+    def forget(self, key):
+        raise NotImplementedError
+
+    def flush(self):
+        raise NotImplementedError
+
+    def stats(self):
+        return {}
+
+
+class MemoryStore(CacheStore):
+    """A thread safe, size bounded least recently used store kept in the process memory."""
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= timer():
+                del self._values[key]
+                return None
+
+            self._values.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl=None):
+        expires_at = None if ttl is None else timer() + ttl
+        with self._lock:
+            self._values[key] = (value, expires_at)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def forget(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def flush(self):
+        with self._lock:
+            self._values.clear()
+
+    def stats(self):
+        return {"size": len(self._values), "max_size": self.max_size}
+
+    def __len__(self):
+        return len(self._values)
+
+
+class QueryCache:
+    """Caches the results of select queries run with QueryBuilder.remember().
+
+    Every cached result is tagged with the tables of its query. Each table has a version
+    kept in the store, and writes made through the ORM to a table give it a new version,
+    which invalidates every result tagged with it. Because invalidation only replaces a
+    single key per table, it works the same on any store implementing CacheStore.
+    """
+
+    prefix = "masoniteorm:query"
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else MemoryStore()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, *parts):
+        """Builds a cache key from the compiled SQL, the bindings and the connection of a query."""
+        digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+        return f"{self.prefix}:{digest}"
+
+    def get(self, key, tags):
+        """Gets a cached result if none of its tables were written to since it was cached.
+
+        Arguments:
+            key {string} -- The cache key.
+            tags {list} -- The tags of the tables the query reads.
+
+        Returns:
+            list|dict|None
+        """
+        entry = self.store.get(key)
+        if entry is None or entry["versions"] != self.get_versions(tags):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._copy(entry["result"])
+
+    def put(self, key, tags, result, ttl=None):
+        self.store.put(
+            key,
+            {"versions": self.get_versions(tags), "result": self._copy(result)},
+            ttl,
+        )
+
+    def get_versions(self, tags):
+        versions = []
+        for tag in tags:
+            tag_key = f"{self.prefix}:tag:{tag}"
+            version = self.store.get(tag_key)
+            if version is None:
+                version = uuid.uuid4().hex
+                self.store.put(tag_key, version)
+            versions.append(version)
+
+        return versions
+
+    def invalidate(self, *tags):
+        """Invalidates every result tagged with one of the given tags.
+
+        Arguments:
+            tags {string} -- Table tags built by QueryBuilder, in the form "database.table".
+        """
+        for tag in tags:
+            self.store.put(f"{self.prefix}:tag:{tag}", uuid.uuid4().hex)
+
+    def flush(self):
+        self.store.flush()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Gets the hit and miss counters of the cache along with the counters of its store.
+
+        Returns:
+            dict
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+        stats.update(self.store.stats())
+        return stats
+
+    def _copy(self, result):
+        # Callers may change the rows they get back so the cached rows are never shared
+        if isinstance(result, list):
+            return [dict(row) for row in result]
+
+        if isinstance(result, dict):
+            return dict(result)
+
+        return result
@@ -1 +1,4 @@
 from .QueryBuilder import QueryBuilder
+from .AsyncQueryBuilder import AsyncQueryBuilder
+from .IdentityMap import IdentityMap
+from .QueryCache import CacheStore, MemoryStore, QueryCache
@@ -7,10 +7,19 @@ from ...expressions.expressions import (
     JoinClause,
     OnClause,
 )
+from .StatementCache import StatementCache
 
+MULTIPLE_SPACES = re.compile(" {2,}")
 
-class BaseGrammar:
 
+def collapse_spaces(sql):
+    """Replaces runs of spaces left behind by empty clauses with a single space.
+    Only runs of two or more spaces are matched so the single spaces between the
+    placeholders of large IN lists and VALUES rows are not rewritten."""
+    return MULTIPLE_SPACES.sub(" ", sql)
+
+
+class BaseGrammar:
     """The keys in this dictionary is how the ORM will reference these aggregates
 
     The values on the right are the matching functions for the grammar
@@ -21,6 +30,25 @@ class BaseGrammar:
 
     table = "users"
 
+    # Compiled select statements shared by all grammars. The grammar class is part of the key.
+    statement_cache = StatementCache()
+
+    # The most bound parameters the database accepts in a single statement
+    max_bindings = 65535
+
+    # The most rows a single multi row INSERT statement may contain. None when unlimited.
+    max_insert_rows = None
+
+    # Whether inserts can return the inserted rows (RETURNING or OUTPUT clauses)
+    supports_returning = False
+
+    # Whether a where_in list can be bound as a single array parameter
+    supports_array_binding = False
+
+    # The most values a where_in list may contain before the builder switches to its large list
+    # strategy. None uses half of max_bindings so the query's other bindings still fit.
+    where_in_threshold = None
+
     def __init__(
         self,
         columns=(),
@@ -38,6 +66,7 @@ class BaseGrammar:
         lock=False,
         having=(),
         connection_details=None,
+        upsert=None,
     ):
         self._columns = columns
         self.table = table
@@ -54,6 +83,7 @@ class BaseGrammar:
         self._having = having
         self.lock = lock
         self._connection_details = connection_details or {}
+        self._upsert = upsert
         self._column = None
 
         self._bindings = []
@@ -66,8 +96,188 @@ class BaseGrammar:
 
     def compile(self, action, qmark=False):
         self._action = action
+        if action == "select" and qmark and self.statement_cache.enabled:
+            return self._compile_select_cached()
+
         return getattr(self, "_compile_" + action)(qmark=qmark)
 
+    def _compile_select_cached(self):
+        """Compiles a qmark select statement, reusing the SQL of a previous query with the same shape.
+
+        Returns:
+            self
+        """
+        fingerprint = self.get_fingerprint()
+        if fingerprint is None:
+            return self._compile_select(qmark=True)
+
+        key, bindings = fingerprint
+        sql = self.statement_cache.get(key)
+        if sql is not None:
+            self._sql = sql
+            self._bindings = bindings
+            return self
+
+        self._compile_select(qmark=True)
+
+        # Only reuse the statement when the fingerprint extracted the same bindings
+        if list(self._bindings) == bindings:
+            self.statement_cache.put(key, self._sql)
+
+        return self
+
+    def get_fingerprint(self):
+        """Gets a structural fingerprint of the select query along with its bindings in the
+        order the grammar adds them. Queries with the same fingerprint compile to the same SQL.
+
+        Returns:
+            tuple|None -- A (key, bindings) tuple or None when the query can not be cached,
+                for example when it contains sub queries.
+        """
+        bindings = []
+
+        columns = []
+        for column in self._columns:
+            if isinstance(column, SelectExpression):
+                columns.append((column.column, column.alias, column.raw))
+            elif isinstance(column, str):
+                columns.append(column)
+            else:
+                return None
+
+        joins = []
+        for join in self._joins:
+            if not isinstance(join, JoinClause):
+                return None
+
+            clauses = []
+            for clause in join.get_on_clauses():
+                if isinstance(clause, OnClause):
+                    clauses.append(
+                        (
+                            clause.column1,
+                            clause.equality,
+                            clause.column2,
+                            clause.operator,
+                        )
+                    )
+                elif clause.value_type in ("NULL", "NOT NULL"):
+                    clauses.append((clause.column, clause.value_type, clause.operator))
+                else:
+                    clauses.append((clause.column, clause.equality, clause.operator))
+                    bindings.append(clause.value)
+
+            joins.append((join.table, join.alias, join.clause, tuple(clauses)))
+
+        wheres = []
+        for where in self._wheres:
+            where_key = self._get_where_fingerprint(where, bindings)
+            if where_key is None:
+                return None
+            wheres.append(where_key)
+
+        order_by = []
+        for order in self._order_by:
+            if order.raw:
+                if not isinstance(order.bindings, (list, tuple)):
+                    return None
+                bindings.extend(order.bindings)
+            order_by.append((order.column, order.direction, order.raw))
+
+        group_by = []
+        for group in self._group_by:
+            group_by.append((group.column, group.raw))
+            if group.raw:
+                # Compilation stops at the first raw group by
+                bindings.extend(group.bindings or ())
+                break
+
+        table = self.table
+        if table is not None and not isinstance(table, str):
+            table = (table.name, table.raw)
+
+        key = (
+            self.__class__,
+            table,
+            self._connection_details.get("database"),
+            self._connection_details.get("prefix"),
+            self._distinct,
+            tuple(columns),
+            tuple(
+                (aggregate.aggregate, aggregate.column, aggregate.alias)
+                for aggregate in self._aggregates
+            ),
+            tuple(joins),
+            tuple(wheres),
+            tuple(order_by),
+            tuple(group_by),
+            tuple(
+                (
+                    having.column,
+                    having.equality,
+                    type(having.value),
+                    having.value,
+                    having.raw,
+                )
+                for having in self._having
+            ),
+            (type(self._limit), self._limit),
+            (type(self._offset), self._offset),
+            self.lock,
+        )
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key, bindings
+
+    def _get_where_fingerprint(self, where, bindings):
+        """Mirrors the branches process_wheres takes for a qmark query."""
+        keyword = getattr(where, "keyword", None)
+
+        if where.raw:
+            if not isinstance(where.bindings, (list, tuple)):
+                return None
+            bindings.extend(where.bindings)
+            return ("raw", where.column, keyword)
+
+        value = where.value
+        value_type = where.value_type
+        equality = where.equality.upper()
+
+        if isinstance(value, (SubGroupExpression, SubSelectExpression)):
+            return None
+
+        where_key = (where.__class__, where.column, equality, value_type, keyword)
+
+        if equality == "BETWEEN":
+            bindings.extend((where.low, where.high))
+        elif equality == "NOT BETWEEN":
+            where_key += (type(where.low), where.low, type(where.high), where.high)
+
+        if isinstance(value, list):
+            if value_type == "array" and self.supports_array_binding:
+                bindings.append(value)
+                return where_key + ("array",)
+            bindings.extend(value)
+            return where_key + ("list", len(value))
+        elif value is True and value_type != "NOT NULL":
+            return where_key + ("true",)
+        elif value is False and value_type != "NOT NULL":
+            return where_key + ("false",)
+        elif value_type != "column":
+            if value is not True and value_type not in (
+                "value_equals",
+                "NULL",
+                "BETWEEN",
+            ):
+                bindings.append(value)
+                return where_key + ("binding",)
+
+        return where_key + ("inline", type(value), value)
+
     def _compile_select(self, qmark=False):
         """Compile a select query statement.
 
@@ -117,6 +327,48 @@ class BaseGrammar:
 
         return self
 
+    def _compile_exists(self, qmark=False):
+        """Compiles a query checking whether the select query matches any row. Only a
+        constant is selected from at most one row so the database stops at the first match.
+
+        Keyword Arguments:
+            qmark {bool} -- Whether to bind the values of the query. (default: {False})
+
+        Returns:
+            self
+        """
+        # The columns of the wheres and joins are compiled like the ones of a select
+        self._action = "select"
+        limit = self._limit
+        if not limit:
+            self._limit = 1
+
+        query = self.select_format().format(
+            columns="1",
+            keyword="",
+            table=self.process_table(self.table),
+            joins=self.process_joins(qmark=qmark),
+            wheres=self.process_wheres(qmark=qmark),
+            limit=self.process_limit(),
+            offset=self.process_offset(),
+            aggregates="",
+            # The order only matters when rows are skipped
+            order_by=self.process_order_by() if self._offset else "",
+            group_by=self.process_group_by(),
+            having=self.process_having(),
+            lock=self.process_locks(),
+        )
+        self._limit = limit
+
+        self._sql = self.exists_format().format(
+            query=collapse_spaces(query.strip()), alias="m_exists_reserved"
+        )
+
+        return self
+
+    def exists_format(self):
+        return "SELECT EXISTS({query}) AS {alias}"
+
     def _compile_update(self, qmark=False):
         """Compiles an update query statement.
 
@@ -149,7 +401,7 @@ class BaseGrammar:
 
         return self
 
-    def _compile_bulk_create(self, qmark=False):
+    def _compile_bulk_create(self, qmark=False, returning=False):
         """Compiles an insert expression.
 
         Returns:
@@ -157,7 +409,13 @@ class BaseGrammar:
         """
         all_values = [list(x.values()) for x in self._columns]
 
-        self._sql = self.bulk_insert_format().format(
+        sql_format = (
+            self.bulk_insert_returning_format()
+            if returning
+            else self.bulk_insert_format()
+        )
+
+        self._sql = sql_format.format(
             key_equals=self._compile_key_value_equals(qmark=qmark),
             table=self.process_table(self.table),
             columns=self.columnize_bulk_columns(list(self._columns[0].keys())),
@@ -165,39 +423,136 @@ class BaseGrammar:
         )
         return self
 
+    def _compile_bulk_create_returning(self, qmark=False):
+        """Compiles a multi row insert expression that returns the inserted rows.
+
+        Returns:
+            self
+        """
+        return self._compile_bulk_create(qmark=qmark, returning=True)
+
+    def bulk_insert_returning_format(self):
+        return self.bulk_insert_format()
+
+    def _compile_upsert(self, qmark=False):
+        """Compiles a multi row insert that updates the existing rows conflicting on the unique columns.
+
+        Returns:
+            self
+        """
+        columns = list(self._columns[0].keys())
+        all_values = [list(x.values()) for x in self._columns]
+
+        self._sql = self.upsert_format(
+            columns, self._upsert.unique_by, self.get_upsert_update_columns(columns)
+        ).format(
+            table=self.process_table(self.table),
+            columns=self.columnize_bulk_columns(columns),
+            values=self.columnize_bulk_values(all_values, qmark=qmark),
+        )
+        return self
+
+    def get_upsert_update_columns(self, columns):
+        """Gets the columns an upsert updates. Defaults to every inserted column that is not unique."""
+        if self._upsert.update is not None:
+            return self._upsert.update
+
+        return [column for column in columns if column not in self._upsert.unique_by]
+
+    def upsert_format(self, columns, unique_by, updates):
+        """Gets the format of an upsert statement. The {table}, {columns} and {values}
+        placeholders are filled in the same way as for bulk inserts.
+
+        Arguments:
+            columns {list} -- The inserted columns.
+            unique_by {list} -- The columns that identify an existing row.
+            updates {list} -- The columns to update when the row exists.
+
+        Returns:
+            string
+        """
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' does not support upserts"
+        )
+
+    def wrap_column(self, column):
+        return self.column_string().format(column=column, separator="")
+
+    @classmethod
+    def get_bulk_batch_size(cls, column_count, batch_size=None):
+        """Gets the number of rows that can be inserted by a single multi row INSERT statement.
+
+        Arguments:
+            column_count {int} -- The number of columns of each row.
+
+        Keyword Arguments:
+            batch_size {int|None} -- The requested number of rows per statement. (default: {None})
+
+        Returns:
+            int
+        """
+        size = max(cls.max_bindings // max(column_count, 1), 1)
+        if cls.max_insert_rows:
+            size = min(size, cls.max_insert_rows)
+
+        if batch_size:
+            size = min(size, batch_size)
+
+        return size
+
+    @classmethod
+    def get_where_in_threshold(cls, threshold=None):
+        """Gets the number of values a where_in list may contain before it is bound as an
+        array or split over several queries.
+
+        Keyword Arguments:
+            threshold {int|None} -- The threshold configured on the connection. (default: {None})
+
+        Returns:
+            int
+        """
+        if threshold:
+            return threshold
+
+        return cls.where_in_threshold or max(cls.max_bindings // 2, 1)
+
     def columnize_bulk_columns(self, columns=[]):
         return ", ".join(
             self.column_string().format(column=x, separator="") for x in columns
         ).rstrip(",")
 
     def columnize_bulk_values(self, columns=[], qmark=False):
-        sql = ""
+        # Rows are collected in a list and joined once so compiling stays linear in the number of values
+        rows = []
+        row_string = self.process_value_string()
+        value_string = self.value_string()
+        placeholders = {}
         for x in columns:
-            inner = ""
             if isinstance(x, list):
-                for y in x:
-                    if qmark:
-                        self.add_binding(y)
-                    inner += (
-                        "'?', "
-                        if qmark
-                        else self.value_string().format(value=y, separator=", ")
-                    )
-
-                inner = inner.rstrip(", ")
-                sql += self.process_value_string().format(value=inner, separator=", ")
-            else:
                 if qmark:
-                    self.add_binding(x)
-                sql += (
-                    "'?', "
-                    if qmark
-                    else self.process_value_string().format(
-                        value="?" if qmark else x, separator=", "
+                    self._bindings.extend(x)
+                    # Every row with the same number of values compiles to the same placeholders
+                    row = placeholders.get(len(x))
+                    if row is None:
+                        row = placeholders[len(x)] = row_string.format(
+                            value=", ".join(["'?'"] * len(x)), separator=""
+                        )
+                else:
+                    row = row_string.format(
+                        value=", ".join(
+                            value_string.format(value=y, separator="") for y in x
+                        ),
+                        separator="",
                     )
-                )
+            elif qmark:
+                self.add_binding(x)
+                row = "'?'"
+            else:
+                row = row_string.format(value=x, separator="")
+
+            rows.append(row)
 
-        return sql.rstrip(", ")
+        return ", ".join(rows)
 
     def process_value_string(self):
         return "({value}){separator}"
@@ -632,7 +987,7 @@ class BaseGrammar:
             """If the value should actually be a sub query then we need to wrap it in a query here
             """
             if isinstance(value, SubGroupExpression):
-                grammar = value.builder.get_grammar()
+                grammar = value.builder.get_grammar(qmark=qmark)
                 query_value = (
                     self.subquery_string()
                     .format(
@@ -654,16 +1009,27 @@ class BaseGrammar:
                     query_from_builder = value.builder.to_sql()
                 query_value = self.subquery_string().format(query=query_from_builder)
             elif isinstance(value, list):
-                query_value = "("
-                for val in value:
-                    if qmark:
-                        query_value += "'?', "
-                        self.add_binding(val)
+                if qmark and value_type == "array" and self.supports_array_binding:
+                    # The whole list is bound as one array parameter
+                    self.add_binding(value)
+                    query_value = "'?'"
+                    if equality == "NOT IN":
+                        sql_string = self.where_not_any_string()
                     else:
-                        query_value += self.value_string().format(
-                            value=val, separator=","
+                        sql_string = self.where_any_string()
+                elif qmark:
+                    self.add_binding(*value)
+                    query_value = "(" + ", ".join(["'?'"] * len(value)) + ")"
+                else:
+                    value_string = self.value_string()
+                    query_value = (
+                        "("
+                        + ",".join(
+                            value_string.format(value=val, separator="")
+                            for val in value
                         )
-                query_value = query_value.rstrip(",").rstrip(", ") + ")"
+                        + ")"
+                    )
             elif value is True and value_type != "NOT NULL":
                 sql_string = self.get_true_column_string()
                 query_value = 1
@@ -715,7 +1081,7 @@ class BaseGrammar:
         Arguments:
             binding {string} -- A value to bind.
         """
-        self._bindings += bindings
+        self._bindings.extend(bindings)
 
     def column_exists(self, column):
         """Check if a column exists
@@ -764,7 +1130,7 @@ class BaseGrammar:
         Returns:
             string
         """
-        return re.sub(" +", " ", self._sql.strip())
+        return collapse_spaces(self._sql.strip())
 
     def to_qmark(self):
         """Cleans up the SQL string and returns the SQL
@@ -772,7 +1138,7 @@ class BaseGrammar:
         Returns:
             string
         """
-        return re.sub(" +", " ", self._sql.strip())
+        return collapse_spaces(self._sql.strip())
 
     # TODO: Inspect this can't just be used by another method. seems duplicative
     def process_columns(self, separator="", action="select", qmark=False):
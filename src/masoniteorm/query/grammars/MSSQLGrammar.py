@@ -4,6 +4,13 @@ from .BaseGrammar import BaseGrammar
 class MSSQLGrammar(BaseGrammar):
     """Microsoft SQL Server grammar class."""
 
+    # SQL Server accepts 2100 parameters per request, and the driver may use one of them
+    max_bindings = 2099
+
+    max_insert_rows = 1000
+
+    supports_returning = True
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -38,6 +45,9 @@ class MSSQLGrammar(BaseGrammar):
     def select_format(self):
         return "SELECT {keyword} {limit} {columns} FROM {table} {lock} {joins} {wheres} {group_by} {having} {order_by} {offset}"
 
+    def exists_format(self):
+        return "SELECT CASE WHEN EXISTS({query}) THEN 1 ELSE 0 END AS {alias}"
+
     def update_format(self):
         return "UPDATE {table} SET {key_equals} {wheres}"
 
@@ -47,6 +57,34 @@ class MSSQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def bulk_insert_returning_format(self):
+        return "INSERT INTO {table} ({columns}) OUTPUT INSERTED.* VALUES {values}"
+
+    def upsert_format(self, columns, unique_by, updates):
+        on = " AND ".join(
+            f"[target].{self.wrap_column(column)} = [source].{self.wrap_column(column)}"
+            for column in unique_by
+        )
+        source_columns = ", ".join(
+            f"[source].{self.wrap_column(column)}" for column in columns
+        )
+
+        sql = (
+            "MERGE INTO {table} AS [target] USING (VALUES {values}) AS [source] ({columns}) "
+            f"ON {on} "
+        )
+        if updates:
+            updates = ", ".join(
+                f"[target].{self.wrap_column(column)} = [source].{self.wrap_column(column)}"
+                for column in updates
+            )
+            sql += f"WHEN MATCHED THEN UPDATE SET {updates} "
+
+        return (
+            sql
+            + f"WHEN NOT MATCHED THEN INSERT ({{columns}}) VALUES ({source_columns});"
+        )
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -63,6 +63,17 @@ class MySQLGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def upsert_format(self, columns, unique_by, updates):
+        # MySQL detects the conflict on any unique index of the table
+        if not updates:
+            updates = unique_by[:1]
+
+        updates = ", ".join(
+            f"{self.wrap_column(column)} = VALUES({self.wrap_column(column)})"
+            for column in updates
+        )
+        return f"INSERT INTO {{table}} ({{columns}}) VALUES {{values}} ON DUPLICATE KEY UPDATE {updates}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -1,10 +1,15 @@
-from .BaseGrammar import BaseGrammar
-import re
+from .BaseGrammar import BaseGrammar, collapse_spaces
 
 
 class PostgresGrammar(BaseGrammar):
     """Postgres grammar class."""
 
+    supports_returning = True
+
+    supports_array_binding = True
+
+    where_in_threshold = 1000
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -48,6 +53,17 @@ class PostgresGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values} RETURNING *"
 
+    def upsert_format(self, columns, unique_by, updates):
+        unique_by = ", ".join(self.wrap_column(column) for column in unique_by)
+        if not updates:
+            return f"INSERT INTO {{table}} ({{columns}}) VALUES {{values}} ON CONFLICT ({unique_by}) DO NOTHING"
+
+        updates = ", ".join(
+            f"{self.wrap_column(column)} = EXCLUDED.{self.wrap_column(column)}"
+            for column in updates
+        )
+        return f"INSERT INTO {{table}} ({{columns}}) VALUES {{values}} ON CONFLICT ({unique_by}) DO UPDATE SET {updates}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -132,13 +148,13 @@ class PostgresGrammar(BaseGrammar):
             sql = ""
             for query in self.queries:
                 query += "; "
-                sql += re.sub(" +", " ", query)
+                sql += collapse_spaces(query)
             return sql.rstrip(" ")
         else:
-            sql = re.sub(" +", " ", self._sql.strip().replace(",)", ")"))
+            sql = collapse_spaces(self._sql.strip().replace(",)", ")"))
             for query in self.queries:
                 sql += "; "
-                sql += re.sub(" +", " ", query.strip())
+                sql += collapse_spaces(query.strip())
 
             return sql
 
@@ -187,6 +203,12 @@ class PostgresGrammar(BaseGrammar):
     def where_string(self):
         return " {keyword} {column} {equality} {value}"
 
+    def where_any_string(self):
+        return " {keyword} {column} = ANY({value})"
+
+    def where_not_any_string(self):
+        return " {keyword} {column} <> ALL({value})"
+
     def having_string(self):
         return "HAVING {column}"
 
@@ -1,10 +1,13 @@
-from .BaseGrammar import BaseGrammar
-import re
+from .BaseGrammar import BaseGrammar, collapse_spaces
 
 
 class SQLiteGrammar(BaseGrammar):
     """SQLite grammar class."""
 
+    max_bindings = 999
+
+    supports_returning = True
+
     aggregate_options = {
         "SUM": "SUM",
         "MAX": "MAX",
@@ -48,6 +51,20 @@ class SQLiteGrammar(BaseGrammar):
     def bulk_insert_format(self):
         return "INSERT INTO {table} ({columns}) VALUES {values}"
 
+    def bulk_insert_returning_format(self):
+        return "INSERT INTO {table} ({columns}) VALUES {values} RETURNING *"
+
+    def upsert_format(self, columns, unique_by, updates):
+        unique_by = ", ".join(self.wrap_column(column) for column in unique_by)
+        if not updates:
+            return f"INSERT INTO {{table}} ({{columns}}) VALUES {{values}} ON CONFLICT ({unique_by}) DO NOTHING"
+
+        updates = ", ".join(
+            f"{self.wrap_column(column)} = EXCLUDED.{self.wrap_column(column)}"
+            for column in updates
+        )
+        return f"INSERT INTO {{table}} ({{columns}}) VALUES {{values}} ON CONFLICT ({unique_by}) DO UPDATE SET {updates}"
+
     def delete_format(self):
         return "DELETE FROM {table} {wheres}"
 
@@ -121,13 +138,13 @@ class SQLiteGrammar(BaseGrammar):
             sql = ""
             for query in self.queries:
                 query += "; "
-                sql += re.sub(" +", " ", query)
+                sql += collapse_spaces(query)
             return sql.rstrip(" ")
         else:
-            sql = re.sub(" +", " ", self._sql.strip().replace(",)", ")"))
+            sql = collapse_spaces(self._sql.strip().replace(",)", ")"))
             for query in self.queries:
                 sql += "; "
-                sql += re.sub(" +", " ", query.strip())
+                sql += collapse_spaces(query.strip())
 
             return sql
 
@@ -0,0 +1,71 @@
+import threading
+from collections import OrderedDict
+
+
+class StatementCache:
+    """A thread safe least recently used cache of compiled SQL statements keyed by the
+    structural fingerprint of a query."""
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._statements = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Gets the compiled SQL for a fingerprint.
+
+        Arguments:
+            key {tuple} -- The query fingerprint.
+
+        Returns:
+            string|None
+        """
+        with self._lock:
+            sql = self._statements.get(key)
+            if sql is None:
+                self.misses += 1
+                return None
+
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return sql
+
+    def put(self, key, sql):
+        with self._lock:
+            self._statements[key] = sql
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def enable(self):
+        self.enabled = True
+        return self
+
+    def disable(self):
+        self.enabled = False
+        return self
+
+    def stats(self):
+        """Gets the cache counters.
+
+        Returns:
+            dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._statements),
+            "max_size": self.max_size,
+        }
+
+    def __len__(self):
+        return len(self._statements)
@@ -2,3 +2,4 @@ from .SQLiteGrammar import SQLiteGrammar
 from .PostgresGrammar import PostgresGrammar
 from .MySQLGrammar import MySQLGrammar
 from .MSSQLGrammar import MSSQLGrammar
+from .StatementCache import StatementCache
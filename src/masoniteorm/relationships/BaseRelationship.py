@@ -143,6 +143,88 @@ class BaseRelationship:
             {self.foreign_key: getattr(current_model, self.local_key)}
         )
 
+    def map_related(self, related_result):
+        """Indexes eager loaded records by their foreign key so they can be registered on
+        the models they belong to.
+
+        Arguments:
+            related_result {Collection} -- The eager loaded records.
+
+        Returns:
+            dict -- Lists of records keyed by their foreign key value.
+        """
+        return self.index_related(related_result, self.foreign_key)
+
+    @staticmethod
+    def index_related(related_result, key):
+        """Groups records by the value of a column in a single pass. Values are read from the
+        raw attributes of the models instead of going through their attribute accessors.
+
+        Arguments:
+            related_result {Collection} -- A collection of models or dictionaries.
+            key {string} -- The column to group by.
+
+        Returns:
+            dict
+        """
+        index = {}
+        for record in related_result:
+            attributes = record if isinstance(record, dict) else record.__attributes__
+            value = attributes.get(key)
+            if value in index:
+                index[value].append(record)
+            else:
+                index[value] = [record]
+
+        return index
+
+    @staticmethod
+    def index_related_by(related_result, *keys):
+        """Groups records by the values of one or more columns in a single pass. The values
+        are compared as strings, like Collection.where does, so keys stored as strings still
+        match integer keys.
+
+        Arguments:
+            related_result {Collection} -- A collection of models or dictionaries.
+            keys {string} -- The columns to group by.
+
+        Returns:
+            dict -- Lists of records keyed by a tuple of the column values as strings.
+        """
+        index = {}
+        for record in related_result:
+            attributes = record if isinstance(record, dict) else record.__attributes__
+            value = tuple(str(attributes.get(key)) for key in keys)
+            if value in index:
+                index[value].append(record)
+            else:
+                index[value] = [record]
+
+        return index
+
+    @staticmethod
+    def index_morphed(related_result):
+        """Groups the models of several morphed model classes by their class and primary key.
+
+        Arguments:
+            related_result {Collection} -- A collection of models.
+
+        Returns:
+            dict -- Lists of models keyed by their class and their primary key as a string.
+        """
+        index = {}
+        for record in related_result:
+            value = (
+                record.__class__,
+                str(record.__attributes__.get(record.get_primary_key())),
+            )
+            if value in index:
+                index[value].append(record)
+            else:
+                index[value] = [record]
+
+        return index
+
     def get_related(self, query, relation, eagers=None, callback=None):
         eagers = eagers or []
         builder = self.get_builder().with_(eagers)
@@ -62,7 +62,7 @@ class BelongsTo(BaseRelationship):
                 getattr(relation, self.local_key),
             ).first()
 
-    def register_related(self, key, model, collection):
-        related = collection.get(getattr(model, self.local_key), None)
+    def register_related(self, key, model, related_index):
+        related = related_index.get(model.get_raw_attribute(self.local_key))
 
         model.add_relation({key: related[0] if related else None})
@@ -139,7 +139,7 @@ class BelongsToMany(BaseRelationship):
                     pivot_data.update({field: getattr(model, field)})
                     model.delete_attribute(field)
 
-            model.__original_attributes__.update(
+            model.fill_original(
                 {
                     self._as: (
                         Pivot.on(query.connection)
@@ -275,7 +275,7 @@ class BelongsToMany(BaseRelationship):
                     pivot_data.update({field: getattr(model, field)})
                     model.delete_attribute(field)
 
-            model.__original_attributes__.update(
+            model.fill_original(
                 {
                     self._as: (
                         Pivot.on(builder.connection)
@@ -348,14 +348,12 @@ class BelongsToMany(BaseRelationship):
 
         return result
 
-    def register_related(self, key, model, collection):
-        model.add_relation(
-            {
-                key: collection.where(
-                    f"{self._table}_id", getattr(model, self.local_owner_key)
-                )
-            }
-        )
+    def map_related(self, related_result):
+        return self.index_related_by(related_result, f"{self._table}_id")
+
+    def register_related(self, key, model, related_index):
+        related = related_index.get((str(getattr(model, self.local_owner_key)),), [])
+        model.add_relation({key: Collection(related)})
 
     def joins(self, builder, clause=None):
         if not self._table:
@@ -26,7 +26,11 @@ class HasMany(BaseRelationship):
         self.foreign_key = self.foreign_key or f"{attribute}_id"
         return self
 
-    def register_related(self, key, model, collection):
+    def register_related(self, key, model, related_index):
         model.add_relation(
-            {key: collection.get(getattr(model, self.local_key)) or Collection()}
+            {
+                key: Collection(
+                    related_index.get(model.get_raw_attribute(self.local_key), [])
+                )
+            }
         )
@@ -62,9 +62,7 @@ class HasOne(BaseRelationship):
                 getattr(relation, self.local_key),
             ).first()
 
-    def register_related(self, key, model, collection):
-        related = collection.where(
-            self.foreign_key, getattr(model, self.local_key)
-        ).first()
+    def register_related(self, key, model, related_index):
+        related = related_index.get(model.get_raw_attribute(self.local_key))
 
-        model.add_relation({key: related or None})
+        model.add_relation({key: related[0] if related else None})
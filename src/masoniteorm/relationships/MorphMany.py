@@ -1,6 +1,6 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
-from ..config import load_config
+from ..connections.ConnectionResolver import ConnectionResolver
 
 
 class MorphMany(BaseRelationship):
@@ -127,25 +127,24 @@ class MorphMany(BaseRelationship):
                 .get()
             )
 
-    def register_related(self, key, model, collection):
+    def map_related(self, related_result):
+        return self.index_related_by(related_result, self.morph_key, self.morph_id)
+
+    def register_related(self, key, model, related_index):
         record_type = self.get_record_key_lookup(model)
-        related = collection.where(self.morph_key, record_type).where(
-            self.morph_id, model.get_primary_key_value()
+        related = related_index.get(
+            (str(record_type), str(model.get_primary_key_value())), []
         )
 
-        model.add_relation({key: related})
+        model.add_relation({key: Collection(related)})
 
     def morph_map(self):
-        return load_config().DB._morph_map
+        return ConnectionResolver.get_morph_map()
 
     def get_record_key_lookup(self, relation):
-        record_type = None
-        for record_type_loop, model in self.morph_map().items():
-            if model == relation.__class__:
-                record_type = record_type_loop
-                break
+        record_type = ConnectionResolver.get_morph_key(relation.__class__)
 
-        if not record_type:
+        if record_type is None:
             raise ValueError(
                 f"Could not find the record type key for the {relation} class"
             )
@@ -1,6 +1,6 @@
 from ..collection import Collection
 from .BaseRelationship import BaseRelationship
-from ..config import load_config
+from ..connections.ConnectionResolver import ConnectionResolver
 
 
 class MorphTo(BaseRelationship):
@@ -62,7 +62,9 @@ class MorphTo(BaseRelationship):
         Returns:
             dict -- A dictionary of data which will be hydrated.
         """
-        model = self.morph_map().get(instance.__attributes__[self.morph_key])
+        model = ConnectionResolver.get_morph_model(
+            instance.__attributes__[self.morph_key]
+        )
         record = instance.__attributes__[self.morph_id]
 
         return model.where(model.get_primary_key(), record).first()
@@ -82,7 +84,7 @@ class MorphTo(BaseRelationship):
         if isinstance(relation, Collection):
             relations = Collection()
             for group, items in relation.group_by(self.morph_key).items():
-                morphed_model = self.morph_map().get(group)
+                morphed_model = ConnectionResolver.get_morph_model(group)
                 relations.merge(
                     morphed_model.where_in(
                         f"{morphed_model.get_table_name()}.{morphed_model.get_primary_key()}",
@@ -93,18 +95,22 @@ class MorphTo(BaseRelationship):
                 )
             return relations
         else:
-            model = self.morph_map().get(getattr(relation, self.morph_key))
+            model = ConnectionResolver.get_morph_model(
+                getattr(relation, self.morph_key)
+            )
             if model:
                 return model.find(getattr(relation, self.morph_id))
 
-    def register_related(self, key, model, collection):
-        morphed_model = self.morph_map().get(getattr(model, self.morph_key))
+    def map_related(self, related_result):
+        return self.index_morphed(related_result)
 
-        related = collection.where(
-            morphed_model.get_primary_key(), getattr(model, self.morph_id)
-        ).first()
+    def register_related(self, key, model, related_index):
+        morphed_model = ConnectionResolver.get_morph_model(
+            getattr(model, self.morph_key)
+        )
+        related = related_index.get((morphed_model, str(getattr(model, self.morph_id))))
 
-        model.add_relation({key: related})
+        model.add_relation({key: related[0] if related else None})
 
     def relate(self, related_record):
         raise NotImplementedError(
@@ -122,7 +128,7 @@ class MorphTo(BaseRelationship):
         )
 
     def morph_map(self):
-        return load_config().DB._morph_map
+        return ConnectionResolver.get_morph_map()
 
     def attach(self, current_model, related_record):
         raise NotImplementedError(
@@ -1,3 +1,8 @@
+import copy
+
+from .SchemaCache import SchemaCache
+
+
 class Blueprint:
     """Used for building schemas for creating, modifying or altering schema."""
 
@@ -11,6 +16,8 @@ class Blueprint:
         action=None,
         default_string_length=None,
         dry=False,
+        cache_key=None,
+        cache_ttl=None,
     ):
         self.grammar = grammar
         self.table = table
@@ -21,6 +28,8 @@ class Blueprint:
         self._dry = dry
         self._action = action
         self.connection = connection
+        self.cache_key = cache_key
+        self.cache_ttl = cache_ttl
         if not platform:
             self.platform = self.connection.get_default_platform()
 
@@ -755,21 +764,46 @@ class Blueprint:
             return self.platform().compile_create_sql(self.table, if_not_exists=True)
         else:
             if not self._dry:
-                # get current table schema
-                table = self.platform().get_current_schema(
-                    self.connection, self.table.name, schema=self.schema
-                )
-                self.table.from_table = table
+                self.table.from_table = self.get_current_table()
 
             return self.platform().compile_alter_sql(self.table)
 
+    def get_current_table(self):
+        """Gets the current schema of the altered table, shared with Schema.get_columns() through
+        SchemaCache.
+
+        Returns:
+            masoniteorm.schema.Table -- A copy of the cached table, as the SQLite platform changes
+                the current table while compiling the alter statements.
+        """
+        table = SchemaCache.remember(
+            self.cache_key,
+            self.table.name,
+            "columns",
+            lambda: self.platform().get_current_schema(
+                self.connection, self.table.name, schema=self.schema
+            ),
+            ttl=self.cache_ttl,
+        )
+
+        return copy.deepcopy(table)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         if self._dry:
             return
-        return self.connection.query(self.to_sql(), ())
+
+        try:
+            return self.connection.query(self.to_sql(), ())
+        finally:
+            if self.cache_key is not None:
+                tables = [self.table.name]
+                if getattr(self.table, "new_name", None):
+                    tables.append(self.table.new_name)
+
+                SchemaCache.forget(self.cache_key, *tables)
 
     def nullable(self):
         """Sets the last columns created as nullable
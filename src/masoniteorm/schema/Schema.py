@@ -1,4 +1,5 @@
 from .Blueprint import Blueprint
+from .SchemaCache import SchemaCache
 from .Table import Table
 from .TableDiff import TableDiff
 from ..exceptions import ConnectionNotRegistered
@@ -138,6 +139,8 @@ class Schema:
             schema=self.schema,
             default_string_length=self._default_string_length,
             dry=self._dry,
+            cache_key=self.get_cache_key(),
+            cache_ttl=self.get_cache_ttl(),
         )
 
         return self._blueprint
@@ -154,6 +157,8 @@ class Schema:
             schema=self.schema,
             default_string_length=self._default_string_length,
             dry=self._dry,
+            cache_key=self.get_cache_key(),
+            cache_ttl=self.get_cache_ttl(),
         )
 
         return self._blueprint
@@ -180,6 +185,8 @@ class Schema:
             schema=self.schema,
             default_string_length=self._default_string_length,
             dry=self._dry,
+            cache_key=self.get_cache_key(),
+            cache_ttl=self.get_cache_ttl(),
         )
 
         return self._blueprint
@@ -202,12 +209,42 @@ class Schema:
             "full_details": self.connection_details.get(self.connection),
         }
 
+    def get_cache_key(self):
+        """Gets the key the introspection results of this connection are cached by in SchemaCache.
+        Dry schemas and connections with the "schema_cache" option set to False do not use the cache.
+        """
+        if self._dry or self.get_cache_config() is False:
+            return None
+
+        return (
+            self.connection,
+            self.get_connection_information().get("database"),
+            self.get_schema(),
+        )
+
+    def get_cache_ttl(self):
+        """Gets the seconds SchemaCache keeps the introspection results of this connection for,
+        from the "ttl" of the "schema_cache" option. None keeps them for the life of the process.
+        """
+        config = self.get_cache_config()
+        if isinstance(config, dict):
+            return config.get("ttl")
+
+        return None
+
+    def get_cache_config(self):
+        return (self.get_connection_information().get("full_details") or {}).get(
+            "schema_cache"
+        )
+
     def new_connection(self):
         if self._dry:
             return
 
         self._connection = (
-            self.connection_class(**self.get_connection_information())
+            self.connection_class(
+                **self.get_connection_information(), name=self.connection
+            )
             .set_schema(self.schema)
             .make_connection()
         )
@@ -229,19 +266,33 @@ class Schema:
             self._sql = sql
             return sql
 
-        return bool(self.new_connection().query(sql, ()))
+        return SchemaCache.remember(
+            self.get_cache_key(),
+            table,
+            ("column", column),
+            lambda: bool(self.new_connection().query(sql, ())),
+            ttl=self.get_cache_ttl(),
+        )
 
     def get_columns(self, table, dict=True):
-        table = self.platform().get_current_schema(
-            self.new_connection(), table, schema=self.get_schema()
+        table = SchemaCache.remember(
+            self.get_cache_key(),
+            table,
+            "columns",
+            lambda: self.platform().get_current_schema(
+                self.new_connection(), table, schema=self.get_schema()
+            ),
+            ttl=self.get_cache_ttl(),
         )
+        # The cached table is shared so callers get their own dictionary
         result = {}
+        for column in table.get_added_columns().items():
+            result.update({column[0]: column[1]})
+
         if dict:
-            for column in table.get_added_columns().items():
-                result.update({column[0]: column[1]})
             return result
         else:
-            return table.get_added_columns().items()
+            return result.items()
 
     @classmethod
     def set_default_string_length(cls, length):
@@ -255,7 +306,7 @@ class Schema:
             self._sql = sql
             return sql
 
-        return bool(self.new_connection().query(sql, ()))
+        return self._run_ddl(sql, table)
 
     def drop(self, *args, **kwargs):
         return self.drop_table(*args, **kwargs)
@@ -267,7 +318,7 @@ class Schema:
             self._sql = sql
             return sql
 
-        return bool(self.new_connection().query(sql, ()))
+        return self._run_ddl(sql, table)
 
     def rename(self, table, new_name):
         sql = self.platform().compile_rename_table(table, new_name)
@@ -276,7 +327,13 @@ class Schema:
             self._sql = sql
             return sql
 
-        return bool(self.new_connection().query(sql, ()))
+        return self._run_ddl(sql, table, new_name)
+
+    def _run_ddl(self, sql, *tables):
+        try:
+            return bool(self.new_connection().query(sql, ()))
+        finally:
+            SchemaCache.forget(self.get_cache_key(), *tables)
 
     def truncate(self, table, foreign_keys=False):
         sql = self.platform().compile_truncate(table, foreign_keys=foreign_keys)
@@ -325,7 +382,13 @@ class Schema:
             self._sql = sql
             return sql
 
-        return bool(self.new_connection().query(sql, ()))
+        return SchemaCache.remember(
+            self.get_cache_key(),
+            table,
+            "exists",
+            lambda: bool(self.new_connection().query(sql, ())),
+            ttl=self.get_cache_ttl(),
+        )
 
     def enable_foreign_key_constraints(self):
         sql = self.platform().enable_foreign_key_constraints()
@@ -0,0 +1,77 @@
+from timeit import default_timer as timer
+
+
+class SchemaCache:
+    """Keeps the results of the schema introspection queries of Schema, like has_table()
+    and get_columns(), by connection, database and schema.
+
+    Schema changes made through Schema and its blueprints forget the cached results of the
+    tables they change. Call flush() after changing the schema any other way, for example
+    with raw SQL or from another process.
+
+    Results are kept for the life of the process unless the "schema_cache" key of the
+    connection configuration expires them after a number of seconds, or turns the cache off:
+
+        "postgres": {
+            "driver": "postgres",
+            ...
+            "schema_cache": {"ttl": 300},  # or False
+        }
+    """
+
+    _entries = {}
+
+    @classmethod
+    def remember(cls, key, table, lookup, callback, ttl=None):
+        """Gets a cached introspection result, running the callback when it is missing or expired.
+
+        Arguments:
+            key {tuple|None} -- The connection, database and schema the result belongs to.
+                Nothing is cached when it is None.
+            table {string} -- The table the result describes.
+            lookup {tuple|string} -- What is looked up, like "columns" or ("column", "email").
+            callback {callable} -- Runs the introspection query.
+
+        Keyword Arguments:
+            ttl {int|float|None} -- The seconds the result is kept for. (default: {None, forever})
+
+        Returns:
+            mixed
+        """
+        if key is None:
+            return callback()
+
+        entries = cls._entries.setdefault(key, {})
+        entry = entries.get((table, lookup))
+        if entry is not None and (entry[1] is None or entry[1] > timer()):
+            return entry[0]
+
+        value = callback()
+        entries[(table, lookup)] = (value, None if ttl is None else timer() + ttl)
+        return value
+
+    @classmethod
+    def forget(cls, key, *tables):
+        """Forgets the cached results of tables, or every result of the key when no table is given."""
+        if not tables:
+            cls._entries.pop(key, None)
+            return
+
+        entries = cls._entries.get(key)
+        if not entries:
+            return
+
+        for entry in list(entries):
+            if entry[0] in tables:
+                entries.pop(entry, None)
+
+    @classmethod
+    def forget_connection(cls, connection):
+        """Forgets every cached result of a connection, whatever its database and schema."""
+        for key in list(cls._entries):
+            if key[0] == connection:
+                cls._entries.pop(key, None)
+
+    @classmethod
+    def flush(cls):
+        cls._entries.clear()
@@ -1,3 +1,4 @@
 from .Schema import Schema
+from .SchemaCache import SchemaCache
 from .Table import Table
 from .Column import Column
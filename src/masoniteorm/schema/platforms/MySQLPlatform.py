@@ -425,7 +425,7 @@ class MySQLPlatform(Platform):
         table = Table(table_name)
         sql = f"DESCRIBE {table_name}"
         result = connection.query(sql, ())
-        reversed_type_map = {v: k for k, v in self.type_map.items()}
+        reversed_type_map = self.get_reversed_type_map()
 
         for column in result:
             column_type = self.get_column_type(
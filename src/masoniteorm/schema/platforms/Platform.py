@@ -10,6 +10,17 @@ class Platform:
 
     signed = {"signed": "SIGNED", "unsigned": "UNSIGNED"}
 
+    @classmethod
+    def get_reversed_type_map(cls):
+        """Gets the column types by database type, built once per platform class."""
+        reversed_type_map = cls.__dict__.get("_reversed_type_map")
+        if reversed_type_map is None:
+            reversed_type_map = {v: k for k, v in cls.type_map.items()}
+            reversed_type_map.update(getattr(cls, "table_info_map", {}))
+            cls._reversed_type_map = reversed_type_map
+
+        return reversed_type_map
+
     def columnize(self, columns):
         sql = []
         for name, column in columns.items():
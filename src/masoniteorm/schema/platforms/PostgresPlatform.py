@@ -480,8 +480,7 @@ class PostgresPlatform(Platform):
             table=table_name, schema=schema or "public"
         )
 
-        reversed_type_map = {v: k for k, v in self.type_map.items()}
-        reversed_type_map.update(self.table_info_map)
+        reversed_type_map = self.get_reversed_type_map()
         table = Table(table_name)
 
         result = connection.query(sql, ())
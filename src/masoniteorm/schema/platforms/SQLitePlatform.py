@@ -362,7 +362,7 @@ class SQLitePlatform(Platform):
     def get_current_schema(self, connection, table_name, schema=None):
         sql = f"PRAGMA table_info({table_name})"
 
-        reversed_type_map = {v: k for k, v in self.type_map.items()}
+        reversed_type_map = self.get_reversed_type_map()
         table = Table(table_name)
 
         result = connection.query(sql, ())
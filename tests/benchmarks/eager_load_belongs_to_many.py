@@ -0,0 +1,76 @@
+"""Benchmarks registering an eager loaded belongs to many relationship on its parents.
+
+Measures the Python side of Post.with_("tags") for 10,000 posts and 100,000 pivot rows,
+without a database. The related rows are registered through the relationship's index,
+and the previous approach, filtering the whole related collection for every parent, is
+timed on a sample of parents and extrapolated. Run it from the root of the repository:
+
+    python -m tests.benchmarks.eager_load_belongs_to_many
+"""
+
+import random
+from timeit import default_timer as timer
+
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.relationships import belongs_to_many
+
+PARENTS = 10000
+PIVOT_ROWS = 100000
+SAMPLE = 100
+
+
+class Tag(Model):
+    __timestamps__ = False
+
+
+class Post(Model):
+    __timestamps__ = False
+
+    @belongs_to_many("post_id", "tag_id", "id", "id", table="post_tag")
+    def tags(self):
+        return Tag
+
+
+def make_models():
+    random.seed(0)
+    posts = Post.hydrate(
+        [{"id": key, "title": f"Post {key}"} for key in range(PARENTS)]
+    )
+    tags = Tag.hydrate(
+        [
+            {
+                "id": key % 500,
+                "name": f"Tag {key % 500}",
+                "post_tag_id": random.randrange(PARENTS),
+            }
+            for key in range(PIVOT_ROWS)
+        ]
+    )
+    return posts, tags
+
+
+def run():
+    posts, tags = make_models()
+    relationship = Post.__dict__["tags"]
+    builder = QueryBuilder(model=Post(), dry=True)
+
+    start = timer()
+    builder._register_relationships_to_model(relationship, tags, posts, "tags")
+    indexed = timer() - start
+
+    registered = sum(post.tags.count() for post in posts)
+    assert registered == PIVOT_ROWS, registered
+
+    start = timer()
+    for post in posts[:SAMPLE]:
+        post.add_relation({"tags": tags.where("post_tag_id", post.id)})
+    scanned = (timer() - start) * PARENTS / SAMPLE
+
+    print(f"{PARENTS} posts, {PIVOT_ROWS} pivot rows")
+    print(f"index lookups:                {indexed:.3f}s")
+    print(f"collection scans (estimated): {scanned:.3f}s")
+
+
+if __name__ == "__main__":
+    run()
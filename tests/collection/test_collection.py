@@ -1,4 +1,6 @@
+import json
 import unittest
+from unittest import mock
 
 from src.masoniteorm.collection import Collection
 from src.masoniteorm.factories import Factory as factory
@@ -33,6 +35,69 @@ class TestCollection(unittest.TestCase):
         collection = factory(Model, 5).make()
         self.assertEqual(collection.pluck("batch"), [1, 1, 1, 1, 1])
 
+    def test_pluck_with_models_does_not_serialize_them(self):
+        class PluckUser(Model):
+            __hidden__ = ["password"]
+            __casts__ = {"is_admin": "bool"}
+
+        users = Collection(
+            [
+                PluckUser.hydrate({"id": 1, "password": "secret", "is_admin": 1}),
+                PluckUser.hydrate({"id": 2, "password": "secret", "is_admin": 0}),
+            ]
+        )
+        with mock.patch.object(PluckUser, "serialize") as serialize:
+            self.assertEqual(users.pluck("is_admin"), [True, False])
+            self.assertEqual(users.pluck("password"), [])
+            self.assertEqual(users.pluck("id", "id"), {1: 1, 2: 2})
+            serialize.assert_not_called()
+
+        users[1].is_admin = 1
+        self.assertEqual(users.pluck("is_admin"), [True, True])
+
+    def test_key_by_and_find(self):
+        collection = Collection(
+            [
+                {"id": 1, "name": "Joe"},
+                {"id": 2, "name": "Bob"},
+                {"id": 1, "name": "Duplicate"},
+            ]
+        )
+        self.assertEqual(collection.find(2), {"id": 2, "name": "Bob"})
+        self.assertIsNone(collection.find("Bob"))
+        self.assertEqual(collection.find("Bob", key="name")["id"], 2)
+
+        self.assertIs(collection.key_by("name"), collection)
+        self.assertEqual(collection.find("Joe")["id"], 1)
+        self.assertIsNone(collection.find(["unhashable"]))
+
+        collection.push({"id": 3, "name": "Marlysson"})
+        self.assertEqual(collection.find("Marlysson")["id"], 3)
+        collection[0] = {"id": 4, "name": "Corentin"}
+        self.assertIsNone(collection.find("Joe"))
+        self.assertEqual(collection.find("Corentin")["id"], 4)
+
+        users = Collection([User.hydrate({"id": 1}), User.hydrate({"id": 2})])
+        self.assertIs(users.key_by("id").find(2), users[1])
+        self.assertIs(users.find(1, key="id"), users[0])
+
+    def test_find_after_changes_keeping_the_length(self):
+        collection = Collection([{"id": 1}, {"id": 2}]).key_by("id")
+        collection.pop()
+        collection.push({"id": 3})
+        self.assertEqual(collection.find(3), {"id": 3})
+        self.assertIsNone(collection.find(2))
+
+        collection.shift()
+        collection.prepend({"id": 4})
+        self.assertEqual(collection.find(4), {"id": 4})
+        self.assertIsNone(collection.find(1))
+
+        del collection[0]
+        collection.merge([{"id": 5}])
+        self.assertEqual(collection.find(5), {"id": 5})
+        self.assertIsNone(collection.find(4))
+
     def test_where(self):
         collection = Collection(
             [
@@ -64,6 +129,9 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(len(collection.where_in("id", ["3"])), 1)
         self.assertEqual(len(collection.where_in("id", ["4"])), 0)
 
+        self.assertEqual(len(collection.where_in("name", [["Joe"], "Bob"])), 1)
+        self.assertEqual(len(collection.where_in("missing", [None])), 0)
+
     def test_where_in_bool(self):
         nested_collection = Collection(
             [
@@ -567,6 +635,21 @@ class TestCollection(unittest.TestCase):
             '{"name": "Joe", "age": 20}, {"name": "Marlysson", "age": 15}]',
         )
 
+    def test_stream_json(self):
+        collection = Collection(
+            [{"name": "Corentin", "age": 10}, Collection([1, 2]), {"name": "Joe"}]
+        )
+
+        chunks = list(collection.stream_json(separators=(",", ":")))
+        self.assertEqual(len(chunks), 7)
+        self.assertEqual(
+            "".join(chunks), '[{"name":"Corentin","age":10},[1,2],{"name":"Joe"}]'
+        )
+        self.assertEqual(Collection([]).to_json(), "[]")
+        self.assertEqual(
+            collection.to_json(indent=2), json.dumps(collection.serialize(), indent=2)
+        )
+
     def test_contains(self):
         collection = Collection([1, 2, 3, 4])
 
@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.config import invalidate_config, load_config
+from src.masoniteorm.connections import ConnectionFactory, PostgresConnection
+
+
+class TestLoadConfig(unittest.TestCase):
+    def test_config_module_is_cached(self):
+        config = load_config()
+
+        with mock.patch("src.masoniteorm.config.pydoc.locate") as locate:
+            self.assertIs(load_config(), config)
+            locate.assert_not_called()
+
+    def test_invalidate_config_locates_module_again(self):
+        config = load_config()
+        invalidate_config()
+
+        with mock.patch(
+            "src.masoniteorm.config.pydoc.locate", return_value=config
+        ) as locate:
+            self.assertIs(load_config(), config)
+            self.assertIs(load_config(), config)
+            locate.assert_called_once()
+
+    def test_connection_information_is_cached_until_details_change(self):
+        DB = load_config().DB
+        information = DB.get_connection_information("dev")
+
+        self.assertIs(DB.get_connection_information("dev"), information)
+
+        DB.set_connection_option("dev", {"prefix": ""})
+        self.assertIsNot(DB.get_connection_information("dev"), information)
+
+    def test_connection_factory_caches_resolved_connection(self):
+        factory = ConnectionFactory()
+        connection = factory.make("default")
+
+        with mock.patch(
+            "src.masoniteorm.connections.ConnectionFactory.load_config"
+        ) as config:
+            self.assertIs(factory.make("default"), connection)
+            config.assert_not_called()
+
+    def test_connection_factory_caches_default_connection_per_config_path(self):
+        ConnectionFactory().make("default")
+
+        with mock.patch(
+            "src.masoniteorm.connections.ConnectionFactory.load_config"
+        ) as config:
+            config.return_value.DB.get_connection_details.return_value = {
+                "default": "other",
+                "other": {"driver": "postgres"},
+            }
+            factory = ConnectionFactory("config/other-database")
+
+            self.assertIs(factory.make("default"), PostgresConnection)
+            config.assert_called_once_with(config_path="config/other-database")
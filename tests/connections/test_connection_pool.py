@@ -0,0 +1,143 @@
+import threading
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import ConnectionPool, MySQLConnection
+from src.masoniteorm.exceptions import ConnectionPoolExhausted, QueryException
+
+
+class FakeDriverConnection:
+    def __init__(self):
+        self.closed = False
+        self.open = True
+
+    def close(self):
+        self.closed = True
+        self.open = False
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+
+    def tearDown(self):
+        ConnectionPool.close_all()
+
+    def creator(self):
+        connection = FakeDriverConnection()
+        self.created.append(connection)
+        return connection
+
+    def make_pool(self, **kwargs):
+        return ConnectionPool(self.creator, closer=lambda c: c.close(), **kwargs)
+
+    def test_released_connections_are_reused(self):
+        pool = self.make_pool(max_size=2)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(len(self.created), 1)
+
+    def test_fills_to_min_size(self):
+        pool = self.make_pool(min_size=3, max_size=5)
+        pool.acquire()
+
+        self.assertEqual(len(self.created), 3)
+        self.assertEqual(pool.idle_count(), 2)
+        self.assertEqual(pool.in_use_count(), 1)
+
+    def test_raises_when_exhausted(self):
+        pool = self.make_pool(max_size=1, timeout=0.01)
+        pool.acquire()
+
+        with self.assertRaises(ConnectionPoolExhausted):
+            pool.acquire()
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = self.make_pool(max_size=1, timeout=5)
+        connection = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.acquire(), connection)
+        timer.join()
+
+    def test_expired_connections_are_closed(self):
+        pool = self.make_pool(max_size=2, max_lifetime=0)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertEqual(pool.size(), 1)
+
+    def test_pre_ping_replaces_dead_connections(self):
+        pool = ConnectionPool(
+            self.creator,
+            closer=lambda c: c.close(),
+            pinger=lambda c: c.open,
+            pre_ping=True,
+        )
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.open = False
+
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertTrue(connection.closed)
+
+    def test_connection_class_returns_connection_to_pool(self):
+        connection = MySQLConnection(
+            host="localhost",
+            database="orm",
+            full_details={"pool": {"max_size": 2}},
+            name="pooled",
+        )
+        driver_connection = FakeDriverConnection()
+
+        with mock.patch.object(
+            MySQLConnection, "create_connection", return_value=driver_connection
+        ):
+            connection.acquire_connection()
+            connection.open = 1
+            connection.close_connection()
+
+        pool = connection.get_pool()
+        self.assertFalse(driver_connection.closed)
+        self.assertEqual(pool.idle_count(), 1)
+        self.assertIsNone(connection._connection)
+
+    def test_failed_query_does_not_return_connection_to_pool(self):
+        connection = MySQLConnection(
+            host="localhost",
+            database="orm",
+            full_details={"pool": {"max_size": 2}},
+            name="pooled",
+        )
+        driver_connection = FakeDriverConnection()
+        driver_connection.cursor = mock.MagicMock()
+        driver_connection.cursor.return_value.execute.side_effect = Exception(
+            "Lost connection to MySQL server during query"
+        )
+
+        with mock.patch.object(
+            MySQLConnection, "create_connection", return_value=driver_connection
+        ):
+            connection.acquire_connection()
+            connection.open = 1
+            with self.assertRaises(QueryException):
+                connection.query("SELECT 1")
+
+        pool = connection.get_pool()
+        self.assertTrue(driver_connection.closed)
+        self.assertEqual(pool.idle_count(), 0)
+        self.assertEqual(pool.size(), 0)
+
+    def test_pools_are_shared_per_configuration(self):
+        details = {"pool": True}
+        first = MySQLConnection(host="localhost", full_details=details, name="a")
+        second = MySQLConnection(host="localhost", full_details=details, name="a")
+        other = MySQLConnection(host="replica", full_details=details, name="a")
+
+        self.assertIs(first.get_pool(), second.get_pool())
+        self.assertIsNot(first.get_pool(), other.get_pool())
@@ -0,0 +1,97 @@
+import unittest
+
+from src.masoniteorm.connections import ConnectionRouter
+from src.masoniteorm.query import QueryBuilder
+from tests.utils import MockSQLiteConnection
+
+DETAILS = {
+    "default": "split",
+    "split": {
+        "driver": "sqlite",
+        "database": "primary.sqlite3",
+        "prefix": "",
+        "read": [{"database": "replica_1.sqlite3"}, {"database": "replica_2.sqlite3"}],
+        "write": {"database": "primary.sqlite3"},
+    },
+}
+
+
+class TestConnectionRouter(unittest.TestCase):
+    def tearDown(self):
+        ConnectionRouter.forget_writes()
+        ConnectionRouter._counters.clear()
+
+    def test_connections_without_read_and_write_hosts_are_not_routed(self):
+        details = {"driver": "mysql", "host": "localhost"}
+        self.assertIs(ConnectionRouter.route("plain", details), details)
+
+    def test_reads_round_robin_over_the_read_hosts(self):
+        details = {
+            "driver": "mysql",
+            "host": "localhost",
+            "user": "root",
+            "read": {"host": ["replica-1", "replica-2"]},
+            "write": [{"host": "primary", "user": "admin"}],
+        }
+
+        hosts = [ConnectionRouter.route("rr", details)["host"] for _ in range(3)]
+        self.assertEqual(hosts, ["replica-1", "replica-2", "replica-1"])
+
+        write = ConnectionRouter.route("rr", details, write=True)
+        self.assertEqual((write["host"], write["user"]), ("primary", "admin"))
+        self.assertNotIn("read", write)
+
+    def test_least_loaded_picks_the_read_host_with_the_fewest_connections(self):
+        details = {
+            "host": "primary",
+            "read": ["replica-1", "replica-2", "replica-3"],
+            "read_strategy": "least_loaded",
+        }
+        loads = {"replica-1": 4, "replica-2": 1, "replica-3": 1}
+
+        def load(host_details):
+            return loads[host_details["host"]]
+
+        hosts = [
+            ConnectionRouter.route("loaded", details, load=load)["host"]
+            for _ in range(3)
+        ]
+        self.assertEqual(hosts, ["replica-2", "replica-2", "replica-3"])
+
+    def test_sticky_reads_use_the_primary_after_a_write(self):
+        details = {"host": "primary", "read": ["replica"], "sticky": True}
+        self.assertEqual(ConnectionRouter.route("sticky", details)["host"], "replica")
+
+        ConnectionRouter.record_write("sticky")
+        self.assertEqual(ConnectionRouter.route("sticky", details)["host"], "primary")
+
+        ConnectionRouter.forget_writes()
+        self.assertEqual(ConnectionRouter.route("sticky", details)["host"], "replica")
+
+    def test_builder_reads_from_replicas_and_writes_to_the_primary(self):
+        def get_builder():
+            return QueryBuilder(
+                connection="split",
+                connection_class=MockSQLiteConnection,
+                table="users",
+                connection_details=DETAILS,
+            )
+
+        builder = get_builder()
+        builder.where("id", 1).get()
+        self.assertEqual(builder.get_connection().database, "replica_1.sqlite3")
+
+        builder.where("id", 1).update({"name": "Joe"})
+        self.assertEqual(builder.get_connection().database, "primary.sqlite3")
+
+        # The connection to the primary is kept for the builder's next reads
+        builder.where("id", 1).get()
+        self.assertEqual(builder.get_connection().database, "primary.sqlite3")
+
+        builder = get_builder()
+        builder.where("id", 1).lock_for_update().get()
+        self.assertEqual(builder.get_connection().database, "primary.sqlite3")
+
+        builder = get_builder()
+        builder.get()
+        self.assertEqual(builder.get_connection().database, "replica_2.sqlite3")
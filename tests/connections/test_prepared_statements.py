@@ -0,0 +1,219 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import (
+    ConnectionPool,
+    MSSQLConnection,
+    MySQLConnection,
+    PostgresConnection,
+    QueryListeners,
+)
+from src.masoniteorm.exceptions import QueryException
+from src.masoniteorm.connections.PreparedStatementCache import (
+    PreparedStatementCache,
+)
+
+
+class FakeCursor:
+    description = None
+
+    def __init__(self):
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query, bindings=()):
+        self.executed.append((query, tuple(bindings)))
+
+
+class FakeDriverConnection:
+    closed = False
+
+    def close(self):
+        pass
+
+
+class TestPreparedStatementCache(unittest.TestCase):
+    def test_evicts_least_recently_used_statements(self):
+        cache = PreparedStatementCache(object(), max_size=2)
+        cache.put("a", "stmt_a")
+        cache.put("b", "stmt_b")
+        cache.get("a")
+
+        self.assertEqual(cache.put("c", "stmt_c"), ["stmt_b"])
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+
+class TestPostgresPreparedStatements(unittest.TestCase):
+    def tearDown(self):
+        ConnectionPool.close_all()
+
+    def get_connection(self, **details):
+        connection = PostgresConnection(
+            host="localhost",
+            database="orm",
+            full_details=details,
+            name="prepared",
+        )
+        connection._connection = FakeDriverConnection()
+        connection._cursor = FakeCursor()
+        # Without a pool, statements are only prepared on the connection of a transaction
+        connection.transaction_level = 1
+        return connection
+
+    def test_prepares_a_statement_once_and_executes_it_again(self):
+        connection = self.get_connection(prepared_statements=True)
+        query = """SELECT * FROM "users" WHERE "users"."id" = '?' AND "users"."name" = '?'"""
+
+        for bindings in ((1, "Joe"), (2, "Bill")):
+            statements = connection.get_prepared_statements(query)
+            connection.execute_prepared(statements, query, bindings)
+
+        self.assertEqual(
+            connection._cursor.executed,
+            [
+                (
+                    """PREPARE masoniteorm_stmt_1 AS SELECT * FROM "users" WHERE "users"."id" = $1 AND "users"."name" = $2""",
+                    (),
+                ),
+                ("EXECUTE masoniteorm_stmt_1 (%s, %s)", (1, "Joe")),
+                ("EXECUTE masoniteorm_stmt_1 (%s, %s)", (2, "Bill")),
+            ],
+        )
+
+    def test_listeners_get_the_sql_of_prepared_statements(self):
+        connection = self.get_connection(prepared_statements=True)
+        query = "SELECT * FROM users WHERE id = '?'"
+        events = []
+        QueryListeners.listen(events.append)
+        try:
+            statements = connection.get_prepared_statements(query)
+            connection.execute_prepared(statements, query, (1,))
+        finally:
+            QueryListeners.forget()
+
+        self.assertEqual(events[0].sql, "SELECT * FROM users WHERE id = %s")
+        self.assertEqual(events[0].bindings, (1,))
+
+    def test_deallocates_evicted_statements(self):
+        connection = self.get_connection(prepared_statements={"max_size": 1})
+        for column in ("id", "name"):
+            query = f"""SELECT * FROM "users" WHERE "{column}" = '?'"""
+            statements = connection.get_prepared_statements(query)
+            connection.execute_prepared(statements, query, (1,))
+
+        self.assertIn(
+            ("DEALLOCATE masoniteorm_stmt_1", ()), connection._cursor.executed
+        )
+
+    def test_only_parameterized_queries_are_prepared(self):
+        connection = self.get_connection(prepared_statements=True)
+        self.assertIsNone(connection.get_prepared_statements("SELECT * FROM users"))
+        self.assertIsNone(
+            connection.get_prepared_statements("CREATE TABLE users (id '?')")
+        )
+
+    def test_is_switchable_per_connection(self):
+        connection = self.get_connection()
+        query = "SELECT * FROM users WHERE id = '?'"
+        self.assertIsNone(connection.get_prepared_statements(query))
+
+        connection.prepare_statements()
+        self.assertIsNotNone(connection.get_prepared_statements(query))
+
+        self.assertFalse(
+            MySQLConnection(full_details={"prepared_statements": True})
+            .prepare_statements()
+            .prepares_statements()
+        )
+
+    def test_connections_closed_after_the_query_send_a_single_statement(self):
+        connection = self.get_connection(prepared_statements=True)
+        connection.transaction_level = 0
+        connection.open = 1
+        cursor = FakeCursor()
+
+        def set_cursor():
+            connection._cursor = cursor
+            return cursor
+
+        query = "SELECT * FROM users WHERE id = '?'"
+        with mock.patch.object(connection, "set_cursor", side_effect=set_cursor):
+            connection.query(query, (1,))
+
+        self.assertEqual(cursor.executed, [("SELECT * FROM users WHERE id = %s", (1,))])
+        self.assertIsNone(connection.get_prepared_statements(query))
+
+    def test_pooled_connections_keep_their_statements(self):
+        details = {"prepared_statements": True, "pool": {"max_size": 1}}
+        connection = self.get_connection(**details)
+        driver_connection = FakeDriverConnection()
+        query = "SELECT * FROM users WHERE id = '?'"
+
+        with mock.patch.object(
+            PostgresConnection, "create_connection", return_value=driver_connection
+        ):
+            connection.acquire_connection()
+            statements = connection.get_prepared_statements(query)
+            statements.put(query, "masoniteorm_stmt_1")
+            connection.close_connection()
+
+            other = self.get_connection(**details)
+            other.acquire_connection()
+
+        self.assertIs(other._connection, driver_connection)
+        self.assertIs(other.get_prepared_statements(query), statements)
+
+
+class TestMSSQLPreparedStatements(unittest.TestCase):
+    def get_connection(self):
+        connection = MSSQLConnection(
+            host="localhost",
+            database="orm",
+            full_details={"prepared_statements": {"max_size": 1}},
+            name="prepared",
+        )
+        connection._connection = mock.MagicMock()
+        connection._connection.cursor.side_effect = lambda: mock.MagicMock()
+        connection.open = 1
+        connection.transaction_level = 1
+        return connection
+
+    def test_closes_evicted_cursors(self):
+        connection = self.get_connection()
+        first = "SELECT * FROM [users] WHERE [id] = '?'"
+        second = "SELECT * FROM [users] WHERE [name] = '?'"
+
+        statements = connection.get_prepared_statements(first)
+        cursor = connection.get_prepared_cursor(statements, first)
+        self.assertIs(connection.get_prepared_cursor(statements, first), cursor)
+
+        connection.get_prepared_cursor(statements, second)
+        cursor.close.assert_called_once()
+        self.assertNotIn(first, statements)
+
+    def test_closes_the_cursor_of_a_failed_statement(self):
+        connection = self.get_connection()
+        query = "SELECT * FROM [users] WHERE [id] = '?'"
+        statements = connection.get_prepared_statements(query)
+        cursor = connection.get_prepared_cursor(statements, query)
+        cursor.execute.side_effect = Exception("Invalid object name 'users'")
+
+        with self.assertRaises(QueryException):
+            connection.query(query, (1,))
+
+        cursor.close.assert_called_once()
+        self.assertNotIn(query, statements)
+
+    def test_connections_closed_after_the_query_are_not_prepared(self):
+        connection = self.get_connection()
+        connection.transaction_level = 0
+        query = "SELECT * FROM [users] WHERE [id] = '?'"
+
+        self.assertIsNone(connection.get_prepared_statements(query))
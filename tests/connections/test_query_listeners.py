@@ -0,0 +1,94 @@
+import time
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import QueryCollector, SlowQueryLogger
+from src.masoniteorm.models import Model
+from tests.integrations.config.database import DB
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class TestQueryListeners(unittest.TestCase):
+    def tearDown(self):
+        DB.forget_listeners()
+
+    def test_listeners_get_the_details_of_each_query(self):
+        before, after = [], []
+        DB.listen(before.append, before=True)
+        DB.listen(after.append)
+
+        User.where("name", "bill").get()
+        DB.forget_listeners(after.append)
+        User.where("name", "bill").get()
+
+        self.assertEqual(len(before), 2)
+        self.assertEqual(len(after), 1)
+
+        event = after[0]
+        self.assertEqual(
+            event.sql,
+            'SELECT * FROM "users" WHERE "users"."name" = ?',
+        )
+        self.assertEqual(event.bindings, ["bill"])
+        self.assertEqual((event.connection, event.driver), ("dev", "sqlite"))
+        self.assertIs(event.model, User)
+        self.assertGreaterEqual(event.time, 0)
+
+    def test_time_of_before_listeners_is_not_counted(self):
+        events = []
+        DB.listen(lambda event: time.sleep(0.1), before=True)
+        DB.listen(events.append)
+
+        User.find(1)
+
+        self.assertLess(events[0].time, 100)
+
+    def test_rowcount_of_writes(self):
+        events = []
+        count = User.where("name", "Joe").count()
+        DB.listen(events.append)
+        DB.begin_transaction("dev")
+        try:
+            User.where("name", "Joe").update({"age": 30})
+        finally:
+            DB.rollback("dev")
+
+        self.assertEqual(
+            events[-1].sql, 'UPDATE "users" SET "age" = ? WHERE "name" = ?'
+        )
+        self.assertEqual(events[-1].rowcount, count)
+
+    def test_slow_query_logger(self):
+        DB.listen(SlowQueryLogger(threshold=0))
+        with self.assertLogs("masoniteorm.connection.slow_queries", "WARNING") as logs:
+            User.find(1)
+
+        self.assertIn("Slow query on dev", logs.output[0])
+
+        DB.forget_listeners()
+        logger = SlowQueryLogger(threshold=60000)
+        DB.listen(logger)
+        with mock.patch.object(logger.logger, "warning") as warning:
+            User.find(1)
+
+        warning.assert_not_called()
+
+    def test_collector_counts_queries_and_finds_duplicates(self):
+        with DB.collect_queries() as queries:
+            self.assertIs(QueryCollector.current(), queries)
+            for key in (1, 1, 4):
+                User.find(key)
+
+        User.find(5)
+
+        self.assertIsNone(QueryCollector.current())
+        self.assertEqual(queries.count, 3)
+        self.assertGreaterEqual(queries.time, 0)
+
+        sql = 'SELECT * FROM "users" WHERE "users"."id" = ? LIMIT 1'
+        self.assertEqual(queries.duplicates(), {(sql, (1,)): 2})
+        self.assertEqual(queries.duplicates(bindings=False), {sql: 3})
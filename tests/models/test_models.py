@@ -253,3 +253,134 @@ class TestModels(unittest.TestCase):
         # Removing one of the props allows us to instantiate
         delattr(InvalidFillableGuardedModelTest, "__guarded__")
         InvalidFillableGuardedModelTest()
+
+    def test_hydrate_does_not_build_a_query_builder_per_model(self):
+        models = ModelTest.hydrate(
+            [
+                {"id": 1, "due_date": "2020-11-28 11:42:07"},
+                {"id": 2, "due_date": None},
+            ]
+        )
+
+        self.assertEqual(models.count(), 2)
+        for model in models:
+            self.assertNotIn("builder", model.__dict__)
+            self.assertFalse(model.is_dirty())
+
+        self.assertIsInstance(models[0].due_date, pendulum.now().__class__)
+        self.assertIsNone(models[1].due_date)
+
+    def test_builder_is_created_and_booted_on_first_use(self):
+        model = ModelTest.hydrate({"id": 1})
+        builder = model.builder
+
+        self.assertIs(model.get_builder(), builder)
+        self.assertIn("TimeStampsScope", str(builder._global_scopes))
+        self.assertEqual(
+            model.where("id", 1).to_sql(),
+            "SELECT * FROM `model_tests` WHERE `model_tests`.`id` = '1'",
+        )
+
+    def test_custom_cast_map_is_not_shared_between_models(self):
+        class UpperCast:
+            def get(self, value):
+                return value.upper()
+
+            def set(self, value):
+                return value
+
+        class CustomCastModelTest(Model):
+            __cast_map__ = {"upper": UpperCast}
+            __casts__ = {"name": "upper"}
+
+        self.assertEqual(CustomCastModelTest.hydrate({"name": "joe"}).name, "JOE")
+        self.assertNotIn("upper", ModelTest().get_cast_map())
+
+    def test_casts_and_dates_are_applied_once_per_value(self):
+        calls = []
+
+        class CountingCast:
+            def get(self, value):
+                calls.append(value)
+                return value.upper()
+
+            def set(self, value):
+                return value
+
+        class CountingCastModelTest(Model):
+            __cast_map__ = {"upper": CountingCast}
+            __casts__ = {"name": "upper"}
+            __dates__ = ["due_date"]
+
+        model = CountingCastModelTest.hydrate(
+            {"name": "joe", "due_date": "2020-11-28 11:42:07"}
+        )
+
+        self.assertEqual((model.name, model.name), ("JOE", "JOE"))
+        self.assertIs(model.due_date, model.due_date)
+        self.assertEqual(calls, ["joe"])
+
+        model.fill({"name": "bill"})
+        self.assertEqual(model.name, "BILL")
+        self.assertEqual(calls, ["joe", "bill"])
+
+    def test_original_attributes_are_not_shared_with_attributes(self):
+        model = ModelTest.hydrate({"id": 1, "username": "joe"})
+        self.assertIsNot(model.__original_attributes__, model.__attributes__)
+
+        model.__attributes__["username"] = "jim"
+        self.assertEqual(model.get_original("username"), "joe")
+
+        model = ModelTest.hydrate({"id": 1, "username": "joe"})
+
+        model.fill({"username": "bob"})
+        self.assertEqual(model.username, "bob")
+        self.assertEqual(model.get_original("username"), "joe")
+
+        model = ModelTest.hydrate({"id": 1, "username": "joe"})
+        model.fill_original({"username": "bill"})
+        self.assertEqual(model.username, "joe")
+        self.assertEqual(model.get_original("username"), "bill")
+
+    def test_serializer_is_compiled_once_per_class(self):
+        class SerializedModelTest(Model):
+            __hidden__ = ["password"]
+            __casts__ = {"is_vip": "bool"}
+            __dates__ = ["due_date"]
+
+        model = SerializedModelTest.hydrate(
+            {
+                "id": 1,
+                "password": "secret",
+                "is_vip": 1,
+                "due_date": "2020-11-28 11:42:07",
+            }
+        )
+        model.name = "Joe"
+        model.password = "changed"
+
+        self.assertEqual(
+            model.serialize(),
+            {
+                "id": 1,
+                "is_vip": True,
+                "due_date": "2020-11-28T11:42:07+00:00",
+                "name": "Joe",
+            },
+        )
+        self.assertIs(
+            SerializedModelTest._get_serializer(("password",), ()),
+            SerializedModelTest._get_serializer(("password",), ()),
+        )
+        self.assertEqual(
+            model.serialize(exclude=["due_date", "is_vip", "password"]),
+            {"id": 1, "name": "Joe"},
+        )
+
+    def test_mutable_cast_values_are_not_reused(self):
+        model = ModelTest.hydrate({"id": 1, "payload": '{"key": "value"}'})
+        payload = model.payload
+        payload["key"] = "changed"
+
+        self.assertIsNot(model.payload, payload)
+        self.assertEqual(model.payload, {"key": "value"})
@@ -235,6 +235,14 @@ class TestMSSQLQueryBuilder(unittest.TestCase):
             builder.to_sql(), "SELECT COUNT([users].[id]) AS id FROM [users]"
         )
 
+    def test_exists(self):
+        builder = self.get_builder()
+        builder.where("age", 18).exists()
+        self.assertEqual(
+            builder.to_sql(),
+            "SELECT CASE WHEN EXISTS(SELECT TOP 1 1 FROM [users] WHERE [users].[age] = '18') THEN 1 ELSE 0 END AS m_exists_reserved",
+        )
+
     def test_order_by_asc(self):
         builder = self.get_builder()
         builder.order_by("email", "asc")
@@ -35,3 +35,40 @@ class TestMySQLInsertGrammar(unittest.TestCase):
 
         sql = "INSERT INTO [users] ([name]) VALUES ('?'), ('?'), ('?')"
         self.assertEqual(to_sql, sql)
+
+    def test_can_compile_bulk_create_returning(self):
+        grammar = self.builder.bulk_create(
+            [{"name": "Joe"}, {"name": "Bill"}], query=True
+        ).get_grammar()
+
+        sql = "INSERT INTO [users] ([name]) OUTPUT INSERTED.* VALUES ('?'), ('?')"
+        self.assertEqual(
+            grammar.compile("bulk_create_returning", qmark=True).to_sql(), sql
+        )
+        self.assertEqual(grammar._bindings, ["Joe", "Bill"])
+
+    def test_bulk_batch_size_respects_parameter_and_row_limits(self):
+        self.assertEqual(MSSQLGrammar.get_bulk_batch_size(1), 1000)
+        self.assertEqual(MSSQLGrammar.get_bulk_batch_size(7), 299)
+        self.assertEqual(MSSQLGrammar.get_bulk_batch_size(7, batch_size=50), 50)
+        self.assertEqual(MSSQLGrammar.get_bulk_batch_size(5000), 1)
+
+    def test_bulk_batches_stay_below_the_parameter_limit(self):
+        for column_count in range(1, 2100):
+            size = MSSQLGrammar.get_bulk_batch_size(column_count)
+            self.assertLess(size * column_count, 2100)
+
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"name": "Joe", "email": "joe@example.com"}],
+            unique_by=["email"],
+            query=True,
+        ).to_qmark()
+
+        sql = (
+            "MERGE INTO [users] AS [target] USING (VALUES ('?', '?')) AS [source] ([email], [name]) "
+            "ON [target].[email] = [source].[email] "
+            "WHEN MATCHED THEN UPDATE SET [target].[name] = [source].[name] "
+            "WHEN NOT MATCHED THEN INSERT ([email], [name]) VALUES ([source].[email], [source].[name]);"
+        )
+        self.assertEqual(to_sql, sql)
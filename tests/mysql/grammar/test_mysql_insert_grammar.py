@@ -66,6 +66,31 @@ class BaseInsertGrammarTest:
         )()
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"name": "Joe", "email": "joe@example.com"}],
+            unique_by=["email"],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert_without_updates_qmark(self):
+        to_sql = self.builder.upsert(
+            [{"name": "Joe", "email": "joe@example.com"}],
+            unique_by=["email"],
+            update=[],
+            query=True,
+        ).to_qmark()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
 
 class TestMySQLUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
     grammar = "mysql"
@@ -101,3 +126,15 @@ class TestMySQLUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
         self.builder.create(name="Joe").to_sql()
         """
         return """INSERT INTO `users` (`name`) VALUES ('?'), ('?'), ('?')"""
+
+    def can_compile_upsert(self):
+        """
+        self.builder.upsert([{"name": "Joe", "email": "joe@example.com"}], unique_by=["email"]).to_sql()
+        """
+        return """INSERT INTO `users` (`email`, `name`) VALUES ('joe@example.com', 'Joe') ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)"""
+
+    def can_compile_upsert_without_updates_qmark(self):
+        """
+        self.builder.upsert([{"name": "Joe", "email": "joe@example.com"}], unique_by=["email"], update=[]).to_qmark()
+        """
+        return """INSERT INTO `users` (`email`, `name`) VALUES ('?', '?') ON DUPLICATE KEY UPDATE `email` = VALUES(`email`)"""
@@ -165,3 +165,30 @@ class TestMySQLQmark(BaseQMarkTest, unittest.TestCase):
             "SELECT * FROM `users` WHERE (`users`.`challenger` = '?' OR `users`.`proposer` = '?' OR `users`.`referee` = '?')",
             [1, 1, 1],
         )
+
+
+class TestMySQLLargeQmark(unittest.TestCase):
+    def test_large_where_in_and_bulk_create_keep_every_binding(self):
+        ids = list(range(5000))
+        builder = QueryBuilder(grammar=MySQLGrammar, table="users")
+        sql = builder.where_in("id", ids).to_qmark()
+
+        self.assertEqual(builder._bindings, ids)
+        self.assertEqual(
+            sql,
+            "SELECT * FROM `users` WHERE `users`.`id` IN ("
+            + ", ".join(["'?'"] * 5000)
+            + ")",
+        )
+
+        rows = [{"name": f"user {index}", "age": index} for index in range(2000)]
+        builder = QueryBuilder(grammar=MySQLGrammar, table="users")
+        sql = builder.bulk_create(rows, query=True).to_qmark()
+
+        self.assertEqual(
+            sql,
+            "INSERT INTO `users` (`age`, `name`) VALUES "
+            + ", ".join(["('?', '?')"] * 2000),
+        )
+        self.assertEqual(builder._bindings[:4], [0, "user 0", 1, "user 1"])
+        self.assertEqual(len(builder._bindings), 4000)
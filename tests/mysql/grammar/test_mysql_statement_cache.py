@@ -0,0 +1,68 @@
+import unittest
+
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import MySQLGrammar, StatementCache
+from src.masoniteorm.query.grammars.BaseGrammar import BaseGrammar
+
+
+class TestMySQLStatementCache(unittest.TestCase):
+    def setUp(self):
+        self.original_cache = BaseGrammar.statement_cache
+        BaseGrammar.statement_cache = StatementCache(max_size=2)
+
+    def tearDown(self):
+        BaseGrammar.statement_cache = self.original_cache
+
+    def get_builder(self):
+        return QueryBuilder(grammar=MySQLGrammar, table="users")
+
+    def test_same_shape_reuses_sql_with_new_bindings(self):
+        first = self.get_builder().where("name", "Joe").where_in("id", [1, 2])
+        second = self.get_builder().where("name", "Bob").where_in("id", [3, 4])
+
+        sql = first.to_qmark()
+        self.assertEqual(second.to_qmark(), sql)
+        self.assertEqual(
+            sql,
+            "SELECT * FROM `users` WHERE `users`.`name` = '?' AND `users`.`id` IN ('?', '?')",
+        )
+        self.assertEqual(first._bindings, ["Joe", 1, 2])
+        self.assertEqual(second._bindings, ["Bob", 3, 4])
+        self.assertEqual(BaseGrammar.statement_cache.stats()["hits"], 1)
+        self.assertEqual(BaseGrammar.statement_cache.stats()["misses"], 1)
+
+    def test_different_shapes_are_cached_separately(self):
+        self.assertEqual(
+            self.get_builder().where_in("id", [1, 2]).to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`id` IN ('?', '?')",
+        )
+        self.assertEqual(
+            self.get_builder().where_in("id", [1, 2, 3]).to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`id` IN ('?', '?', '?')",
+        )
+        self.assertEqual(
+            self.get_builder().where("active", True).to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`active` = '1'",
+        )
+        self.assertEqual(
+            self.get_builder().where("active", 1).to_qmark(),
+            "SELECT * FROM `users` WHERE `users`.`active` = '?'",
+        )
+        self.assertEqual(BaseGrammar.statement_cache.stats()["hits"], 0)
+        self.assertEqual(len(BaseGrammar.statement_cache), 2)
+
+    def test_sub_queries_are_not_cached(self):
+        builder = self.get_builder().where(lambda query: query.where("age", 18))
+
+        self.assertEqual(
+            builder.to_qmark(),
+            "SELECT * FROM `users` WHERE (`users`.`age` = '?')",
+        )
+        self.assertEqual(builder._bindings, [18])
+        self.assertEqual(len(BaseGrammar.statement_cache), 0)
+
+    def test_cache_can_be_disabled(self):
+        BaseGrammar.statement_cache.disable()
+        self.get_builder().where("name", "Joe").to_qmark()
+
+        self.assertEqual(len(BaseGrammar.statement_cache), 0)
@@ -250,6 +250,14 @@ class BaseTestQueryBuilder:
         )()
         self.assertEqual(builder.to_sql(), sql)
 
+    def test_exists(self):
+        builder = self.get_builder()
+        builder.where("age", 18).exists()
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(builder.to_sql(), sql)
+
     def test_order_by_asc(self):
         builder = self.get_builder()
         builder.order_by("email", "asc")
@@ -621,6 +629,12 @@ class PostgresQueryBuilderTest(BaseTestQueryBuilder, unittest.TestCase):
         """
         return """SELECT COUNT("users"."id") AS id FROM "users\""""
 
+    def exists(self):
+        """
+        builder.where('age', 18).exists()
+        """
+        return """SELECT EXISTS(SELECT 1 FROM "users" WHERE "users"."age" = '18' LIMIT 1) AS m_exists_reserved"""
+
     def order_by_asc(self):
         """
         builder.order_by('email', 'asc')
@@ -798,3 +812,28 @@ class PostgresQueryBuilderTest(BaseTestQueryBuilder, unittest.TestCase):
         builder.order_by('email', 'des')
         """
         return """SELECT * FROM "users" ORDER BY "email" DESC"""
+
+    def test_large_where_in_binds_a_single_array(self):
+        ids = list(range(1001))
+        builder = self.get_builder()
+        sql = builder.where("active", 1).where_in("id", ids).to_qmark()
+        self.assertEqual(
+            sql,
+            """SELECT * FROM "users" WHERE "users"."active" = '?' AND "users"."id" = ANY('?')""",
+        )
+        self.assertEqual(builder._bindings, [1, ids])
+
+        builder = self.get_builder()
+        sql = builder.where_not_in("id", ids).to_qmark()
+        self.assertEqual(
+            sql, """SELECT * FROM "users" WHERE "users"."id" <> ALL('?')"""
+        )
+        self.assertEqual(builder._bindings, [ids])
+
+    def test_small_where_in_binds_each_value(self):
+        builder = self.get_builder()
+        sql = builder.where_in("id", [1, 2]).to_qmark()
+        self.assertEqual(
+            sql, """SELECT * FROM "users" WHERE "users"."id" IN ('?', '?')"""
+        )
+        self.assertEqual(builder._bindings, [1, 2])
@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+import psycopg2
+
+from src.masoniteorm.connections import PostgresConnection
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import PostgresGrammar
+
+DETAILS = {
+    "default": "postgres",
+    "postgres": {"driver": "postgres", "host": "localhost", "database": "orm"},
+}
+
+
+class FakePostgresConnection(PostgresConnection):
+    """Runs statements on a cursor behaving like a psycopg2 cursor after a statement
+    without a RETURNING clause: it has no description and fetching raises."""
+
+    def make_connection(self):
+        self.cursor = mock.MagicMock(description=None, rowcount=1)
+        self.cursor.__enter__.return_value = self.cursor
+        self.cursor.fetchone.side_effect = psycopg2.ProgrammingError(
+            "no results to fetch"
+        )
+        self.cursor.fetchall.side_effect = psycopg2.ProgrammingError(
+            "no results to fetch"
+        )
+
+        self._connection = mock.MagicMock(closed=False)
+        self._connection.cursor.return_value = self.cursor
+        self.open = 1
+        return self
+
+
+class TestPostgresUpsert(unittest.TestCase):
+    def get_builder(self):
+        return QueryBuilder(
+            grammar=PostgresGrammar,
+            connection="postgres",
+            connection_class=FakePostgresConnection,
+            connection_details=DETAILS,
+            table="users",
+        )
+
+    def test_statements_without_returning_do_not_fetch(self):
+        connection = FakePostgresConnection(full_details={}).make_connection()
+
+        self.assertEqual(connection.query("UPDATE users SET name = 'Joe'", (), 1), {})
+        self.assertEqual(connection.query("DELETE FROM users", ()), {})
+
+    def test_upsert_runs_without_a_returning_clause(self):
+        rows = [{"email": "joe@example.com", "name": "Joe"}]
+        builder = self.get_builder()
+
+        self.assertEqual(builder.upsert(rows, unique_by=["email"]), rows)
+        cursor = builder.get_connection().cursor
+        self.assertIn("ON CONFLICT", cursor.execute.call_args[0][0])
+        self.assertNotIn("RETURNING", cursor.execute.call_args[0][0])
+
+        self.assertEqual(
+            self.get_builder().upsert(rows, unique_by=["email"], update=[]), rows
+        )
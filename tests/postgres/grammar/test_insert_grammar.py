@@ -51,6 +51,31 @@ class BaseInsertGrammarTest:
         )()
         self.assertEqual(to_sql, sql)
 
+    def test_can_compile_upsert(self):
+        to_sql = self.builder.upsert(
+            [{"name": "Joe", "email": "joe@example.com"}],
+            unique_by=["email"],
+            query=True,
+        ).to_sql()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
+    def test_can_compile_upsert_without_updates_qmark(self):
+        to_sql = self.builder.upsert(
+            [{"name": "Joe", "email": "joe@example.com"}],
+            unique_by=["email"],
+            update=[],
+            query=True,
+        ).to_qmark()
+
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(to_sql, sql)
+
 
 class TestPostgresUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
     grammar = "postgres"
@@ -80,3 +105,15 @@ class TestPostgresUpdateGrammar(BaseInsertGrammarTest, unittest.TestCase):
         self.builder.create(name="Joe").to_sql()
         """
         return """INSERT INTO "users" ("name") VALUES ('?'), ('?'), ('?') RETURNING *"""
+
+    def can_compile_upsert(self):
+        """
+        self.builder.upsert([{"name": "Joe", "email": "joe@example.com"}], unique_by=["email"]).to_sql()
+        """
+        return """INSERT INTO "users" ("email", "name") VALUES ('joe@example.com', 'Joe') ON CONFLICT ("email") DO UPDATE SET "name" = EXCLUDED.\"name\""""
+
+    def can_compile_upsert_without_updates_qmark(self):
+        """
+        self.builder.upsert([{"name": "Joe", "email": "joe@example.com"}], unique_by=["email"], update=[]).to_qmark()
+        """
+        return """INSERT INTO "users" ("email", "name") VALUES ('?', '?') ON CONFLICT ("email") DO NOTHING"""
@@ -0,0 +1,307 @@
+import asyncio
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.connections import (
+    AsyncConnectionPool,
+    AsyncSQLiteConnection,
+    ConnectionFactory,
+)
+from src.masoniteorm.exceptions import (
+    ConnectionPoolExhausted,
+    DriverNotFound,
+    ModelNotFound,
+)
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import AsyncQueryBuilder
+from src.masoniteorm.relationships import has_many
+from tests.integrations.config.database import DATABASES
+
+
+class Article(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @has_many("id", "user_id")
+    def articles(self):
+        return Article
+
+
+class TestSQLiteAsyncBuilder(unittest.TestCase):
+    maxDiff = None
+
+    def get_builder(self, table="users", model=User):
+        return AsyncQueryBuilder(
+            connection="dev",
+            table=table,
+            model=model,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_resolves_async_connection_class(self):
+        builder = self.get_builder()
+        self.assertEqual(builder.connection_class, AsyncSQLiteConnection)
+        self.assertEqual(
+            builder.where("name", "Joe").to_sql(),
+            """SELECT * FROM "users" WHERE "users"."name" = 'Joe'""",
+        )
+
+    def test_make_async_raises_for_drivers_without_async_connection(self):
+        with self.assertRaises(DriverNotFound):
+            ConnectionFactory().make_async("mssql")
+
+    def test_get_and_first(self):
+        users = self.run_async(self.get_builder().where("name", "bill").get())
+        self.assertIsInstance(users, Collection)
+        self.assertEqual(users.count(), 1)
+        self.assertIsInstance(users.first(), User)
+
+        user = self.run_async(self.get_builder().where("name", "bill").first())
+        self.assertEqual(user.id, 1)
+
+        missing = self.run_async(self.get_builder().where("name", "nobody").first())
+        self.assertIsNone(missing)
+
+    def test_count_and_exists(self):
+        expected = User.where("name", "Joe").count()
+        self.assertEqual(
+            self.run_async(self.get_builder().where("name", "Joe").count()), expected
+        )
+        self.assertTrue(self.run_async(self.get_builder().where("id", 1).exists()))
+        self.assertTrue(
+            self.run_async(self.get_builder().where("id", 99999).doesnt_exist())
+        )
+
+    def test_find_or_fail(self):
+        self.assertEqual(self.run_async(self.get_builder().find(1)).name, "bill")
+        with self.assertRaises(ModelNotFound):
+            self.run_async(self.get_builder().find_or_fail(99999))
+
+    def test_queries_run_concurrently_on_one_loop(self):
+        async def run():
+            return await asyncio.gather(
+                self.get_builder().where("id", 1).first(),
+                self.get_builder().where_in("id", [4, 5]).get(),
+                self.get_builder().where("name", "bill").count(),
+            )
+
+        first, many, count = self.run_async(run())
+        self.assertEqual(first.id, 1)
+        self.assertEqual(many.count(), 2)
+        self.assertEqual(count, 1)
+
+    def test_cursor_streams_models(self):
+        async def run():
+            return [
+                user
+                async for user in self.get_builder().where_in("id", [1, 4, 5]).cursor(2)
+            ]
+
+        users = self.run_async(run())
+        self.assertEqual(sorted(user.id for user in users), [1, 4, 5])
+        self.assertTrue(all(isinstance(user, User) for user in users))
+
+    def test_chunk(self):
+        async def run():
+            return [
+                chunk
+                async for chunk in self.get_builder().where_in("id", [1, 4, 5]).chunk(2)
+            ]
+
+        chunks = self.run_async(run())
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+    def test_eager_loads(self):
+        user = self.run_async(
+            self.get_builder().with_("articles").where("id", 1).first()
+        )
+        self.assertEqual(user.articles.count(), 1)
+
+    def test_create_update_and_delete_in_a_transaction(self):
+        async def run():
+            builder = self.get_builder(model=None)
+            await builder.begin()
+            user = await builder.create(
+                {"name": "async user", "email": "async@example.com"}
+            )
+            self.assertEqual(user["name"], "async user")
+
+            updated = await builder.where("name", "async user").update(
+                {"name": "async user 2"}
+            )
+            self.assertEqual(updated, {"name": "async user 2"})
+
+            found = await builder.where("name", "async user 2").first()
+            self.assertEqual(found["email"], "async@example.com")
+
+            await builder.where("name", "async user 2").delete()
+            self.assertIsNone(await builder.where("name", "async user 2").first())
+            await builder.rollback()
+
+            return await self.get_builder().where("name", "async user 2").first()
+
+        self.assertIsNone(self.run_async(run()))
+
+    def test_model_async_query(self):
+        user = self.run_async(User.async_query().where("id", 1).first())
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.name, "bill")
+
+    def test_paginate(self):
+        total = User.count()
+        paginator = self.run_async(self.get_builder().paginate(2, 2))
+        self.assertEqual(paginator.total, total)
+        self.assertEqual(paginator.count, 2)
+        self.assertTrue(all(isinstance(user, User) for user in paginator.result))
+
+        paginator = self.run_async(self.get_builder().simple_paginate(2, 1))
+        self.assertEqual(paginator.count, 2)
+
+    def test_cursor_paginate(self):
+        first_page = self.run_async(
+            self.get_builder().where_not_null("id").cursor_paginate(2)
+        )
+        self.assertEqual(first_page.count, 2)
+        self.assertIsNotNone(first_page.next_cursor)
+
+        second_page = self.run_async(
+            self.get_builder()
+            .where_not_null("id")
+            .cursor_paginate(2, first_page.next_cursor)
+        )
+        self.assertGreater(second_page.result.first().id, first_page.result.last().id)
+
+    def test_sole_value_and_first_or_create(self):
+        self.assertEqual(
+            self.run_async(self.get_builder().where("id", 1).sole_value("name")),
+            "bill",
+        )
+        user = self.run_async(self.get_builder().first_or_create({"name": "bill"}))
+        self.assertEqual(user.id, 1)
+
+        async def run():
+            builder = self.get_builder()
+            await builder.begin()
+            created = await builder.first_or_create(
+                {"name": "async user"}, {"email": "async@example.com"}
+            )
+            await builder.rollback()
+            return created
+
+        self.assertEqual(self.run_async(run()).email, "async@example.com")
+
+    def test_bulk_create(self):
+        async def run():
+            builder = self.get_builder(model=None)
+            await builder.begin()
+            await builder.bulk_create(
+                [
+                    {"name": "async bulk 1", "email": "async1@example.com"},
+                    {"name": "async bulk 2", "email": "async2@example.com"},
+                ],
+                batch_size=1,
+            )
+            created = await builder.where_like("name", "async bulk%").count()
+            await builder.rollback()
+            return created
+
+        self.assertEqual(self.run_async(run()), 2)
+        self.assertEqual(
+            self.run_async(
+                self.get_builder().where_like("name", "async bulk%").count()
+            ),
+            0,
+        )
+        self.assertTrue(asyncio.iscoroutinefunction(AsyncQueryBuilder.upsert))
+
+    def test_increment_and_decrement(self):
+        async def run():
+            builder = self.get_builder(model=None)
+            await builder.begin()
+            await builder.where("id", 1).update({"active": 10})
+            await builder.where("id", 1).increment("active", 5)
+            incremented = (await builder.where("id", 1).first())["active"]
+            await builder.where("id", 1).decrement("active", 3)
+            decremented = (await builder.where("id", 1).first())["active"]
+            await builder.rollback()
+            return incremented, decremented
+
+        self.assertEqual(self.run_async(run()), (15, 12))
+
+    def test_truncate(self):
+        async def run():
+            builder = self.get_builder("articles", model=None)
+            await builder.begin()
+            await builder.truncate()
+            count = await builder.count()
+            await builder.rollback()
+            return count
+
+        self.assertEqual(self.run_async(run()), 0)
+        self.assertGreater(
+            self.run_async(self.get_builder("articles", model=None).count()), 0
+        )
+
+    def test_new_keeps_connection_details(self):
+        builder = self.get_builder().where("id", 1)
+        for copy in (builder.new(), builder.new_from_builder()):
+            self.assertIsInstance(copy, AsyncQueryBuilder)
+            self.assertEqual(copy._connection_details, DATABASES)
+            self.assertEqual(copy.connection_class, AsyncSQLiteConnection)
+
+
+class TestAsyncConnectionPool(unittest.TestCase):
+    def test_reuses_released_connections(self):
+        created = []
+
+        async def creator():
+            created.append(object())
+            return created[-1]
+
+        async def run():
+            pool = AsyncConnectionPool(creator, max_size=2)
+            first = await pool.acquire()
+            await pool.release(first)
+            second = await pool.acquire()
+            return first, second, pool
+
+        first, second, pool = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual(len(created), 1)
+        self.assertEqual(pool.in_use_count(), 1)
+
+    def test_waiting_acquire_gets_released_connection(self):
+        async def creator():
+            return object()
+
+        async def run():
+            pool = AsyncConnectionPool(creator, max_size=1, timeout=5)
+            first = await pool.acquire()
+            waiter = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            await pool.release(first)
+            return first, await waiter
+
+        first, second = asyncio.run(run())
+        self.assertIs(first, second)
+
+    def test_acquire_times_out_when_exhausted(self):
+        async def creator():
+            return object()
+
+        async def run():
+            pool = AsyncConnectionPool(creator, max_size=1, timeout=0.01)
+            await pool.acquire()
+            await pool.acquire()
+
+        with self.assertRaises(ConnectionPoolExhausted):
+            asyncio.run(run())
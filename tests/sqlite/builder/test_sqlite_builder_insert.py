@@ -37,3 +37,115 @@ class BaseTestQueryRelationships(unittest.TestCase):
         )
 
         self.assertIsInstance(result["id"], int)
+
+    def test_bulk_create_splits_rows_into_batches(self):
+        builder = self.get_builder()
+        rows = [
+            {"name": f"bulk {index}", "email": f"bulk{index}@example.com"}
+            for index in range(1200)
+        ]
+
+        statements = []
+        connection = builder.new_connection()
+        query = connection.query
+
+        def record(sql, bindings=(), results="*"):
+            statements.append(len(bindings))
+            return query(sql, bindings, results)
+
+        connection.query = record
+        try:
+            result = builder.bulk_create(rows)
+            self.assertEqual(len(result), 1200)
+            # 999 bindings / 2 columns
+            self.assertEqual(statements, [998, 998, 404])
+            self.assertEqual(
+                self.get_builder().where_like("email", "bulk%@example.com").count(),
+                1200,
+            )
+        finally:
+            self.get_builder().where_like("email", "bulk%@example.com").delete()
+
+    def test_bulk_create_batch_size_and_returning(self):
+        builder = self.get_builder()
+        try:
+            result = builder.bulk_create(
+                [
+                    {"name": "returning 1", "email": "returning1@example.com"},
+                    {"email": "returning2@example.com", "name": "returning 2"},
+                    {"name": "returning 3", "email": "returning3@example.com"},
+                ],
+                batch_size=2,
+                returning=True,
+            )
+
+            self.assertEqual(
+                [row["name"] for row in result],
+                ["returning 1", "returning 2", "returning 3"],
+            )
+            self.assertIn("created_at", result[0])
+        finally:
+            self.get_builder().where_like("email", "returning%@example.com").delete()
+
+    def test_bulk_create_rolls_back_every_batch_on_failure(self):
+        rows = [{"name": "rollback", "email": "rollback@example.com"}] * 3
+        # The driver can not bind the value so the second batch fails
+        rows.append({"name": "rollback", "email": object()})
+
+        with self.assertRaises(Exception):
+            self.get_builder().bulk_create(rows, batch_size=2)
+
+        self.assertEqual(self.get_builder().where("name", "rollback").count(), 0)
+
+    def test_upsert_inserts_and_updates_conflicting_rows(self):
+        colors = ["upsert red", "upsert green", "upsert blue"]
+        try:
+            self.get_builder("shapes1").upsert(
+                [
+                    {"background_color": "upsert red", "foreground_color": "white"},
+                    {"background_color": "upsert green", "foreground_color": "white"},
+                ],
+                unique_by=["background_color"],
+            )
+            self.get_builder("shapes1").upsert(
+                [
+                    {"background_color": "upsert green", "foreground_color": "black"},
+                    {"background_color": "upsert blue", "foreground_color": "black"},
+                    {"background_color": "upsert red", "foreground_color": "black"},
+                ],
+                unique_by=["background_color"],
+                batch_size=2,
+            )
+
+            shapes = (
+                self.get_builder("shapes1")
+                .where_in("background_color", colors)
+                .order_by("background_color")
+                .get()
+            )
+            self.assertEqual(
+                [
+                    (shape["background_color"], shape["foreground_color"])
+                    for shape in shapes
+                ],
+                [
+                    ("upsert blue", "black"),
+                    ("upsert green", "black"),
+                    ("upsert red", "black"),
+                ],
+            )
+
+            # An empty update list only inserts the rows that do not exist yet
+            self.get_builder("shapes1").upsert(
+                [{"background_color": "upsert red", "foreground_color": "pink"}],
+                unique_by="background_color",
+                update=[],
+            )
+            self.assertEqual(
+                self.get_builder("shapes1")
+                .where("background_color", "upsert red")
+                .first()["foreground_color"],
+                "black",
+            )
+        finally:
+            self.get_builder("shapes1").where_in("background_color", colors).delete()
@@ -7,6 +7,7 @@ from src.masoniteorm.models import Model
 from src.masoniteorm.query import QueryBuilder
 from src.masoniteorm.query.grammars import SQLiteGrammar
 from src.masoniteorm.relationships import belongs_to
+from src.masoniteorm.exceptions import InvalidArgument
 from tests.utils import MockConnectionFactory
 
 
@@ -64,3 +65,45 @@ class BaseTestQueryRelationships(unittest.TestCase):
             self.assertIsInstance(user, User)
 
         self.assertIsInstance(paginator.to_json(), str)
+
+    def test_cursor_pagination(self):
+        def builder():
+            return self.get_builder().where_in("id", [1, 4, 5]).order_by("name")
+
+        paginator = builder().cursor_paginate(2)
+
+        self.assertEqual([user.id for user in paginator], [4, 5])
+        self.assertEqual(paginator.count, 2)
+        self.assertTrue(paginator.serialize()["data"])
+        self.assertTrue(paginator.serialize()["meta"]["next_cursor"])
+        self.assertEqual(paginator.previous_cursor, None)
+        self.assertIsInstance(paginator.to_json(), str)
+        for user in paginator:
+            self.assertIsInstance(user, User)
+
+        paginator = builder().cursor_paginate(2, paginator.next_cursor)
+
+        self.assertEqual([user.id for user in paginator], [1])
+        self.assertFalse(paginator.has_more_pages())
+        self.assertTrue(paginator.previous_cursor)
+
+        paginator = builder().cursor_paginate(2, paginator.previous_cursor)
+
+        self.assertEqual([user.id for user in paginator], [4, 5])
+        self.assertTrue(paginator.next_cursor)
+        self.assertEqual(paginator.previous_cursor, None)
+
+    def test_cursor_pagination_seeks_on_the_ordered_columns(self):
+        builder = self.get_builder().order_by("name", "desc")
+        builder._where_past_cursor(
+            builder._get_cursor_orders(), {"name": "joe", "id": 2}
+        )
+
+        self.assertEqual(
+            builder.to_sql(),
+            """SELECT * FROM "users" WHERE ( ("users"."name" < 'joe') OR ("users"."name" = 'joe' AND "users"."id" < '2')) ORDER BY "name" DESC""",
+        )
+
+    def test_cursor_pagination_rejects_invalid_cursors(self):
+        with self.assertRaises(InvalidArgument):
+            self.get_builder().cursor_paginate(2, "not a cursor")
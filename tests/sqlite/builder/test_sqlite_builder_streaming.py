@@ -0,0 +1,65 @@
+import types
+import unittest
+
+from src.masoniteorm.collection import Collection
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import QueryBuilder
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from tests.integrations.config.database import DATABASES
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class TestSQLiteStreaming(unittest.TestCase):
+    maxDiff = None
+
+    def get_builder(self, table="users", model=User):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            model=model,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_chunk_keeps_bindings(self):
+        total = self.get_builder().where("name", "Joe").count()
+        chunks = list(self.get_builder().where("name", "Joe").chunk(4))
+
+        self.assertEqual(sum(len(chunk) for chunk in chunks), total)
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        for chunk in chunks:
+            self.assertIsInstance(chunk, Collection)
+            for user in chunk:
+                self.assertEqual(user.name, "Joe")
+
+    def test_chunk_without_model_returns_dictionaries(self):
+        chunks = list(self.get_builder(model=None).where("name", "bill").chunk(10))
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0][0]["email"], "corentin@yopmail.com")
+
+    def test_lazy_yields_models_one_at_a_time(self):
+        total = self.get_builder().where("name", "Joe").count()
+        users = self.get_builder().where("name", "Joe").lazy(5)
+
+        self.assertIsInstance(users, types.GeneratorType)
+        users = list(users)
+        self.assertEqual(len(users), total)
+        self.assertIsInstance(users[0], User)
+
+    def test_cursor_can_be_called_from_the_model(self):
+        names = [user.name for user in User.where("email", "joe@email.com").cursor()]
+
+        self.assertEqual(names, ["joe", "joe"])
+
+    def test_stopping_a_stream_early_closes_the_connection(self):
+        builder = self.get_builder()
+        users = builder.lazy(2)
+        next(users)
+        users.close()
+
+        self.assertFalse(builder.get_connection().open)
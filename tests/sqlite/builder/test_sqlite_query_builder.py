@@ -327,6 +327,14 @@ class BaseTestQueryBuilder:
         )()
         self.assertEqual(builder.to_sql(), sql)
 
+    def test_exists(self):
+        builder = self.get_builder()
+        builder.where("age", 18).exists()
+        sql = getattr(
+            self, inspect.currentframe().f_code.co_name.replace("test_", "")
+        )()
+        self.assertEqual(builder.to_sql(), sql)
+
     def test_order_by_asc(self):
         builder = self.get_builder()
         builder.order_by("email", "asc")
@@ -786,6 +794,12 @@ class SQLiteQueryBuilderTest(BaseTestQueryBuilder, unittest.TestCase):
         """
         return """SELECT COUNT("users"."id") AS id FROM "users\""""
 
+    def exists(self):
+        """
+        builder.where('age', 18).exists()
+        """
+        return """SELECT EXISTS(SELECT 1 FROM "users" WHERE "users"."age" = '18' LIMIT 1) AS m_exists_reserved"""
+
     def order_by_asc(self):
         """
         builder.order_by('email', 'asc')
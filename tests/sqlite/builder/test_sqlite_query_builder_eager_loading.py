@@ -3,6 +3,7 @@ import unittest
 
 from tests.integrations.config.database import DATABASES
 from src.masoniteorm.connections import ConnectionFactory
+from src.masoniteorm.exceptions import InvalidArgument
 from src.masoniteorm.models import Model
 from src.masoniteorm.query import QueryBuilder
 from src.masoniteorm.query.grammars import SQLiteGrammar
@@ -97,3 +98,104 @@ class BaseTestQueryRelationships(unittest.TestCase):
         result = User.with_("articles", "articles.logo").where("id", 1).first()
         self.assertTrue(result.serialize()["articles"])
         self.assertTrue(result.serialize()["articles"][0]["logo"])
+
+    def test_with_registers_related_records_on_each_model(self):
+        users = self.get_builder().with_("articles", "profile").where_in("id", [1, 4])
+        users = {user.id: user for user in users.get()}
+
+        self.assertEqual(users[1].articles.count(), 1)
+        self.assertEqual(users[1].articles.first().title, "associate records")
+        self.assertEqual(users[1].profile.id, 1)
+        self.assertEqual(users[4].articles.count(), 0)
+        self.assertIsNone(users[4].profile)
+
+    def test_index_related_groups_by_raw_attributes(self):
+        articles = Article.hydrate(
+            [{"id": 1, "user_id": 1}, {"id": 2, "user_id": 2}, {"id": 3, "user_id": 1}]
+        )
+
+        index = User.articles.index_related(articles, "user_id")
+
+        self.assertEqual([article.id for article in index[1]], [1, 3])
+        self.assertEqual([article.id for article in index[2]], [2])
+
+
+class TestSQLiteLargeWhereIn(unittest.TestCase):
+    def setUp(self):
+        DATABASES["dev"]["where_in_threshold"] = 2
+
+    def tearDown(self):
+        DATABASES["dev"].pop("where_in_threshold")
+        DATABASES["dev"].pop("where_in_strategy", None)
+
+    def get_builder(self, model=User):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table="users",
+            model=model,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def test_large_where_in_is_split_into_chunks(self):
+        builder = self.get_builder().where("name", "!=", "nobody")
+        queries = builder.where_in("id", [1, 2, 4, 5, 5, 99])._to_qmark_chunks()
+
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(
+            queries[0][0],
+            """SELECT * FROM "users" WHERE "users"."name" != '?' AND "users"."id" IN ('?', '?')""",
+        )
+        self.assertEqual(queries[0][1], ["nobody", 1, 2])
+        self.assertEqual(queries[2][1], ["nobody", 99])
+
+    def test_chunked_where_in_merges_the_results(self):
+        users = self.get_builder(model=None).where_in("id", [1, 2, 4, 5, 99]).get()
+        self.assertEqual(sorted(user["id"] for user in users), [1, 2, 2, 4, 5])
+
+        users = (
+            self.get_builder(model=EagerUser)
+            .without_eager()
+            .where_in("id", [1, 2, 4, 5, 99])
+            .all()
+        )
+        self.assertEqual(sorted(user.id for user in users), [1, 2, 2, 4, 5])
+
+    def test_eager_loads_are_chunked(self):
+        users = self.get_builder().with_("articles").where_in("id", [1, 2, 4, 5]).get()
+        users = {user.id: user for user in users}
+
+        self.assertEqual(users[1].articles.count(), 1)
+        self.assertEqual(users[4].articles.count(), 0)
+
+    def test_queries_that_can_not_be_split_run_as_one_statement(self):
+        builder = self.get_builder().where_in("id", [1, 2, 4]).limit(2)
+        self.assertEqual(len(builder._to_qmark_chunks()), 1)
+
+        builder = self.get_builder().where_in("id", [1, 2, 4]).or_where("id", 5)
+        self.assertEqual(len(builder._to_qmark_chunks()), 1)
+
+        DATABASES["dev"]["where_in_strategy"] = "inline"
+        builder = self.get_builder().where_in("id", [1, 2, 4])
+        self.assertEqual(len(builder._to_qmark_chunks()), 1)
+
+    def test_strategy_is_the_one_of_the_connection_the_query_runs_on(self):
+        ids = list(range(1001))
+        builder = self.get_builder().where_in("id", ids).on("postgres")
+        self.assertEqual(
+            builder.to_qmark(),
+            """SELECT * FROM "users" WHERE "users"."id" = ANY('?')""",
+        )
+
+        builder = self.get_builder().on("postgres").where_in("id", ids).on("dev")
+        self.assertEqual(len(builder._to_qmark_chunks()), 501)
+
+    def test_where_not_in_above_the_binding_limit_raises(self):
+        builder = self.get_builder().where_not_in("id", [1, 2, 4])
+        self.assertEqual(len(builder._to_qmark_chunks()), 1)
+        self.assertEqual(builder._bindings, [1, 2, 4])
+
+        builder = self.get_builder().where_not_in("id", list(range(1000)))
+        with self.assertRaises(InvalidArgument):
+            builder.to_qmark()
+        self.assertIn("NOT IN ('0',", builder.to_sql())
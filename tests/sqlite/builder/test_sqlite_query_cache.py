@@ -0,0 +1,180 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import SQLiteConnection
+from src.masoniteorm.query import (
+    CacheStore,
+    MemoryStore,
+    QueryBuilder,
+    QueryCache,
+)
+from src.masoniteorm.query.grammars import SQLiteGrammar
+from tests.integrations.config.database import DATABASES, DB
+
+
+class DictStore(CacheStore):
+    """A store with the interface of an external key value store like Redis."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def put(self, key, value, ttl=None):
+        self.values[key] = value
+
+    def forget(self, key):
+        self.values.pop(key, None)
+
+    def flush(self):
+        self.values.clear()
+
+
+class TestSQLiteQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.previous_cache = DB.get_query_cache()
+        DB.set_query_cache(QueryCache(MemoryStore(max_size=100)))
+
+    def tearDown(self):
+        DB.set_query_cache(self.previous_cache)
+
+    def get_builder(self, table="users"):
+        return QueryBuilder(
+            grammar=SQLiteGrammar,
+            connection="dev",
+            table=table,
+            connection_details=DATABASES,
+        ).on("dev")
+
+    def no_queries(self):
+        return mock.patch.object(
+            SQLiteConnection, "query", side_effect=AssertionError("Query was run")
+        )
+
+    def test_remembered_results_are_served_from_the_cache(self):
+        users = self.get_builder().where("name", "bill").remember(60).get()
+        first = self.get_builder().where("name", "bill").remember(60).first()
+
+        with self.no_queries():
+            cached = self.get_builder().where("name", "bill").remember(60).get()
+            self.assertEqual(
+                self.get_builder().where("name", "bill").remember(60).first(), first
+            )
+
+        self.assertEqual(cached.count(), users.count())
+        self.assertEqual(first["name"], "bill")
+        self.assertEqual(DB.get_query_cache().stats()["hits"], 2)
+
+    def test_cached_rows_are_copies(self):
+        self.get_builder().where("id", 1).remember(60).first()["name"] = "changed"
+        self.assertEqual(
+            self.get_builder().where("id", 1).remember(60).first()["name"], "bill"
+        )
+
+    def test_writes_invalidate_the_tables_they_touch(self):
+        def query():
+            return self.get_builder().where("name", "bill").remember(60).get()
+
+        def joined():
+            return (
+                self.get_builder()
+                .join("articles", "users.id", "=", "articles.user_id")
+                .where("users.id", 1)
+                .remember(60, key="users-with-articles")
+                .get()
+            )
+
+        query()
+        joined()
+
+        self.get_builder("articles").where("id", -1).delete()
+        with self.no_queries():
+            query()
+
+        self.assertEqual(joined().count(), 1)
+
+        self.get_builder().where("name", "nobody").update({"name": "somebody"})
+        cache = DB.get_query_cache()
+        misses = cache.misses
+        query()
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_expired_results_are_queried_again(self):
+        self.get_builder().where("id", 1).remember(0).first()
+        self.get_builder().where("id", 1).remember(0).first()
+        self.assertEqual(DB.get_query_cache().stats()["hits"], 0)
+
+    def test_external_stores(self):
+        store = DictStore()
+        DB.set_query_cache(QueryCache(store))
+
+        self.get_builder().where("id", 1).remember(60).first()
+        with self.no_queries():
+            self.get_builder().where("id", 1).remember(60).first()
+
+        self.assertEqual(DB.get_query_cache().stats()["hit_rate"], 0.5)
+        self.assertIn("masoniteorm:query:tag:orm.sqlite3.users", store.values)
+
+    def test_rows_read_in_a_transaction_are_not_cached(self):
+        builder = self.get_builder()
+        builder.begin()
+        builder.create({"name": "cache phantom", "email": "phantom@example.com"})
+        self.assertEqual(
+            builder.where("name", "cache phantom").remember(60).get().count(), 1
+        )
+        builder.rollback()
+
+        self.assertEqual(
+            self.get_builder()
+            .where("name", "cache phantom")
+            .remember(60)
+            .get()
+            .count(),
+            0,
+        )
+
+    def test_writes_in_a_transaction_invalidate_again_when_it_ends(self):
+        builder = self.get_builder()
+        builder.begin()
+        builder.where("name", "nobody").update({"name": "somebody"})
+
+        # Another connection caches the rows as they were before the commit
+        self.get_builder().where("name", "bill").remember(60).get()
+        builder.commit()
+
+        cache = DB.get_query_cache()
+        misses = cache.misses
+        self.get_builder().where("name", "bill").remember(60).get()
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_increment_and_decrement_invalidate_the_table(self):
+        def active():
+            return self.get_builder().where("id", 1).remember(60).first()["active"]
+
+        self.get_builder().where("id", 1).update({"active": 10})
+        try:
+            self.assertEqual(active(), 10)
+            self.get_builder().where("id", 1).increment("active", 5)
+            self.assertEqual(active(), 15)
+            self.get_builder().where("id", 1).decrement("active", 3)
+            self.assertEqual(active(), 12)
+        finally:
+            self.get_builder().where("id", 1).update({"active": None})
+
+    def test_writes_to_subquery_tables_invalidate_the_query(self):
+        def query():
+            return (
+                self.get_builder()
+                .where_in("id", self.get_builder("articles").select("user_id"))
+                .remember(60)
+                .get()
+            )
+
+        query()
+        self.get_builder("articles").where("id", -1).delete()
+
+        cache = DB.get_query_cache()
+        misses = cache.misses
+        query()
+        self.assertEqual(cache.misses, misses + 1)
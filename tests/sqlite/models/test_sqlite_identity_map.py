@@ -0,0 +1,116 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.connections import SQLiteConnection
+from src.masoniteorm.models import Model
+from src.masoniteorm.query import IdentityMap
+from src.masoniteorm.relationships import belongs_to
+from src.masoniteorm.scopes import SoftDeletesMixin
+from tests.integrations.config.database import DB
+
+
+class User(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+
+class SoftUser(Model, SoftDeletesMixin):
+    __connection__ = "dev"
+    __table__ = "users"
+    __timestamps__ = False
+
+
+class Article(Model):
+    __connection__ = "dev"
+    __timestamps__ = False
+
+    @belongs_to("user_id", "id")
+    def user(self):
+        return User
+
+
+class TestSQLiteIdentityMap(unittest.TestCase):
+    def no_queries(self):
+        return mock.patch.object(
+            SQLiteConnection, "query", side_effect=AssertionError("Query was run")
+        )
+
+    def test_find_returns_the_loaded_instance_without_a_query(self):
+        with DB.identity_map():
+            user = User.find(1)
+            with self.no_queries():
+                self.assertIs(User.find(1), user)
+                self.assertIs(User.where("id", 1).first(), user)
+
+            self.assertIs(User.where_in("id", [1, 4]).get().where("id", 1)[0], user)
+
+        self.assertIsNone(IdentityMap.current())
+        self.assertIsNot(User.find(1), user)
+
+    def test_queries_that_are_not_primary_key_lookups_still_run(self):
+        with DB.identity_map():
+            user = User.find(1)
+            self.assertIsNone(User.where("id", 1).where("name", "nobody").first())
+            self.assertIs(User.where("name", "bill").first(), user)
+
+    def test_lazy_belongs_to_uses_the_identity_map(self):
+        with DB.identity_map():
+            user = User.find(1)
+            article = Article.find(1)
+            with self.no_queries():
+                self.assertIs(article.user, user)
+
+    def test_writes_invalidate_the_identity_map(self):
+        DB.begin_transaction("dev")
+        try:
+            with DB.identity_map() as identity_map:
+                user = User.find(1)
+                user.update({"name": "billy"})
+                self.assertIs(identity_map.get(User, 1), user)
+
+                User.where("name", "nobody").update({"name": "nobody else"})
+                self.assertIsNone(identity_map.get(User, 1))
+
+                user = User.find(1)
+                self.assertEqual(user.name, "billy")
+                user.delete()
+                self.assertIsNone(identity_map.get(User, 1))
+                self.assertIsNone(User.find(1))
+        finally:
+            DB.rollback("dev")
+
+        self.assertEqual(User.find(1).name, "bill")
+
+    def test_nested_identity_maps_are_separate(self):
+        with DB.identity_map() as outer:
+            user = User.find(1)
+            with DB.identity_map() as inner:
+                self.assertIs(IdentityMap.current(), inner)
+                self.assertIsNot(User.find(1), user)
+
+            self.assertIs(IdentityMap.current(), outer)
+            self.assertIs(User.find(1), user)
+
+    def test_models_with_global_scopes_are_queried(self):
+        with DB.identity_map() as identity_map:
+            identity_map.add(SoftUser.hydrate({"id": 1, "name": "bill"}))
+
+            # The row was soft deleted since the model was loaded
+            with mock.patch.object(SQLiteConnection, "query", return_value={}) as query:
+                self.assertIsNone(SoftUser.find(1))
+
+            self.assertIn('"users"."deleted_at" IS NULL', query.call_args[0][0])
+
+    def test_increment_and_decrement_invalidate_the_identity_map(self):
+        DB.begin_transaction("dev")
+        try:
+            with DB.identity_map() as identity_map:
+                user = User.find(1)
+                User.where("id", 1).increment("active", 5)
+                self.assertIsNone(identity_map.get(User, 1))
+
+                user = User.find(1)
+                user.decrement("active")
+                self.assertIsNone(identity_map.get(User, 1))
+        finally:
+            DB.rollback("dev")
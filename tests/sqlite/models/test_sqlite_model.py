@@ -1,5 +1,6 @@
 import inspect
 import unittest
+from unittest import mock
 
 from tests.integrations.config.database import DATABASES
 from src.masoniteorm.connections import ConnectionFactory
@@ -174,6 +175,16 @@ class BaseTestQueryRelationships(unittest.TestCase):
         count = User.where_not_null("id").not_between("age", 1, 2).get().count()
         self.assertEqual(count, 0)
 
+    def test_exists_does_not_hydrate_models(self):
+        class ModelUser(Model):
+            __connection__ = "dev"
+            __table__ = "users"
+
+        with mock.patch.object(ModelUser, "hydrate") as hydrate:
+            self.assertTrue(ModelUser.where("name", "bill").exists())
+            self.assertTrue(ModelUser.where("name", "nobody").doesnt_exist())
+            hydrate.assert_not_called()
+
     def test_get_columns(self):
         columns = User.get_columns()
         self.assertEqual(
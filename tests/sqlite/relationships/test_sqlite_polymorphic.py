@@ -1,6 +1,7 @@
 import os
 import unittest
 
+from src.masoniteorm.connections import ConnectionResolver
 from src.masoniteorm.models import Model
 from src.masoniteorm.relationships import belongs_to, has_many, morph_to
 from tests.integrations.config.database import DB
@@ -45,6 +46,12 @@ DB.morph_map({"user": User, "article": Articles})
 class TestRelationships(unittest.TestCase):
     maxDiff = None
 
+    def test_morph_map_resolves_keys_and_models_both_ways(self):
+        self.assertIs(ConnectionResolver.get_morph_model("user"), User)
+        self.assertEqual(ConnectionResolver.get_morph_key(Articles), "article")
+        self.assertIsNone(ConnectionResolver.get_morph_model("logo"))
+        self.assertIsNone(ConnectionResolver.get_morph_key(Logo))
+
     def test_can_get_polymorphic_relation(self):
         likes = Like.get()
         for like in likes:
@@ -54,3 +61,8 @@ class TestRelationships(unittest.TestCase):
         likes = Like.with_("record").get()
         for like in likes:
             self.assertIsInstance(like.record, (Articles, User))
+            self.assertEqual(like.record.id, int(like.record_id))
+            self.assertIs(
+                like.record.__class__,
+                {"user": User, "article": Articles}[like.record_type],
+            )
@@ -162,3 +162,9 @@ class TestRelationships(unittest.TestCase):
         store = Store.hydrate({"id": 2, "name": "Walmart"})
         store = Store.with_("products").first()
         self.assertEqual(store.products.count(), 3)
+
+    def test_belongs_to_many_eager_loads_the_products_of_each_store(self):
+        stores = Store.with_("products").get()
+        for store in stores:
+            lazy = Store.hydrate({"id": store.id}).products
+            self.assertEqual(store.products.pluck("id"), lazy.pluck("id"))
@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+
+from src.masoniteorm.exceptions import InvalidArgument
+from src.masoniteorm.migrations import Migration
+from tests.integrations.config.database import DB
+
+
+class CreateMigrationProbesTable(Migration):
+    def up(self):
+        with self.schema.create("migration_probes") as table:
+            table.increments("id")
+
+    def down(self):
+        self.schema.drop_table_if_exists("migration_probes")
+
+
+class CreateMigrationFailuresTable(Migration):
+    def up(self):
+        with self.schema.create("migration_failures") as table:
+            table.increments("id")
+
+        raise ValueError("The migration failed")
+
+    def down(self):
+        self.schema.drop_table_if_exists("migration_failures")
+
+
+MIGRATIONS = {
+    "2099_01_01_000000_create_migration_probes_table": CreateMigrationProbesTable,
+    "2099_01_01_000001_create_migration_failures_table": CreateMigrationFailuresTable,
+}
+
+
+class TestSQLiteMigrations(unittest.TestCase):
+    def setUp(self):
+        self.runner = self.get_runner()
+        self.runner.create_table_if_not_exists()
+
+    def tearDown(self):
+        self.runner.delete_migrations(list(MIGRATIONS))
+        self.runner.schema.drop_table_if_exists("migration_probes")
+        self.runner.schema.drop_table_if_exists("migration_failures")
+
+    def get_runner(self, transaction="migration"):
+        runner = Migration(connection="dev", transaction=transaction)
+        runner.get_migration_files = lambda: list(MIGRATIONS)
+        runner.locate = MIGRATIONS.get
+        return runner
+
+    def test_status_is_read_with_a_single_query(self):
+        with mock.patch.object(
+            self.runner, "get_migration_files", return_value=list(MIGRATIONS)[:1]
+        ):
+            self.runner.migrate()
+
+            with DB.collect_queries() as queries:
+                ran, unran = self.runner.get_migration_status()
+
+        self.assertEqual(queries.count, 1)
+        self.assertEqual(ran[0]["migration_file"], list(MIGRATIONS)[0])
+        self.assertEqual(unran, [])
+
+    def test_failed_migration_is_rolled_back_alone(self):
+        with self.assertRaises(ValueError):
+            self.runner.migrate()
+
+        self.assertTrue(self.runner.schema.has_table("migration_probes"))
+        self.assertFalse(self.runner.schema.has_table("migration_failures"))
+        self.assertEqual(
+            [
+                migration["migration_file"]
+                for migration in self.runner.get_ran_migrations()
+            ],
+            list(MIGRATIONS)[:1],
+        )
+
+    def test_failed_batch_is_rolled_back(self):
+        runner = self.get_runner(transaction="batch")
+        with self.assertRaises(ValueError):
+            runner.migrate()
+
+        self.assertFalse(runner.schema.has_table("migration_probes"))
+        self.assertEqual(runner.get_unran_migrations(), list(MIGRATIONS))
+
+    def test_migrations_without_transactions_are_recorded_up_to_the_failure(self):
+        runner = self.get_runner(transaction="none")
+        with DB.collect_queries() as queries, self.assertRaises(ValueError):
+            runner.migrate()
+
+        self.assertTrue(runner.schema.has_table("migration_failures"))
+        self.assertEqual(runner.get_unran_migrations(), list(MIGRATIONS)[1:])
+        inserts = [event for event in queries.queries if event.sql.startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+
+    def test_migrations_without_transactions_are_recorded_as_they_run(self):
+        runner = self.get_runner(transaction="none")
+        recorded = []
+
+        def up():
+            recorded.extend(runner.get_ran_migrations())
+
+        with mock.patch.object(CreateMigrationFailuresTable, "up", side_effect=up):
+            runner.migrate()
+
+        self.assertEqual(
+            [migration["migration_file"] for migration in recorded],
+            list(MIGRATIONS)[:1],
+        )
+        self.assertEqual(runner.get_unran_migrations(), [])
+
+    def test_unknown_transaction_mode_raises(self):
+        with self.assertRaises(InvalidArgument):
+            Migration(connection="dev", transaction="batches")
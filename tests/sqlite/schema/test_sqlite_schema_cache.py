@@ -0,0 +1,110 @@
+import unittest
+
+from src.masoniteorm.models import Model
+from src.masoniteorm.schema import Schema, SchemaCache
+from tests.integrations.config.database import DB
+
+
+class User(Model):
+    __connection__ = "dev"
+
+
+class TestSQLiteSchemaCache(unittest.TestCase):
+    def setUp(self):
+        SchemaCache.flush()
+        self.schema = Schema(
+            connection="dev", connection_details=DB.get_connection_details()
+        )
+
+    def tearDown(self):
+        self.schema.drop_table_if_exists("schema_cache_probes")
+        self.schema.drop_table_if_exists("schema_cache_renamed")
+
+    def test_introspection_is_cached(self):
+        columns = self.schema.get_columns("users")
+        with DB.collect_queries() as queries:
+            self.assertEqual(self.schema.get_columns("users"), columns)
+            self.assertIsNot(self.schema.get_columns("users"), columns)
+            self.assertTrue(self.schema.has_table("users"))
+            self.assertTrue(self.schema.has_table("users"))
+            self.assertEqual(User.get_columns(), list(columns))
+
+        self.assertEqual(queries.count, 1)
+
+    def test_schema_changes_forget_the_cached_tables(self):
+        self.assertFalse(self.schema.has_table("schema_cache_probes"))
+
+        with self.schema.create("schema_cache_probes") as table:
+            table.increments("id")
+        self.assertTrue(self.schema.has_table("schema_cache_probes"))
+        self.assertEqual(list(self.schema.get_columns("schema_cache_probes")), ["id"])
+
+        with self.schema.table("schema_cache_probes") as table:
+            table.string("name").nullable()
+        self.assertEqual(
+            list(self.schema.get_columns("schema_cache_probes")), ["id", "name"]
+        )
+
+        self.schema.rename("schema_cache_probes", "schema_cache_renamed")
+        self.assertFalse(self.schema.has_table("schema_cache_probes"))
+        self.assertTrue(self.schema.has_table("schema_cache_renamed"))
+
+        self.schema.drop_table("schema_cache_renamed")
+        self.assertFalse(self.schema.has_table("schema_cache_renamed"))
+
+    def test_rollback_forgets_the_cached_tables(self):
+        DB.begin_transaction("dev")
+        try:
+            with self.schema.create("schema_cache_probes") as table:
+                table.increments("id")
+            self.assertTrue(self.schema.has_table("schema_cache_probes"))
+        finally:
+            DB.rollback("dev")
+
+        self.assertFalse(self.schema.has_table("schema_cache_probes"))
+
+    def test_alter_blueprints_use_the_cached_table(self):
+        with self.schema.create("schema_cache_probes") as table:
+            table.increments("id")
+        self.schema.get_columns("schema_cache_probes")
+
+        with DB.collect_queries() as queries:
+            with self.schema.table("schema_cache_probes") as table:
+                table.string("name").nullable()
+
+        self.assertFalse(any("PRAGMA" in query.sql for query in queries.queries))
+        self.assertEqual(
+            list(self.schema.get_columns("schema_cache_probes")), ["id", "name"]
+        )
+
+    def get_schema(self, schema_cache):
+        details = {
+            name: dict(config) if isinstance(config, dict) else config
+            for name, config in DB.get_connection_details().items()
+        }
+        details["dev"]["schema_cache"] = schema_cache
+        return Schema(connection="dev", connection_details=details)
+
+    def test_results_expire_after_the_ttl(self):
+        kept = self.get_schema({"ttl": 60})
+        expired = self.get_schema({"ttl": 0})
+
+        with DB.collect_queries() as queries:
+            kept.has_table("users")
+            kept.has_table("users")
+        self.assertEqual(queries.count, 1)
+
+        with DB.collect_queries() as queries:
+            expired.has_table("articles")
+            expired.has_table("articles")
+        self.assertEqual(queries.count, 2)
+
+    def test_cache_can_be_turned_off(self):
+        schema = self.get_schema(False)
+
+        with DB.collect_queries() as queries:
+            schema.has_table("users")
+            schema.has_table("users")
+
+        self.assertEqual(queries.count, 2)
+        self.assertEqual(SchemaCache._entries, {})